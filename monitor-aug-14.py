@@ -4,8 +4,12 @@ Actuator Health Check Monitor
 Monitors multiple DNS endpoints for health status and reports UP/DOWN status
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
 import concurrent.futures
+import heapq
+import operator
 import logging
 import time
 import json
@@ -15,12 +19,76 @@ from typing import List, Dict, Tuple
 from urllib.parse import urlparse
 import csv
 import os
+import ssl
+
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Schemes accepted as-is when loading endpoint files
+URL_SCHEMES = (b'http://', b'https://')
+
+
+class SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter that hands one pre-built SSLContext to every pool it creates"""
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super().proxy_manager_for(*args, **kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if verify:
+            # The pinned context already holds the CA bundle; left set, urllib3 would
+            # load it into that shared context again for every new connection
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
 
 class HealthCheckMonitor:
     def __init__(self, config: Dict):
         self.config = config
         self.setup_logging()
+        self.ssl_context = self.create_ssl_context()
+        self.session = self.create_session()
         
+    def create_ssl_context(self) -> ssl.SSLContext:
+        """Build the SSLContext once so the CA bundle is not re-parsed per connection"""
+        if self.config.get('verify_ssl', True):
+            # Same CA bundle requests would verify against, environment overrides included
+            ca_bundle = (os.environ.get('REQUESTS_CA_BUNDLE') or os.environ.get('CURL_CA_BUNDLE')
+                         or requests.certs.where())
+            if os.path.isdir(ca_bundle):
+                ctx = ssl.create_default_context(capath=ca_bundle)
+            else:
+                ctx = ssl.create_default_context(cafile=ca_bundle)
+        else:
+            ctx = ssl._create_unverified_context()
+            ctx.check_hostname = False
+        return ctx
+
+    def create_session(self) -> requests.Session:
+        """Create a shared session with the pinned SSLContext mounted for HTTPS"""
+        session = requests.Session()
+        session.headers.update({'User-Agent': 'HealthCheckMonitor/1.0'})
+        session.verify = self.config.get('verify_ssl', True)
+        pool_size = self.config.get('max_workers', 20)
+        session.mount('https://', SSLContextAdapter(self.ssl_context,
+                                                    pool_connections=pool_size,
+                                                    pool_maxsize=pool_size))
+        return session
+
     def setup_logging(self):
         """Setup logging configuration"""
         log_level = getattr(logging, self.config.get('log_level', 'INFO').upper())
@@ -38,14 +106,18 @@ class HealthCheckMonitor:
         """Load DNS endpoints from text file"""
         endpoints = []
         try:
-            with open(file_path, 'r') as file:
-                for line in file:
-                    endpoint = line.strip()
-                    if endpoint and not endpoint.startswith('#'):  # Skip empty lines and comments
-                        # Ensure endpoint has proper protocol
-                        if not endpoint.startswith(('http://', 'https://')):
-                            endpoint = f"https://{endpoint}"
-                        endpoints.append(endpoint)
+            # Scan raw bytes so skipped lines are never decoded
+            with open(file_path, 'rb') as file:
+                lines = file.read().splitlines()
+
+            for line in lines:
+                endpoint = line.strip()
+                if not endpoint or endpoint[:1] == b'#':  # Skip empty lines and comments
+                    continue
+                # Ensure endpoint has proper protocol
+                if not endpoint.startswith(URL_SCHEMES):
+                    endpoint = b'https://' + endpoint
+                endpoints.append(endpoint.decode('utf-8'))
             
             self.logger.info(f"Loaded {len(endpoints)} endpoints from {file_path}")
             return endpoints
@@ -57,6 +129,22 @@ class HealthCheckMonitor:
             self.logger.error(f"Error loading endpoints: {str(e)}")
             return []
 
+    def evaluate_response(self, endpoint: str, status_code: int, text: str,
+                          response_time: float) -> Tuple[str, str, float, str]:
+        """Turn an HTTP response into an (endpoint, status, response_time, error_message) result"""
+        # Check if response indicates success
+        if status_code == 200:
+            # Check response content for success indicators
+            content = text.lower()
+            success_indicators = self.config.get('success_indicators', ['success', 'up', 'healthy', 'ok'])
+            
+            if any(indicator in content for indicator in success_indicators):
+                return endpoint, "UP", response_time, ""
+            else:
+                return endpoint, "DOWN", response_time, f"Success indicator not found in response"
+        else:
+            return endpoint, "DOWN", response_time, f"HTTP {status_code}"
+
     def check_single_endpoint(self, endpoint: str) -> Tuple[str, str, float, str]:
         """
         Check a single endpoint health status
@@ -66,27 +154,14 @@ class HealthCheckMonitor:
         
         try:
             # Make HTTP request with timeout
-            response = requests.get(
+            response = self.session.get(
                 endpoint,
-                timeout=self.config.get('timeout', 10),
-                headers={'User-Agent': 'HealthCheckMonitor/1.0'},
-                verify=self.config.get('verify_ssl', True)
+                timeout=self.config.get('timeout', 10)
             )
             
             response_time = time.time() - start_time
             
-            # Check if response indicates success
-            if response.status_code == 200:
-                # Check response content for success indicators
-                content = response.text.lower()
-                success_indicators = self.config.get('success_indicators', ['success', 'up', 'healthy', 'ok'])
-                
-                if any(indicator in content for indicator in success_indicators):
-                    return endpoint, "UP", response_time, ""
-                else:
-                    return endpoint, "DOWN", response_time, f"Success indicator not found in response"
-            else:
-                return endpoint, "DOWN", response_time, f"HTTP {response.status_code}"
+            return self.evaluate_response(endpoint, response.status_code, response.text, response_time)
                 
         except requests.exceptions.Timeout:
             response_time = time.time() - start_time
@@ -122,13 +197,67 @@ class HealthCheckMonitor:
         
         return results
 
+    async def check_single_endpoint_async(self, client, endpoint: str) -> Tuple[str, str, float, str]:
+        """Check a single endpoint over a shared httpx client"""
+        start_time = time.time()
+        
+        try:
+            response = await client.get(endpoint)
+            response_time = time.time() - start_time
+            return self.evaluate_response(endpoint, response.status_code, response.text, response_time)
+            
+        except httpx.TimeoutException:
+            response_time = time.time() - start_time
+            return endpoint, "DOWN", response_time, "Timeout"
+        except httpx.ConnectError:
+            response_time = time.time() - start_time
+            return endpoint, "DOWN", response_time, "Connection Error"
+        except Exception as e:
+            response_time = time.time() - start_time
+            return endpoint, "DOWN", response_time, str(e)
+
+    async def check_endpoints_http2_async(self, endpoints: List[str]) -> List[Tuple[str, str, float, str]]:
+        """Fan out over HTTP/2 so endpoints sharing a host multiplex on one connection"""
+        max_workers = self.config.get('max_workers', 20)
+        limits = httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers)
+        # httpx sets the ALPN protocols it can speak (h2 included) on the context it
+        # is given, so it gets a context of its own rather than the HTTP/1.1 adapter's
+        verify = self.create_ssl_context() if self.config.get('verify_ssl', True) else False
+        
+        # At most max_workers probes run at once, so none waits for a pooled connection:
+        # that wait would count towards the timeout and the response time
+        probe_slots = asyncio.Semaphore(max_workers)
+        
+        async def probe(client, endpoint: str) -> Tuple[str, str, float, str]:
+            async with probe_slots:
+                return await self.check_single_endpoint_async(client, endpoint)
+        
+        # Servers that don't offer h2 via ALPN are spoken to over HTTP/1.1, and
+        # redirects are followed as the requests session does
+        async with httpx.AsyncClient(http2=True,
+                                     follow_redirects=True,
+                                     limits=limits,
+                                     timeout=self.config.get('timeout', 10),
+                                     verify=verify,
+                                     headers={'User-Agent': 'HealthCheckMonitor/1.0'}) as client:
+            return await asyncio.gather(
+                *[probe(client, endpoint) for endpoint in endpoints]
+            )
+
+    def check_endpoints_http2(self, endpoints: List[str]) -> List[Tuple[str, str, float, str]]:
+        """Check multiple endpoints over HTTP/2 using httpx"""
+        return list(asyncio.run(self.check_endpoints_http2_async(endpoints)))
+
     def generate_report(self, results: List[Tuple[str, str, float, str]]) -> Dict:
         """Generate summary report from results"""
-        total_endpoints = len(results)
-        up_count = sum(1 for _, status, _, _ in results if status == "UP")
+        # Transpose into per-column sequences so each aggregate only scans the column it needs
+        _, statuses, response_times, _ = zip(*results) if results else ((), (), (), ())
+        
+        total_endpoints = len(statuses)
+        up_count = statuses.count("UP")
         down_count = total_endpoints - up_count
         
-        avg_response_time = sum(response_time for _, _, response_time, _ in results) / total_endpoints if total_endpoints > 0 else 0
+        avg_response_time = sum(response_times) / total_endpoints if total_endpoints > 0 else 0
         
         report = {
             'timestamp': datetime.now().isoformat(),
@@ -180,7 +309,11 @@ class HealthCheckMonitor:
         print("="*60)
         
         # Show DOWN endpoints
-        down_endpoints = [(endpoint, error) for endpoint, status, _, error in report['results'] if status == "DOWN"]
+        endpoint_and_error = operator.itemgetter(0, 3)
+        down_endpoints = []
+        for result in report['results']:
+            if result[1] == "DOWN":
+                down_endpoints.append(endpoint_and_error(result))
         if down_endpoints:
             print(f"\nDOWN ENDPOINTS ({len(down_endpoints)}):")
             print("-" * 60)
@@ -190,7 +323,7 @@ class HealthCheckMonitor:
                     print(f"   Error: {error}")
         
         # Show slowest endpoints
-        slowest = sorted(report['results'], key=lambda x: x[2], reverse=True)[:5]
+        slowest = heapq.nlargest(5, report['results'], key=operator.itemgetter(2))
         if slowest:
             print(f"\nSLOWEST ENDPOINTS (Top 5):")
             print("-" * 60)
@@ -210,7 +343,10 @@ class HealthCheckMonitor:
         
         # Check endpoints
         self.logger.info(f"Checking {len(endpoints)} endpoints...")
-        results = self.check_endpoints_concurrent(endpoints)
+        if self.config.get('http2', True) and HTTP2_AVAILABLE:
+            results = self.check_endpoints_http2(endpoints)
+        else:
+            results = self.check_endpoints_concurrent(endpoints)
         
         # Generate report
         report = self.generate_report(results)
@@ -237,6 +373,7 @@ def load_config(config_file: str = None) -> Dict:
         'max_workers': 20,
         'success_indicators': ['success', 'up', 'healthy', 'ok', '"status":"UP"'],
         'verify_ssl': True,
+        'http2': True,
         'log_level': 'INFO',
         'log_file': 'health_monitor.log',
         'save_csv': True,
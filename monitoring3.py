@@ -2,21 +2,102 @@
 
 import json
 import subprocess
+import concurrent.futures
 import datetime
+import functools
+import heapq
+import itertools
+import operator
+import threading
 import csv
 import logging
 import sys
 import os
+import queue
 import time
 import yaml
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterable, Iterator, NamedTuple, Optional, Tuple
 import argparse
+import bisect
+import asyncio
+import atexit
 from pathlib import Path
 import re
 import tempfile
+from collections import Counter, defaultdict
 import requests  # for webhook/Slack integration
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tabulate import tabulate
 
+try:
+    import orjson  # faster JSON for large pod/event lists
+except ImportError:
+    orjson = None
+
+try:
+    import ciso8601  # C parser for RFC 3339 timestamps
+except ImportError:
+    ciso8601 = None
+
+try:
+    import httpx  # concurrent webhook fan-out on one event loop
+except ImportError:
+    httpx = None  # fall back to the webhook thread pool
+
+try:
+    from kubernetes import client as k8s_client, config as k8s_config, watch as k8s_watch
+    from kubernetes.client.rest import ApiException
+except ImportError:
+    k8s_client = None  # fall back to the kubectl CLI
+
+def max_restart_count(pod: Dict[str, Any]) -> int:
+    """Highest restart count across a pod's containers"""
+    return max((c.get("restartCount", 0) for c in pod["status"].get("containerStatuses", [])), default=0)
+
+def make_severity_fn(health_critical: float = 50, health_warning: float = 80,
+                     availability_critical: float = 50, availability_warning: float = 80):
+    """Build the service impact severity function with its thresholds bound in.
+    
+    The score works in half steps so it stays an integer: health and availability
+    each bump the restart-based level by a full step below their critical threshold
+    and a half step below their warning threshold, capped at critical. The log
+    severity is a floor.
+    """
+    levels = SEVERITY_LEVELS
+    level_index = SEVERITY_LEVEL_INDEX
+    restart_thresholds = RESTART_SEVERITY_THRESHOLDS
+    bisect_left = bisect.bisect_left
+    
+    def severity(restart_count: int, service_health: float, availability_pct: float, log_severity: str) -> str:
+        score = 2 * bisect_left(restart_thresholds, restart_count)
+        if service_health < health_critical:
+            score += 2
+        elif service_health < health_warning:
+            score += 1
+        if availability_pct < availability_critical:
+            score += 2
+        elif availability_pct < availability_warning:
+            score += 1
+        return levels[max(min(score, 6) // 2, level_index[log_severity])]
+    
+    return severity
+
+def alert_display_key(alert: Dict[str, Any]) -> Tuple[int, int, int]:
+    """Sort key ranking alerts the way the alerts table shows them, critical first"""
+    return (-SEVERITY_LEVEL_INDEX[alert['severity']], -alert['service_health_score'], -alert['restart_count'])
+
+@functools.lru_cache(maxsize=16)
+def make_truncator(max_length: int):
+    """Build a function that cuts text to max_length, marking cuts with '...'"""
+    cutoff = max_length - 3
+    return lambda text: text if len(text) <= max_length else text[:cutoff] + "..."
+
+def top_recommendation(alert: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """The alert's highest-priority recommendation, or None when it has none"""
+    recommendations = alert['recommendations']
+    return recommendations[0] if recommendations else None
+
 def get_output_directory():
     """Get appropriate output directory for CI/local environments"""
     if os.environ.get('CI'):
@@ -43,109 +124,281 @@ logger.info(f"Output directory: {OUTPUT_DIR}")
 if os.environ.get('CI'):
     logger.info("Running in CI environment - artifacts will be saved to monitoring-output/")
 
+def loads_json(data):
+    """Parse JSON bytes or str, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_json_file(path: str, data: Any):
+    """Serialize data in one go and atomically replace path with it"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    # Readers (e.g. scrapers polling the stats file in watch mode) only ever see a
+    # complete file: the payload is synced to a temp file before it is renamed over path
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+@functools.lru_cache(maxsize=4096)
+def parse_k8s_timestamp(timestamp: str) -> datetime.datetime:
+    """Parse a Kubernetes RFC 3339 timestamp into a UTC-aware datetime"""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(timestamp)
+    if len(timestamp) == 20 and timestamp[-1] == 'Z':
+        # Common "YYYY-MM-DDTHH:MM:SSZ" form; slicing beats fromisoformat
+        return datetime.datetime(
+            int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+            int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]),
+            tzinfo=datetime.timezone.utc
+        )
+    return datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+def parse_duration_seconds(duration: str) -> int:
+    """Convert a kubectl-style duration such as '5m' or '1h30m' to seconds; a bare number is seconds"""
+    duration = str(duration).strip()
+    if duration.isdigit():
+        return int(duration)
+    units = {'h': 3600, 'm': 60, 's': 1}
+    return sum(int(value) * units[unit] for value, unit in re.findall(r'(\d+)([hms])', duration))
+
+# Log pattern severity -> score, and the overall log severity for the highest score seen
+SEVERITY_SCORES = {'low': 1, 'medium': 2, 'high': 3}
+SEVERITY_BY_SCORE = ('low', 'low', 'medium', 'high')
+
+# Alert severity ladder, lowest first
+SEVERITY_LEVELS = ('low', 'medium', 'high', 'critical')
+SEVERITY_LEVEL_INDEX = {level: i for i, level in enumerate(SEVERITY_LEVELS)}
+# A pod needs more restarts than each of these to reach the next level
+RESTART_SEVERITY_THRESHOLDS = (5, 20, 50)
+
+# Cluster-wide statistics that are the sum of a per-namespace counter
+NAMESPACE_STAT_TOTALS = (
+    ("total_pods_evaluated", "pods_count"),
+    ("total_containers_evaluated", "containers_count"),
+    ("services_healthy", "services_healthy"),
+    ("services_degraded", "services_degraded"),
+    ("services_critical", "services_critical"),
+    ("pods_with_restarts", "pods_with_restarts"),
+    ("pods_above_threshold", "pods_above_threshold"),
+)
+
+# Upper bound on the size of one batched webhook message
+WEBHOOK_BATCH_BYTES = 64 * 1024
+# Separates alerts inside one batched webhook message
+WEBHOOK_ALERT_SEPARATOR = "\n\n---\n\n"
+# (connect, read) timeout for webhook posts; failures are retried by the session adapter
+WEBHOOK_TIMEOUT = (1, 5)
+# Most alerts kept while watching pods; the oldest are dropped first
+WATCH_MAX_ALERTS = 1000
+
+# Service name prefix of a pod name (service-name-deployment-hash-pod -> service-name)
+SERVICE_NAME_RE = re.compile(r'^([^-]+-[^-]+)')
+
+@functools.lru_cache(maxsize=8192)
+def extract_service_name(pod_name: str) -> str:
+    """Extract service name from pod name"""
+    # Common patterns: service-name-deployment-hash-pod, service-name-hash
+    match = SERVICE_NAME_RE.match(pod_name)
+    if match:
+        return match.group(1)
+    return pod_name.split('-')[0]
+
+# Markers that appear on any line the error patterns below can match; lines
+# without one are dropped before the full pattern scan
+SEVERITY_LINE_RE = re.compile(
+    r'err|warn|fatal|panic|fail|killed|backoff|refused|denied|forbidden|unauthorized|'
+    r'timeout|memory|connection|exit code|manifest unknown|already in use',
+    re.IGNORECASE
+)
+
+# Service-specific error patterns and solutions, in reporting order
+SERVICE_ERROR_PATTERNS = {
+    r'OOMKilled|out of memory|memory limit exceeded': {
+        'category': 'MEMORY',
+        'severity': 'high',
+        'suggestion': 'Increase memory limits in deployment/statefulset',
+        'action': 'kubectl patch deployment {deployment} -n {namespace} -p \'{{"spec":{{"template":{{"spec":{{"containers":[{{"name":"{container}","resources":{{"limits":{{"memory":"1Gi"}}}}}}]}}}}}}}}\''
+    },
+    r'CrashLoopBackOff|Error: failed to start container|exit code 1': {
+        'category': 'SERVICE_CRASH',
+        'severity': 'high',
+        'suggestion': 'Service startup failing - check configuration and dependencies',
+        'action': 'kubectl logs {pod} -n {namespace} --previous && kubectl describe pod {pod} -n {namespace}'
+    },
+    r'ImagePullBackOff|ErrImagePull|pull access denied|manifest unknown': {
+        'category': 'IMAGE_UNAVAILABLE',
+        'severity': 'high',
+        'suggestion': 'Service image cannot be pulled - verify image exists and registry access',
+        'action': 'kubectl describe pod {pod} -n {namespace} | grep -A 10 Events'
+    },
+    r'connection refused|dial tcp.*refused|network.*timeout': {
+        'category': 'SERVICE_CONNECTIVITY',
+        'severity': 'medium',
+        'suggestion': 'Service connectivity issues - check ports and internal networking',
+        'action': 'kubectl get svc -n {namespace} && kubectl get endpoints -n {namespace}'
+    },
+    r'liveness probe failed|readiness probe failed|health check failed': {
+        'category': 'HEALTH_CHECK',
+        'severity': 'medium',
+        'suggestion': 'Service health checks failing - review probe configuration',
+        'action': 'kubectl get pod {pod} -n {namespace} -o yaml | grep -A 15 "livenessProbe\\|readinessProbe"'
+    },
+    r'database.*connection|db.*timeout|sql.*error|redis.*connection': {
+        'category': 'DATABASE_CONNECTION',
+        'severity': 'high',
+        'suggestion': 'Database connectivity issues - check service dependencies',
+        'action': 'kubectl get pods -n {namespace} -l app=database && kubectl logs -l app=database -n {namespace}'
+    },
+    r'permission denied|forbidden|unauthorized|access denied': {
+        'category': 'SERVICE_PERMISSIONS',
+        'severity': 'medium',
+        'suggestion': 'Service permission issues - check RBAC and service accounts',
+        'action': 'kubectl describe serviceaccount -n {namespace} && kubectl get rolebindings -n {namespace}'
+    },
+    r'port.*already in use|address already in use|bind.*failed': {
+        'category': 'PORT_CONFLICT',
+        'severity': 'medium',
+        'suggestion': 'Port conflicts in service configuration',
+        'action': 'kubectl get svc -n {namespace} -o wide'
+    }
+}
+
+
+class ErrorPattern(NamedTuple):
+    """One service error pattern, flattened for the per-pod analysis loop"""
+    category: str
+    severity: str
+    severity_score: int
+    suggestion: str
+    action: str
+    regex: re.Pattern
+
 class ServiceDiagnosticEngine:
     """Diagnostic engine focused on service health and availability"""
     
-    def __init__(self):
+    def __init__(self, log_since: Optional[str] = "5m", core_v1=None):
+        # Only fetch current logs newer than this (kubectl --since); None fetches the whole tail.
+        # kubectl needs a unit, so a bare number of seconds (e.g. 300 in the config) gets one
+        if log_since is not None and str(log_since).strip().isdigit():
+            log_since = f"{str(log_since).strip()}s"
+        self.log_since = log_since
+        # Kubernetes API client; None means logs are read through kubectl
+        self.core_v1 = core_v1
+        
         # Service-specific error patterns and solutions
-        self.error_patterns = {
-            r'OOMKilled|out of memory|memory limit exceeded': {
-                'category': 'MEMORY',
-                'severity': 'high',
-                'suggestion': 'Increase memory limits in deployment/statefulset',
-                'action': 'kubectl patch deployment {deployment} -n {namespace} -p \'{"spec":{"template":{"spec":{"containers":[{"name":"{container}","resources":{"limits":{"memory":"1Gi"}}}]}}}}\''
-            },
-            r'CrashLoopBackOff|Error: failed to start container|exit code 1': {
-                'category': 'SERVICE_CRASH',
-                'severity': 'high',
-                'suggestion': 'Service startup failing - check configuration and dependencies',
-                'action': 'kubectl logs {pod} -n {namespace} --previous && kubectl describe pod {pod} -n {namespace}'
-            },
-            r'ImagePullBackOff|ErrImagePull|pull access denied|manifest unknown': {
-                'category': 'IMAGE_UNAVAILABLE',
-                'severity': 'high',
-                'suggestion': 'Service image cannot be pulled - verify image exists and registry access',
-                'action': 'kubectl describe pod {pod} -n {namespace} | grep -A 10 Events'
-            },
-            r'connection refused|dial tcp.*refused|network.*timeout': {
-                'category': 'SERVICE_CONNECTIVITY',
-                'severity': 'medium',
-                'suggestion': 'Service connectivity issues - check ports and internal networking',
-                'action': 'kubectl get svc -n {namespace} && kubectl get endpoints -n {namespace}'
-            },
-            r'liveness probe failed|readiness probe failed|health check failed': {
-                'category': 'HEALTH_CHECK',
-                'severity': 'medium',
-                'suggestion': 'Service health checks failing - review probe configuration',
-                'action': 'kubectl get pod {pod} -n {namespace} -o yaml | grep -A 15 "livenessProbe\\|readinessProbe"'
-            },
-            r'database.*connection|db.*timeout|sql.*error|redis.*connection': {
-                'category': 'DATABASE_CONNECTION',
-                'severity': 'high',
-                'suggestion': 'Database connectivity issues - check service dependencies',
-                'action': 'kubectl get pods -n {namespace} -l app=database && kubectl logs -l app=database -n {namespace}'
-            },
-            r'permission denied|forbidden|unauthorized|access denied': {
-                'category': 'SERVICE_PERMISSIONS',
-                'severity': 'medium',
-                'suggestion': 'Service permission issues - check RBAC and service accounts',
-                'action': 'kubectl describe serviceaccount -n {namespace} && kubectl get rolebindings -n {namespace}'
-            },
-            r'port.*already in use|address already in use|bind.*failed': {
-                'category': 'PORT_CONFLICT',
-                'severity': 'medium',
-                'suggestion': 'Port conflicts in service configuration',
-                'action': 'kubectl get svc -n {namespace} -o wide'
-            }
-        }
+        self.error_patterns = SERVICE_ERROR_PATTERNS
+        # Flat records in pattern order, each with its own compiled regex; the analysis loop
+        # reads these instead of the nested dicts. Matching runs on lowercased text, so the
+        # patterns are lowercased instead of using IGNORECASE
+        self._patterns = tuple(
+            ErrorPattern(config['category'], config['severity'], SEVERITY_SCORES[config['severity']],
+                         config['suggestion'], config['action'], re.compile(pattern.lower()))
+            for pattern, config in self.error_patterns.items()
+        )
 
-    def analyze_service_logs(self, namespace: str, pod_name: str, lines: int = 50) -> Dict[str, Any]:
+    def analyze_service_logs(self, namespace: str, pod_name: str, lines: int = 50,
+                             has_restarts: bool = True) -> Dict[str, Any]:
         """Analyze service logs for service-specific issues"""
+        return self.analyze_service_logs_read(namespace, pod_name, lines, has_restarts)[0]
+
+    def analyze_service_logs_read(self, namespace: str, pod_name: str, lines: int = 50,
+                                  has_restarts: bool = True) -> Tuple[Dict[str, Any], bool]:
+        """analyze_service_logs, plus whether any log lines were actually read and analyzed"""
         analysis = {
             'service_issues': [],
             'recommendations': [],
             'severity': 'low',
             'service_health_score': 100
         }
+        lines_read = 0
+        
+        def counted(log_lines: Iterable[str]) -> Iterator[str]:
+            nonlocal lines_read
+            for line in log_lines:
+                lines_read += 1
+                yield line
         
         try:
-            # Get current and previous logs
-            current_logs = self._get_logs(namespace, pod_name, lines, previous=False)
-            previous_logs = self._get_logs(namespace, pod_name, lines, previous=True)
-            
-            all_logs = f"{previous_logs}\n{current_logs}"
+            # Stream current logs, plus the previous container's logs only if it ever restarted,
+            # classifying lines as they arrive instead of buffering whole logs
+            log_streams = []
+            if has_restarts:
+                log_streams.append(self._iter_logs(namespace, pod_name, lines, previous=True))
+            log_streams.append(self._iter_logs(namespace, pod_name, lines, previous=False))
             
-            if all_logs and all_logs != "Could not retrieve logs":
-                analysis = self._analyze_service_log_content(all_logs, namespace, pod_name)
+            analysis = self._analyze_service_log_content(counted(itertools.chain(*log_streams)),
+                                                         namespace, pod_name)
                 
         except Exception as e:
             logger.error(f"Error analyzing service logs for {namespace}/{pod_name}: {e}")
+            return analysis, False
             
-        return analysis
+        return analysis, lines_read > 0
 
-    def _get_logs(self, namespace: str, pod_name: str, lines: int, previous: bool = False) -> str:
-        """Get service logs"""
+    def _iter_logs(self, namespace: str, pod_name: str, lines: int, previous: bool = False) -> Iterator[str]:
+        """Yield service log lines as they are read; yields nothing if logs can't be retrieved"""
+        if self.core_v1 is not None:
+            yield from self._iter_logs_from_api(namespace, pod_name, lines, previous)
+            return
+        
+        command = ["kubectl", "logs", pod_name, "-n", namespace, "--tail", str(lines)]
+        if previous:
+            command.append("--previous")
+        elif self.log_since:
+            # The previous container may have died long ago, so --since only bounds current logs
+            command += ["--since", self.log_since]
+        
         try:
-            command = ["kubectl", "logs", pod_name, "-n", namespace, "--tail", str(lines)]
-            if previous:
-                command.append("--previous")
-                
-            result = subprocess.run(command, capture_output=True, text=True, timeout=15)
-            
-            if result.returncode == 0 and result.stdout:
-                return result.stdout
-            elif previous and "previous terminated container" in result.stderr:
-                return ""
-            else:
-                return "Could not retrieve logs"
-                
-        except subprocess.TimeoutExpired:
-            return "Log retrieval timed out"
+            proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    text=True, errors='replace', bufsize=-1)
+        except OSError as e:
+            logger.debug(f"Could not run kubectl logs for {namespace}/{pod_name}: {e}")
+            return
+        
+        # Kill kubectl if it is still streaming after 15s
+        timer = threading.Timer(15, proc.kill)
+        timer.start()
+        try:
+            yield from proc.stdout
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+
+    def _iter_logs_from_api(self, namespace: str, pod_name: str, lines: int, previous: bool = False) -> Iterator[str]:
+        """Yield service log lines streamed from the Kubernetes API"""
+        kwargs = {'tail_lines': lines, 'previous': previous}
+        if not previous and self.log_since:
+            kwargs['since_seconds'] = parse_duration_seconds(self.log_since)
+        try:
+            response = self.core_v1.read_namespaced_pod_log(
+                pod_name, namespace, _preload_content=False, _request_timeout=15, **kwargs
+            )
+        except ApiException:
+            # No previous terminated container, pod gone, etc.
+            return
+        except Exception as e:
+            logger.debug(f"Could not read logs for {namespace}/{pod_name}: {e}")
+            return
+        
+        try:
+            for line in response:
+                yield line.decode('utf-8', errors='replace')
         except Exception as e:
-            return f"Error getting logs: {e}"
+            logger.debug(f"Log stream for {namespace}/{pod_name} ended early: {e}")
+        finally:
+            response.release_conn()
 
-    def _analyze_service_log_content(self, logs: str, namespace: str, pod_name: str) -> Dict[str, Any]:
-        """Analyze logs for service-specific patterns"""
+    def _analyze_service_log_content(self, log_lines: Iterable[str], namespace: str, pod_name: str) -> Dict[str, Any]:
+        """Analyze logs, given as an iterable of lines or text chunks, for service-specific patterns"""
         analysis = {
             'service_issues': [],
             'recommendations': [],
@@ -153,27 +406,34 @@ class ServiceDiagnosticEngine:
             'service_health_score': 100
         }
         
-        log_lines = logs.split('\n')
-        error_lines = [line for line in log_lines if any(keyword in line.lower() 
-                      for keyword in ['error', 'exception', 'failed', 'panic', 'fatal', 'crash'])]
-        
         max_severity_score = 0
         health_deduction = 0
         
+        # Count matches per category over the severity-relevant lines. Each category is
+        # scanned separately so overlapping matches (e.g. "redis connection refused")
+        # count towards every category they belong to
+        category_counts = Counter()
+        for logs in log_lines:
+            # Only the surviving lines are lowercased for the case-sensitive pattern regexes
+            relevant_logs = self._filter_severity_lines(logs).lower()
+            if not relevant_logs:
+                continue
+            for rec in self._patterns:
+                category_counts[rec.category] += sum(1 for _ in rec.regex.finditer(relevant_logs))
+        
         # Analyze against service-specific patterns
-        for pattern, config in self.error_patterns.items():
-            matches = re.findall(pattern, logs, re.IGNORECASE)
+        for rec in self._patterns:
+            matches = category_counts.get(rec.category, 0)
             if matches:
-                severity_score = {'low': 1, 'medium': 2, 'high': 3}[config['severity']]
-                max_severity_score = max(max_severity_score, severity_score)
-                health_deduction += len(matches) * 10  # Deduct 10 points per issue
+                max_severity_score = max(max_severity_score, rec.severity_score)
+                health_deduction += matches * 10  # Deduct 10 points per issue
                 
                 issue = {
-                    'category': config['category'],
-                    'matches': len(matches),
-                    'severity': config['severity'],
-                    'suggestion': config['suggestion'],
-                    'action': config['action'].format(
+                    'category': rec.category,
+                    'matches': matches,
+                    'severity': rec.severity,
+                    'suggestion': rec.suggestion,
+                    'action': rec.action.format(
                         pod=pod_name, 
                         namespace=namespace,
                         container=pod_name.split('-')[0],  # Basic container name guess
@@ -186,8 +446,7 @@ class ServiceDiagnosticEngine:
         analysis['service_health_score'] = max(0, 100 - health_deduction)
         
         # Set overall severity
-        severity_map = {0: 'low', 1: 'low', 2: 'medium', 3: 'high'}
-        analysis['severity'] = severity_map[max_severity_score]
+        analysis['severity'] = SEVERITY_BY_SCORE[max_severity_score]
         
         # Generate service-specific recommendations
         analysis['recommendations'] = self._generate_service_recommendations(
@@ -196,17 +455,30 @@ class ServiceDiagnosticEngine:
         
         return analysis
 
+    def _filter_severity_lines(self, logs: str) -> str:
+        """Keep only the log lines containing a severity marker"""
+        lines = []
+        pos = 0
+        while True:
+            match = SEVERITY_LINE_RE.search(logs, pos)
+            if not match:
+                break
+            line_start = logs.rfind('\n', 0, match.start()) + 1
+            line_end = logs.find('\n', match.end())
+            if line_end == -1:
+                line_end = len(logs)
+            lines.append(logs[line_start:line_end])
+            pos = line_end + 1
+        return '\n'.join(lines)
+
     def _generate_service_recommendations(self, issues: List[Dict], namespace: str, pod_name: str) -> List[Dict[str, str]]:
         """Generate service-focused recommendations"""
         recommendations = []
         
         # Group issues by category
-        issue_categories = {}
+        issue_categories = defaultdict(list)
         for issue in issues:
-            category = issue['category']
-            if category not in issue_categories:
-                issue_categories[category] = []
-            issue_categories[category].append(issue)
+            issue_categories[issue['category']].append(issue)
         
         # Generate specific service recommendations
         for category, category_issues in issue_categories.items():
@@ -261,27 +533,19 @@ class ServiceDiagnosticEngine:
             'degraded_services': []
         }
         
-        # Group pods by service (based on common prefixes/labels)
-        services = {}
+        # Group pods by service (based on common prefixes/labels), counting
+        # [total, running, ready] pods per service in a single pass
+        services = defaultdict(lambda: [0, 0, 0])
         for pod in service_pods:
             pod_name = pod['metadata']['name']
             # Extract service name (everything before the first hash/random suffix)
-            service_name = re.match(r'^([^-]+-[^-]+)', pod_name)
-            if service_name:
-                service_name = service_name.group(1)
-            else:
-                service_name = pod_name.split('-')[0]
-            
-            if service_name not in services:
-                services[service_name] = []
-            services[service_name].append(pod)
+            counts = services[extract_service_name(pod_name)]
+            counts[0] += 1
+            counts[1] += pod['status'].get('phase') == 'Running'
+            counts[2] += self._is_pod_ready(pod)
         
         # Analyze each service
-        for service_name, pods in services.items():
-            total_pods = len(pods)
-            running_pods = len([p for p in pods if p['status'].get('phase') == 'Running'])
-            ready_pods = len([p for p in pods if self._is_pod_ready(p)])
-            
+        for service_name, (total_pods, running_pods, ready_pods) in services.items():
             availability_pct = (ready_pods / total_pods) * 100 if total_pods > 0 else 0
             
             service_status = {
@@ -309,11 +573,10 @@ class ServiceDiagnosticEngine:
 
     def _is_pod_ready(self, pod: Dict) -> bool:
         """Check if pod is ready for service"""
-        conditions = pod.get('status', {}).get('conditions', [])
-        for condition in conditions:
-            if condition.get('type') == 'Ready' and condition.get('status') == 'True':
-                return True
-        return False
+        return any(
+            condition.get('type') == 'Ready' and condition.get('status') == 'True'
+            for condition in pod.get('status', {}).get('conditions') or ()
+        )
 
 
 class NamespaceServiceMonitor:
@@ -329,14 +592,57 @@ class NamespaceServiceMonitor:
         self.namespaces = namespaces
         self.restart_threshold = restart_threshold
         self.config = config or {}
+        # Health/availability cut-offs for alert severity, fixed for the monitor's lifetime
+        self._severity_fn = make_severity_fn(**self.config.get('monitoring', {}).get('impact_thresholds', {}))
         self.alerts = []
+        # Indexes over self.alerts for the insights summary and action plan, kept in step by _index_alert()
+        self._alerts_by_service: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._issue_counter: Counter = Counter()
+        self._alerts_by_severity: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         self.previous_state = {}
-        self.diagnostic_engine = ServiceDiagnosticEngine()
+        self.core_v1, self.apps_v1 = self._init_kubernetes_client()
+        self.diagnostic_engine = ServiceDiagnosticEngine(
+            log_since=self.config.get('monitoring', {}).get('log_since', '5m'),
+            core_v1=self.core_v1
+        )
 
         self.output_dir = OUTPUT_DIR
         self.label_selector = label_selector
 
-        # Service-focused statistics
+        # kubectl calls are I/O bound subprocess waits, so overlap them on a thread pool
+        self.max_workers = int(os.environ.get(
+            'MONITOR_PARALLEL', self.config.get('monitoring', {}).get('parallel_workers', 20)
+        ))
+        self._kubectl_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+
+        # All exclude patterns fused into one regex so each pod needs a single match
+        exclude_patterns = (self.config.get('filters') or {}).get('exclude_pods_pattern') or []
+        self._exclude_re = re.compile('|'.join(f'(?:{p})' for p in exclude_patterns)) if exclude_patterns else None
+
+        # Keep-alive session for webhook delivery; alerts are queued during the scan
+        # and posted in batches by flush_webhook_alerts()
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=3, backoff_factor=0.2,
+                                                status_forcelist=[500, 502, 503, 504],
+                                                allowed_methods=frozenset(['POST'])))
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        self._pending_webhook_alerts: List[Dict[str, Any]] = []
+        # Webhook posts run in the background so a slow endpoint never stalls the scan;
+        # monitor_all_namespaces() waits for them before returning
+        self._webhook_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='wh')
+        self._webhook_futures: List[concurrent.futures.Future] = []
+        atexit.register(self._webhook_pool.shutdown)
+
+        # "namespace/pod" -> max restart count, recorded during the scan for the state file
+        self._current_restart_counts: Dict[str, int] = {}
+
+        # Namespace -> pod name -> events, rebuilt once per namespace scan
+        self._events_index: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+
+        # Service-focused statistics; namespace scans merge into these under the lock
+        self._stats_lock = threading.Lock()
         self.statistics = {
             "scan_start_time": datetime.datetime.now().isoformat(),
             "total_namespaces_checked": 0,
@@ -365,6 +671,27 @@ class NamespaceServiceMonitor:
 
         self.load_previous_state()
 
+        # "pod-uid:restart-count" -> log analysis; a pod that has not restarted since the
+        # last run yields the same analysis, so its kubectl/API log fetch is skipped
+        self._log_analysis_cache: Dict[str, Dict[str, Any]] = self.previous_state.get("log_analysis_cache", {})
+        self._current_log_analysis: Dict[str, Dict[str, Any]] = {}
+        # Pod uid -> its key in _current_log_analysis, so only a pod's latest analysis is kept
+        self._log_analysis_key_by_uid: Dict[str, str] = {}
+
+    def _init_kubernetes_client(self):
+        """Create in-process API clients, or (None, None) to fall back to kubectl"""
+        if k8s_client is None:
+            return None, None
+        try:
+            try:
+                k8s_config.load_incluster_config()
+            except k8s_config.ConfigException:
+                k8s_config.load_kube_config()
+            return k8s_client.CoreV1Api(), k8s_client.AppsV1Api()
+        except Exception as e:
+            logger.warning(f"Kubernetes client unavailable, falling back to kubectl: {e}")
+            return None, None
+
     def load_previous_state(self):
         """Load previous service monitoring state"""
         state_file = self.config.get('state_file', os.path.join(self.output_dir, 'service_monitor_state.json'))
@@ -382,29 +709,28 @@ class NamespaceServiceMonitor:
         state_file = self.config.get('state_file', os.path.join(self.output_dir, 'service_monitor_state.json'))
         current_state = {
             "last_run": datetime.datetime.now().isoformat(),
-            "service_restart_counts": {},
+            "service_restart_counts": self._current_restart_counts,
             "service_availability": self.statistics["service_availability"],
             "alerts": self.alerts,
+            "log_analysis_cache": self._current_log_analysis,
             "environment": self.statistics["environment"]
         }
         
-        # Save service restart counts for comparison
-        for namespace in self.namespaces:
-            pods = self.get_pods_in_namespace(namespace)
-            for pod in pods:
-                pod_key = f"{namespace}/{pod['metadata']['name']}"
-                restart_info = self.extract_restart_info(pod)
-                current_state["service_restart_counts"][pod_key] = restart_info["max_restarts"]
-        
         try:
-            with open(state_file, 'w') as f:
-                json.dump(current_state, f, indent=2)
+            write_json_file(state_file, current_state)
             logger.info(f"Saved current service state to {state_file}")
         except Exception as e:
             logger.error(f"Could not save state: {e}")
 
     def check_cluster_connectivity(self) -> bool:
         """Basic connectivity check"""
+        if self.core_v1 is not None:
+            try:
+                k8s_client.VersionApi().get_code(_request_timeout=10)
+                return True
+            except Exception as e:
+                logger.error(f"Cannot connect to Kubernetes cluster: {e}")
+                return False
         try:
             subprocess.run(
                 ["kubectl", "cluster-info"],
@@ -420,27 +746,59 @@ class NamespaceServiceMonitor:
     def run_kubectl_command(self, command: List[str]) -> Dict[str, Any]:
         """Execute kubectl commands with timeout"""
         try:
+            # Keep stdout as bytes; the JSON parser decodes it directly
             result = subprocess.run(
                 command,
                 capture_output=True,
-                text=True,
                 check=True,
                 timeout=30
             )
-            return json.loads(result.stdout) if result.stdout else {}
+            return loads_json(result.stdout) if result.stdout else {}
         except subprocess.TimeoutExpired:
             logger.error(f"kubectl command timed out: {' '.join(command)}")
             return {}
         except subprocess.CalledProcessError as e:
             logger.error(f"kubectl command failed: {' '.join(command)}")
-            logger.error(f"Error: {e.stderr}")
+            logger.error(f"Error: {e.stderr.decode(errors='replace') if e.stderr else ''}")
             return {}
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON output: {e}")
             return {}
 
+    def run_api_list(self, list_call, namespace: str, **kwargs) -> List[Dict[str, Any]]:
+        """Execute a namespaced Kubernetes API LIST call and return its items"""
+        try:
+            # Skip model deserialization; the raw JSON has the same shape as kubectl -o json
+            response = list_call(namespace, _preload_content=False, _request_timeout=30, **kwargs)
+            return loads_json(response.data).get("items", [])
+        except Exception as e:
+            logger.error(f"Kubernetes API call {list_call.__name__} failed for {namespace}: {e}")
+            return []
+
+    def namespace_exists(self, namespace: str) -> bool:
+        """Check that the namespace exists and is accessible"""
+        if self.core_v1 is not None:
+            try:
+                self.core_v1.read_namespace(namespace, _preload_content=False, _request_timeout=10)
+                return True
+            except Exception:
+                return False
+        try:
+            subprocess.run(
+                ["kubectl", "get", "namespace", namespace],
+                capture_output=True,
+                check=True,
+                timeout=10
+            )
+            return True
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            return False
+
     def get_pods_in_namespace(self, namespace: str) -> List[Dict[str, Any]]:
         """Get pods in namespace"""
+        if self.core_v1 is not None:
+            return self.run_api_list(self.core_v1.list_namespaced_pod, namespace,
+                                     label_selector=self.label_selector)
         command = ["kubectl", "get", "pods", "-n", namespace, "-o", "json"]
         if self.label_selector:
             command += ["-l", self.label_selector]
@@ -449,41 +807,55 @@ class NamespaceServiceMonitor:
 
     def get_services_in_namespace(self, namespace: str) -> List[Dict[str, Any]]:
         """Get services in namespace"""
+        if self.core_v1 is not None:
+            return self.run_api_list(self.core_v1.list_namespaced_service, namespace)
         command = ["kubectl", "get", "services", "-n", namespace, "-o", "json"]
         result = self.run_kubectl_command(command)
         return result.get("items", [])
 
     def get_deployments_in_namespace(self, namespace: str) -> List[Dict[str, Any]]:
         """Get deployments in namespace"""
+        if self.apps_v1 is not None:
+            return self.run_api_list(self.apps_v1.list_namespaced_deployment, namespace)
         command = ["kubectl", "get", "deployments", "-n", namespace, "-o", "json"]
         result = self.run_kubectl_command(command)
         return result.get("items", [])
 
+    def get_all_events_in_namespace(self, namespace: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Get all events in namespace indexed by involved object name, oldest first"""
+        if self.core_v1 is not None:
+            events = self.run_api_list(self.core_v1.list_namespaced_event, namespace)
+        else:
+            command = ["kubectl", "get", "events", "-n", namespace, "-o", "json"]
+            events = self.run_kubectl_command(command).get("items", [])
+        events_by_object = defaultdict(list)
+        for event in events:
+            events_by_object[event.get("involvedObject", {}).get("name")].append(event)
+        for events in events_by_object.values():
+            events.sort(key=lambda e: e.get("lastTimestamp") or e.get("eventTime") or "")
+        self._events_index[namespace] = events_by_object
+        return events_by_object
+
     def get_events_for_pod(self, namespace: str, pod_name: str) -> List[Dict[str, Any]]:
         """Get events for specific pod"""
-        command = ["kubectl", "get", "events", "-n", namespace,
-                  "--field-selector", f"involvedObject.name={pod_name}",
-                  "-o", "json"]
-        result = self.run_kubectl_command(command)
-        return result.get("items", [])
+        events_by_object = self._events_index.get(namespace)
+        if events_by_object is None:
+            events_by_object = self.get_all_events_in_namespace(namespace)
+        return events_by_object.get(pod_name, [])
 
-    def is_pod_filtered(self, pod: Dict[str, Any]) -> bool:
-        """Check if pod should be filtered out"""
+    def is_pod_filtered(self, pod: Dict[str, Any], now: Optional[datetime.datetime] = None) -> bool:
+        """Check if pod should be filtered out; now is the UTC scan time"""
         if not self.config.get('filters'):
             return False
         filters = self.config['filters']
         pod_name = pod["metadata"]["name"]
-        exclude_patterns = filters.get('exclude_pods_pattern', [])
-        for pattern in exclude_patterns:
-            if re.match(pattern, pod_name):
-                logger.debug(f"Pod {pod_name} excluded by pattern {pattern}")
-                return True
+        if self._exclude_re and self._exclude_re.match(pod_name):
+            logger.debug(f"Pod {pod_name} excluded by exclude_pods_pattern")
+            return True
         max_age_hours = filters.get('max_pod_age_hours')
         if max_age_hours:
-            creation_time = datetime.datetime.fromisoformat(
-                pod["metadata"]["creationTimestamp"].replace('Z', '+00:00')
-            )
-            age = datetime.datetime.now(datetime.timezone.utc) - creation_time
+            creation_time = parse_k8s_timestamp(pod["metadata"]["creationTimestamp"])
+            age = (now or datetime.datetime.now(datetime.timezone.utc)) - creation_time
             if age.total_seconds() < max_age_hours * 3600:
                 logger.debug(f"Pod {pod_name} too young, skipping")
                 return True
@@ -502,8 +874,9 @@ class NamespaceServiceMonitor:
             "node": pod["spec"].get("nodeName", "Unknown"),
             "phase": pod["status"].get("phase", "Unknown"),
             "creation_time": pod["metadata"].get("creationTimestamp", "Unknown"),
+            "uid": pod["metadata"].get("uid"),
             "containers": [],
-            "service_name": self._extract_service_name(pod_name)
+            "service_name": extract_service_name(pod_name)
         }
         container_statuses = pod["status"].get("containerStatuses", [])
         max_restarts = 0
@@ -530,14 +903,6 @@ class NamespaceServiceMonitor:
         restart_info["previous_restart_count"] = previous_restarts
         return restart_info
 
-    def _extract_service_name(self, pod_name: str) -> str:
-        """Extract service name from pod name"""
-        # Common patterns: service-name-deployment-hash-pod, service-name-hash
-        match = re.match(r'^([^-]+-[^-]+)', pod_name)
-        if match:
-            return match.group(1)
-        return pod_name.split('-')[0]
-
     def check_namespace_services(self, namespace: str) -> List[Dict[str, Any]]:
         """Check services in namespace for issues"""
         logger.info(f"Checking services in namespace: {namespace}")
@@ -556,32 +921,33 @@ class NamespaceServiceMonitor:
             "service_availability_score": 100
         }
         
-        self.statistics["total_namespaces_checked"] += 1
+        # Namespaces are scanned in parallel, so cluster-wide counters are merged into
+        # self.statistics once at the end: those mirrored in namespace_stats are summed
+        # from it, the rest are tallied here
+        totals = Counter(total_namespaces_checked=1)
         
         # Check namespace accessibility
-        try:
-            subprocess.run(
-                ["kubectl", "get", "namespace", namespace],
-                capture_output=True,
-                check=True,
-                timeout=10
-            )
+        if self.namespace_exists(namespace):
             namespace_stats["accessible"] = True
-            self.statistics["accessible_namespaces"] += 1
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            totals["accessible_namespaces"] += 1
+        else:
             logger.warning(f"Namespace {namespace} not found or not accessible")
-            self.statistics["inaccessible_namespaces"] += 1
-            self.statistics["namespace_details"][namespace] = namespace_stats
+            totals["inaccessible_namespaces"] += 1
+            self._merge_namespace_statistics(namespace, namespace_stats, totals)
             return alerts
 
-        # Get namespace resources
-        pods = self.get_pods_in_namespace(namespace)
-        services = self.get_services_in_namespace(namespace)
-        deployments = self.get_deployments_in_namespace(namespace)
+        # Get namespace resources concurrently
+        pods_future = self._kubectl_pool.submit(self.get_pods_in_namespace, namespace)
+        services_future = self._kubectl_pool.submit(self.get_services_in_namespace, namespace)
+        deployments_future = self._kubectl_pool.submit(self.get_deployments_in_namespace, namespace)
+        events_future = self._kubectl_pool.submit(self.get_all_events_in_namespace, namespace)
+        pods = pods_future.result()
+        services = services_future.result()
+        deployments = deployments_future.result()
+        events_future.result()
 
         namespace_stats["pods_count"] = len(pods)
         namespace_stats["services_count"] = len(services)
-        self.statistics["total_pods_evaluated"] += len(pods)
 
         # Analyze service availability
         service_availability = self.diagnostic_engine.analyze_service_availability(namespace, pods)
@@ -591,135 +957,165 @@ class NamespaceServiceMonitor:
         for service_name, service_info in service_availability["services_detected"].items():
             if service_info["status"] == "healthy":
                 namespace_stats["services_healthy"] += 1
-                self.statistics["services_healthy"] += 1
             elif service_info["status"] == "degraded":
                 namespace_stats["services_degraded"] += 1
-                self.statistics["services_degraded"] += 1
             else:  # critical
                 namespace_stats["services_critical"] += 1
-                self.statistics["services_critical"] += 1
 
-        self.statistics["total_services_evaluated"] += len(service_availability["services_detected"])
-        self.statistics["service_availability"][namespace] = service_availability
+        totals["total_services_evaluated"] += len(service_availability["services_detected"])
+
+        # One clock reading per namespace scan, shared by the age filter and every alert
+        scan_time = datetime.datetime.now(datetime.timezone.utc)
+        scan_timestamp = scan_time.astimezone().replace(tzinfo=None).isoformat()
 
         # Check individual pods for restart issues
+        offenders = []
         for pod in pods:
-            if self.is_pod_filtered(pod):
+            if self.is_pod_filtered(pod, now=scan_time):
                 namespace_stats["filtered_pods"] += 1
+                # Filtered pods are still recorded so their counts carry over in the state file
+                self._current_restart_counts[f"{namespace}/{pod['metadata']['name']}"] = max_restart_count(pod)
                 continue
                 
             restart_info = self.extract_restart_info(pod)
+            self._current_restart_counts[f"{namespace}/{restart_info['pod_name']}"] = restart_info["max_restarts"]
             container_count = len(restart_info["containers"])
             namespace_stats["containers_count"] += container_count
-            self.statistics["total_containers_evaluated"] += container_count
             
             if restart_info["max_restarts"] > 0:
                 namespace_stats["pods_with_restarts"] += 1
-                self.statistics["pods_with_restarts"] += 1
                 
             if restart_info["max_restarts"] > self.restart_threshold:
                 namespace_stats["pods_above_threshold"] += 1
-                self.statistics["pods_above_threshold"] += 1
-                
-                # Enhanced service analysis
-                events = self.get_events_for_pod(namespace, restart_info["pod_name"])
-                log_analysis = self.diagnostic_engine.analyze_service_logs(
-                    namespace, restart_info["pod_name"], lines=100
-                )
-                
-                # Calculate service impact severity
-                severity = self.calculate_service_impact_severity(restart_info, log_analysis, service_availability)
-                
-                alert = {
-                    "timestamp": datetime.datetime.now().isoformat(),
-                    "namespace": namespace,
-                    "service_name": restart_info["service_name"],
-                    "pod_name": restart_info["pod_name"],
-                    "restart_count": restart_info["max_restarts"],
-                    "previous_restart_count": restart_info["previous_restart_count"],
-                    "is_new_issue": restart_info["is_new_issue"],
-                    "status": restart_info["phase"],
-                    "node": restart_info["node"],
-                    "creation_time": restart_info["creation_time"],
-                    "containers": restart_info["containers"],
-                    "recent_events": events[-3:] if events else [],
-                    "severity": severity,
-                    "log_analysis": log_analysis,
-                    "service_health_score": log_analysis.get("service_health_score", 100),
-                    "recommendations": log_analysis.get("recommendations", [])
-                }
-                
-                alerts.append(alert)
-                
-                if alert['is_new_issue']:
-                    self.statistics["new_service_issues"] += 1
-                else:
-                    self.statistics["repeated_service_issues"] += 1
-                
-                # Service-focused logging - PROFESSIONAL FORMAT
-                severity_text = alert['severity'].upper()
-                logger.warning(
-                    f"SERVICE ISSUE [{severity_text}]: {restart_info['service_name']} "
-                    f"pod {restart_info['pod_name']} in {namespace} has {restart_info['max_restarts']} restarts "
-                    f"(health score: {alert['service_health_score']}/100)"
-                )
-                
-                # Send webhook for service issues
-                webhook_url = self.config.get('webhook_url')
-                if webhook_url and alert['severity'] in ['critical', 'high']:
-                    self.send_service_webhook_alert(alert, webhook_url)
+                offenders.append(restart_info)
+
+        # Fetch events and logs for every offending pod in parallel; the results are
+        # consumed here on the calling thread
+        diagnostics = list(self._kubectl_pool.map(self._diagnose_pod, offenders))
+        # Score the whole namespace in one pass once every pod's logs are in
+        severities = self.calculate_service_impact_severity_batch(
+            offenders, [log_analysis for _, log_analysis in diagnostics], service_availability
+        )
+        for restart_info, (events, log_analysis), severity in zip(offenders, diagnostics, severities):
+            alert = self._build_service_alert(restart_info, events, log_analysis, severity, scan_timestamp)
+            alerts.append(alert)
+            
+            if alert['is_new_issue']:
+                totals["new_service_issues"] += 1
+            else:
+                totals["repeated_service_issues"] += 1
+            
+            # Service-focused logging - PROFESSIONAL FORMAT
+            severity_text = alert['severity'].upper()
+            logger.warning(
+                f"SERVICE ISSUE [{severity_text}]: {restart_info['service_name']} "
+                f"pod {restart_info['pod_name']} in {namespace} has {restart_info['max_restarts']} restarts "
+                f"(health score: {alert['service_health_score']}/100)"
+            )
+            
+            # Queue webhook for service issues
+            if self.config.get('webhook_url') and alert['severity'] in ['critical', 'high']:
+                self._pending_webhook_alerts.append(alert)
 
-        self.statistics["namespace_details"][namespace] = namespace_stats
+        self._merge_namespace_statistics(namespace, namespace_stats, totals, service_availability)
         logger.info(f"Namespace {namespace}: {namespace_stats['services_count']} services, "
                    f"{namespace_stats['pods_count']} pods evaluated, "
                    f"availability score: {namespace_stats['service_availability_score']:.1f}%")
         return alerts
 
+    def _build_service_alert(self, restart_info: Dict[str, Any], events: List[Dict[str, Any]],
+                             log_analysis: Dict[str, Any], severity: str,
+                             timestamp: str) -> Dict[str, Any]:
+        """Assemble the alert record for a pod above the restart threshold"""
+        return {
+            "timestamp": timestamp,
+            "namespace": restart_info["namespace"],
+            "service_name": restart_info["service_name"],
+            "pod_name": restart_info["pod_name"],
+            "restart_count": restart_info["max_restarts"],
+            "previous_restart_count": restart_info["previous_restart_count"],
+            "is_new_issue": restart_info["is_new_issue"],
+            "status": restart_info["phase"],
+            "node": restart_info["node"],
+            "creation_time": restart_info["creation_time"],
+            "containers": restart_info["containers"],
+            "recent_events": events[-3:] if events else [],
+            "severity": severity,
+            "log_analysis": log_analysis,
+            "service_health_score": log_analysis.get("service_health_score", 100),
+            "recommendations": log_analysis.get("recommendations", [])
+        }
+
+    def _index_alert(self, alert: Dict[str, Any]):
+        """Add an alert to the per-service, per-severity and issue-category indexes"""
+        self._alerts_by_service[alert['service_name']].append(alert)
+        self._alerts_by_severity[alert['severity']].append(alert)
+        self._issue_counter.update(issue['category'] for issue in alert['log_analysis'].get('service_issues', []))
+
+    def _reindex_alerts(self):
+        """Rebuild the alert indexes from self.alerts"""
+        self._alerts_by_service.clear()
+        self._issue_counter.clear()
+        self._alerts_by_severity.clear()
+        for alert in self.alerts:
+            self._index_alert(alert)
+
+    def _merge_namespace_statistics(self, namespace: str, namespace_stats: Dict[str, Any],
+                                    totals: Counter, service_availability: Optional[Dict] = None):
+        """Fold one namespace's results into the shared statistics"""
+        with self._stats_lock:
+            for key, value in totals.items():
+                self.statistics[key] += value
+            for total_key, namespace_key in NAMESPACE_STAT_TOTALS:
+                self.statistics[total_key] += namespace_stats[namespace_key]
+            self.statistics["namespace_details"][namespace] = namespace_stats
+            if service_availability is not None:
+                self.statistics["service_availability"][namespace] = service_availability
+
+    def _diagnose_pod(self, restart_info: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Fetch events and analyze logs for a pod above the restart threshold"""
+        namespace = restart_info["namespace"]
+        events = self.get_events_for_pod(namespace, restart_info["pod_name"])
+        
+        cache_key = f"{restart_info['uid']}:{restart_info['max_restarts']}" if restart_info["uid"] else None
+        log_analysis = self._log_analysis_cache.get(cache_key) if cache_key else None
+        cacheable = log_analysis is not None
+        if log_analysis is None:
+            log_analysis, cacheable = self.diagnostic_engine.analyze_service_logs_read(
+                namespace, restart_info["pod_name"], lines=100,
+                has_restarts=restart_info["max_restarts"] > 0
+            )
+        # A failed or empty log fetch is retried next time rather than remembered
+        if cache_key and cacheable:
+            self._current_log_analysis[cache_key] = log_analysis
+            previous_key = self._log_analysis_key_by_uid.get(restart_info["uid"])
+            if previous_key is not None and previous_key != cache_key:
+                self._current_log_analysis.pop(previous_key, None)
+            self._log_analysis_key_by_uid[restart_info["uid"]] = cache_key
+        return events, log_analysis
+
     def calculate_service_impact_severity(self, restart_info: Dict, log_analysis: Dict, service_availability: Dict) -> str:
         """Calculate severity based on service impact"""
-        restart_count = restart_info["max_restarts"]
-        log_severity = log_analysis.get("severity", "low")
-        service_health = log_analysis.get("service_health_score", 100)
-        
-        # Check if this affects a critical service
-        service_name = restart_info["service_name"]
-        service_info = service_availability.get("services_detected", {}).get(service_name, {})
-        service_availability_pct = service_info.get("availability_percentage", 100)
-        
-        # Base severity from restart count
-        if restart_count > 50:
-            base_severity = "critical"
-        elif restart_count > 20:
-            base_severity = "high"
-        elif restart_count > 5:
-            base_severity = "medium"
-        else:
-            base_severity = "low"
-        
-        # Upgrade severity based on service impact
-        severity_levels = ["low", "medium", "high", "critical"]
-        max_severity = severity_levels.index(base_severity)
-        
-        # Service health impact
-        if service_health < 50:
-            max_severity = min(len(severity_levels) - 1, max_severity + 1)
-        elif service_health < 80:
-            max_severity = min(len(severity_levels) - 1, max_severity + 0.5)
-        
-        # Service availability impact
-        if service_availability_pct < 50:
-            max_severity = min(len(severity_levels) - 1, max_severity + 1)
-        elif service_availability_pct < 80:
-            max_severity = min(len(severity_levels) - 1, max_severity + 0.5)
-        
-        # Log analysis impact
-        log_severity_score = severity_levels.index(log_severity)
-        max_severity = max(max_severity, log_severity_score)
-        
-        return severity_levels[int(max_severity)]
+        return self.calculate_service_impact_severity_batch([restart_info], [log_analysis], service_availability)[0]
 
-    def send_service_webhook_alert(self, alert: Dict, webhook_url: str):
-        """Send service-focused webhook alert"""
+    def calculate_service_impact_severity_batch(self, restart_infos: List[Dict], log_analyses: List[Dict],
+                                                service_availability: Dict) -> List[str]:
+        """Calculate service impact severity for a namespace's pods in one pass"""
+        # Availability is per service, so its lookup is hoisted out of the per-pod loop
+        services_detected = service_availability.get("services_detected", {})
+        severity_fn = self._severity_fn
+        return [
+            severity_fn(
+                restart_info["max_restarts"],
+                log_analysis.get("service_health_score", 100),
+                services_detected.get(restart_info["service_name"], {}).get("availability_percentage", 100),
+                log_analysis.get("severity", "low")
+            )
+            for restart_info, log_analysis in zip(restart_infos, log_analyses)
+        ]
+
+    def format_service_webhook_message(self, alert: Dict) -> str:
+        """Format one alert as a webhook message"""
         message_parts = [
             f"*Service Alert - {alert['severity'].upper()}*",
             f"Service: `{alert['service_name']}`",
@@ -731,9 +1127,8 @@ class NamespaceServiceMonitor:
         ]
         
         # Add service recommendations
-        recommendations = alert.get('recommendations', [])
-        if recommendations:
-            top_rec = recommendations[0]
+        top_rec = top_recommendation(alert)
+        if top_rec:
             message_parts.extend([
                 "",
                 f"*Recommended Action ({top_rec['priority']}):*",
@@ -741,34 +1136,201 @@ class NamespaceServiceMonitor:
                 f"{top_rec['title']}"
             ])
         
-        message = "\n".join(message_parts)
-        data = {"text": message}
-        
+        return "\n".join(message_parts)
+
+    def send_service_webhook_alert(self, alert: Dict, webhook_url: str):
+        """Send service-focused webhook alert"""
+        data = {"text": self.format_service_webhook_message(alert)}
+        self._webhook_futures.append(self._webhook_pool.submit(
+            self._do_post, webhook_url, data,
+            f"Sent service webhook alert for {alert['service_name']} in {alert['namespace']}"
+        ))
+
+    def _do_post(self, webhook_url: str, data: Dict, sent_message: str):
+        """POST one webhook payload; runs on the webhook pool"""
         try:
-            response = requests.post(webhook_url, json=data, timeout=10)
-            logger.info(f"Sent service webhook alert for {alert['service_name']} in {alert['namespace']}")
+            self._http.post(webhook_url, json=data, timeout=WEBHOOK_TIMEOUT)
+            logger.info(sent_message)
         except Exception as e:
             logger.error(f"Failed to send service webhook alert: {e}")
 
+    def flush_webhook_alerts(self):
+        """Send all queued alerts, packing several into each webhook message.
+        
+        webhook_batch_size caps the alerts per message: 0 packs as many as fit
+        in WEBHOOK_BATCH_BYTES, 1 sends each alert on its own.
+        """
+        webhook_url = self.config.get('webhook_url')
+        if not webhook_url or not self._pending_webhook_alerts:
+            return
+        
+        batch_size = self.config.get('webhook_batch_size', 0)
+        separator_bytes = len(WEBHOOK_ALERT_SEPARATOR)
+        batches = []
+        batch, batch_bytes = [], 0
+        for alert in self._pending_webhook_alerts:
+            message = self.format_service_webhook_message(alert)
+            message_bytes = len(message.encode()) + separator_bytes
+            if batch and (batch_bytes + message_bytes > WEBHOOK_BATCH_BYTES or len(batch) == batch_size):
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(message)
+            batch_bytes += message_bytes
+        batches.append(batch)
+        
+        if httpx is not None:
+            asyncio.run(self._flush_webhooks(webhook_url, batches))
+        else:
+            for messages in batches:
+                self._webhook_futures.append(self._webhook_pool.submit(
+                    self._do_post, webhook_url, {"text": WEBHOOK_ALERT_SEPARATOR.join(messages)},
+                    f"Sent batched service webhook alert with {len(messages)} alerts"
+                ))
+        self._pending_webhook_alerts.clear()
+
+    async def _post_one(self, client, webhook_url: str, messages: List[str]):
+        """POST one batched webhook message over the shared async client"""
+        response = await client.post(webhook_url, json={"text": WEBHOOK_ALERT_SEPARATOR.join(messages)}, timeout=5.0)
+        response.raise_for_status()
+        logger.info(f"Sent batched service webhook alert with {len(messages)} alerts")
+
+    async def _flush_webhooks(self, webhook_url: str, batches: List[List[str]]):
+        """Send every batch concurrently over one httpx client"""
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        async with httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(retries=3, limits=limits)) as client:
+            results = await asyncio.gather(
+                *(self._post_one(client, webhook_url, messages) for messages in batches),
+                return_exceptions=True
+            )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send service webhook alert: {result}")
+
     def monitor_all_namespaces(self) -> List[Dict[str, Any]]:
         """Monitor all managed namespaces"""
         if not self.check_cluster_connectivity():
             return []
-        all_alerts = []
-        for namespace in self.namespaces:
-            namespace_alerts = self.check_namespace_services(namespace)
-            all_alerts.extend(namespace_alerts)
+        # Restart counts are recorded afresh each scan, so deleted pods drop out of the state file
+        self._current_restart_counts.clear()
+        # Namespace scans are I/O bound (kubectl/API calls), so run them side by side
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(self.namespaces) or 1)) as executor:
+            results = list(executor.map(self.check_namespace_services, self.namespaces))
+        all_alerts = [alert for namespace_alerts in results for alert in namespace_alerts]
+        # Keep per-namespace details in configured order rather than completion order
+        for key in ("namespace_details", "service_availability"):
+            details = self.statistics[key]
+            self.statistics[key] = {ns: details[ns] for ns in self.namespaces if ns in details}
         self.alerts = all_alerts
+        self._reindex_alerts()
+        self.flush_webhook_alerts()
         self.save_current_state()
+        concurrent.futures.wait(self._webhook_futures, timeout=30)
+        self._webhook_futures.clear()
         return all_alerts
 
-    def format_age(self, creation_time_str: str) -> str:
+    def watch_pod_restarts(self, write_outputs: Optional[Callable[[], None]] = None,
+                           report_interval: float = 300):
+        """Follow pods through the Kubernetes API and alert as soon as one restarts.
+        
+        One watch thread per namespace feeds pod updates into a queue and this
+        thread consumes them, so alerts and restart counts are only touched here.
+        The first sighting of each pod is its baseline; the one-shot scan before
+        the watch starts covers restarts that happened earlier. Runs until interrupted.
+        
+        Every report_interval seconds finished webhook posts are reaped, the state
+        file is saved and write_outputs (if given) rewrites the reports. Only the
+        newest WATCH_MAX_ALERTS alerts are kept, and only the latest log analysis
+        of each live pod. The statistics are not updated by the watch, so the
+        rewritten stats and report keep the initial scan's figures alongside
+        the current alerts.
+        """
+        pod_events: queue.Queue = queue.Queue()
+        for namespace in self.namespaces:
+            threading.Thread(target=self._watch_namespace_pods, args=(namespace, pod_events),
+                             name=f"watch-{namespace}", daemon=True).start()
+        
+        pods_by_namespace: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        next_report = time.monotonic() + report_interval
+        try:
+            while True:
+                if time.monotonic() >= next_report:
+                    self._webhook_futures = [future for future in self._webhook_futures if not future.done()]
+                    if write_outputs is not None:
+                        write_outputs()
+                    self.save_current_state()
+                    next_report = time.monotonic() + report_interval
+                try:
+                    namespace, event_type, pod = pod_events.get(timeout=max(0.0, next_report - time.monotonic()))
+                except queue.Empty:
+                    continue
+                pods = pods_by_namespace[namespace]
+                pod_name = pod["metadata"]["name"]
+                if event_type == "DELETED":
+                    pods.pop(pod_name, None)
+                    self._current_restart_counts.pop(f"{namespace}/{pod_name}", None)
+                    log_analysis_key = self._log_analysis_key_by_uid.pop(pod["metadata"].get("uid"), None)
+                    if log_analysis_key is not None:
+                        self._current_log_analysis.pop(log_analysis_key, None)
+                    continue
+                
+                previous = pods.get(pod_name)
+                pods[pod_name] = pod
+                restarts = max_restart_count(pod)
+                self._current_restart_counts[f"{namespace}/{pod_name}"] = restarts
+                # Only a restart count increase is worth a look; other pod updates are noise
+                if previous is None or restarts <= max_restart_count(previous):
+                    continue
+                if self.is_pod_filtered(pod):
+                    continue
+                
+                restart_info = self.extract_restart_info(pod)
+                if restart_info["max_restarts"] <= self.restart_threshold:
+                    continue
+                
+                self.get_all_events_in_namespace(namespace)
+                events, log_analysis = self._diagnose_pod(restart_info)
+                service_availability = self.diagnostic_engine.analyze_service_availability(
+                    namespace, list(pods.values())
+                )
+                severity = self.calculate_service_impact_severity(restart_info, log_analysis, service_availability)
+                alert = self._build_service_alert(
+                    restart_info, events, log_analysis, severity,
+                    datetime.datetime.now().isoformat()
+                )
+                self.alerts.append(alert)
+                if len(self.alerts) > WATCH_MAX_ALERTS:
+                    del self.alerts[:len(self.alerts) - WATCH_MAX_ALERTS]
+                    self._reindex_alerts()
+                else:
+                    self._index_alert(alert)
+                logger.warning(
+                    f"SERVICE ISSUE [{alert['severity'].upper()}]: {restart_info['service_name']} "
+                    f"pod {pod_name} in {namespace} restarted ({restart_info['max_restarts']} restarts, "
+                    f"health score: {alert['service_health_score']}/100)"
+                )
+                if self.config.get('webhook_url') and alert['severity'] in ['critical', 'high']:
+                    self.send_service_webhook_alert(alert, self.config['webhook_url'])
+        finally:
+            self.save_current_state()
+
+    def _watch_namespace_pods(self, namespace: str, pod_events: queue.Queue):
+        """Stream pod events for one namespace into the queue, reconnecting on errors"""
+        while True:
+            try:
+                for event in k8s_watch.Watch().stream(self.core_v1.list_namespaced_pod, namespace,
+                                                      label_selector=self.label_selector):
+                    pod_events.put((namespace, event["type"], event["raw_object"]))
+            except Exception as e:
+                logger.warning(f"Pod watch for {namespace} interrupted, reconnecting: {e}")
+                time.sleep(5)
+
+    def format_age(self, creation_time_str: str, now: Optional[datetime.datetime] = None) -> str:
         """Format pod age in human-readable format"""
         try:
             if creation_time_str == "Unknown":
                 return "Unknown"
-            creation_time = datetime.datetime.fromisoformat(creation_time_str.replace('Z', '+00:00'))
-            age = datetime.datetime.now(datetime.timezone.utc) - creation_time
+            creation_time = parse_k8s_timestamp(creation_time_str)
+            age = (now or datetime.datetime.now(datetime.timezone.utc)) - creation_time
             days = age.days
             hours, remainder = divmod(age.seconds, 3600)
             minutes, _ = divmod(remainder, 60)
@@ -784,9 +1346,7 @@ class NamespaceServiceMonitor:
 
     def truncate_text(self, text: str, max_length: int = 30) -> str:
         """Truncate text to fit in table columns"""
-        if len(text) <= max_length:
-            return text
-        return text[:max_length-3] + "..."
+        return make_truncator(max_length)(text)
 
     def print_service_executive_summary(self):
         """Print executive summary focused on service health"""
@@ -896,86 +1456,69 @@ class NamespaceServiceMonitor:
             print("="*80)
             return
             
+        # Nobody reads the table when output is piped or redirected by a scheduler; the
+        # CSV/JSON outputs carry the same data. CI job logs are read, so CI keeps the table
+        if not (sys.stdout.isatty() or os.environ.get('CI') or self.config.get('force_tables')):
+            print(f"\nSERVICE ISSUES DETECTED ({len(self.alerts)} problems requiring attention); see CSV/JSON outputs")
+            return
+        
         terminal_width = 80
         print(f"\nSERVICE ISSUES DETECTED ({len(self.alerts)} problems requiring attention)")
         print("="*terminal_width)
         
         # Sort by service impact (critical services first)
-        sorted_alerts = sorted(self.alerts, 
-                             key=lambda x: (
-                                 {"critical": 0, "high": 1, "medium": 2, "low": 3}[x['severity']],
-                                 -x['service_health_score'],
-                                 -x['restart_count']
-                             ))
-        
-        # Service-focused alert display
+        sorted_alerts = sorted(self.alerts, key=alert_display_key)
+        
+        # Service-focused alert display; every row's age is measured from the same instant
+        now = datetime.datetime.now(datetime.timezone.utc)
+        truncate15, truncate18, truncate20 = make_truncator(15), make_truncator(18), make_truncator(20)
         alert_data = []
         for i, alert in enumerate(sorted_alerts, 1):
-            severity = alert['severity'].upper()
-            issue_type = "NEW" if alert['is_new_issue'] else "RECURRING"
-            
-            # Service and pod info
-            service_name = self.truncate_text(alert['service_name'], 18)
-            pod_name = self.truncate_text(alert['pod_name'], 20)
-            namespace = self.truncate_text(alert['namespace'], 15)
-            age = self.format_age(alert['creation_time'])
-            
-            # Restart and health info
-            restart_info = f"{alert['restart_count']}"
-            if alert['previous_restart_count'] > 0:
-                change = alert['restart_count'] - alert['previous_restart_count']
-                restart_info += f" (+{change})"
-            
-            health_score = alert.get('service_health_score', 100)
-            
-            # Container health
+            restart_count = alert['restart_count']
+            previous_restart_count = alert['previous_restart_count']
             containers = alert['containers']
-            ready_count = sum(1 for c in containers if c.get('ready', False))
-            total_count = len(containers)
-            container_status = f"{ready_count}/{total_count}"
-            
-            # Service issue category
-            issues = alert.get('log_analysis', {}).get('service_issues', [])
-            issue_category = issues[0]['category'] if issues else 'GENERAL'
+            issues = alert['log_analysis'].get('service_issues')
             
             alert_data.append([
                 i,
-                severity,
-                issue_type,
-                namespace,
-                service_name,
-                pod_name,
-                restart_info,
-                f"{health_score}/100",
-                container_status,
-                issue_category,
-                age
+                alert['severity'].upper(),
+                "NEW" if alert['is_new_issue'] else "RECURRING",
+                truncate15(alert['namespace']),
+                truncate18(alert['service_name']),
+                truncate20(alert['pod_name']),
+                # Restarts, with the change since the previous run when there was one
+                f"{restart_count} (+{restart_count - previous_restart_count})" if previous_restart_count > 0 else f"{restart_count}",
+                f"{alert['service_health_score']}/100",
+                # Ready containers out of total
+                f"{sum(1 for c in containers if c.get('ready', False))}/{len(containers)}",
+                issues[0]['category'] if issues else 'GENERAL',
+                self.format_age(alert['creation_time'], now)
             ])
         
         headers = ["#", "Severity", "Type", "Namespace", "Service", "Pod", "Restarts", "Health", "Ready", "Category", "Age"]
         print(tabulate(alert_data, headers=headers, tablefmt="grid"))
         
         # Show actionable recommendations for service issues
-        critical_alerts = [a for a in sorted_alerts if a['severity'] in ['critical', 'high'] and a.get('recommendations')]
-        if critical_alerts:
+        # (alert, top recommendation) for the first few critical/high alerts that have one
+        critical_actions = list(itertools.islice(
+            ((alert, top_rec) for alert in sorted_alerts
+             if alert['severity'] in ('critical', 'high') and (top_rec := top_recommendation(alert))),
+            5
+        ))
+        if critical_actions:
             print(f"\nRECOMMENDED ACTIONS:")
             print("-" * terminal_width)
             
-            for i, alert in enumerate(critical_alerts[:5], 1):
+            for i, (alert, top_rec) in enumerate(critical_actions, 1):
                 service_ref = f"{alert['namespace']}/{alert['service_name']}"
-                recommendations = alert['recommendations']
                 
-                if recommendations:
-                    top_rec = recommendations[0]
-                    priority = top_rec['priority']
-                    
-                    print(f"\n{i}. [{priority}] {service_ref}")
-                    print(f"   Issue: {top_rec['title']}")
-                    print(f"   Immediate Action: {self.truncate_text(top_rec['immediate_action'], 70)}")
-                    
-                    # Show follow-up if available
-                    if 'follow_up' in top_rec:
-                        print(f"   Follow-up Command: {self.truncate_text(top_rec['follow_up'], 65)}")
+                print(f"\n{i}. [{top_rec['priority']}] {service_ref}")
+                print(f"   Issue: {top_rec['title']}")
+                print(f"   Immediate Action: {self.truncate_text(top_rec['immediate_action'], 70)}")
+                
+                # Show follow-up if available
+                if 'follow_up' in top_rec:
+                    print(f"   Follow-up Command: {self.truncate_text(top_rec['follow_up'], 65)}")
 
         # Show service health insights
         self.print_service_insights()
@@ -988,17 +1531,8 @@ class NamespaceServiceMonitor:
         print(f"\nSERVICE HEALTH ANALYSIS:")
         print("-" * 80)
         
-        # Service issue analysis
-        service_issues = {}
-        for alert in self.alerts:
-            service_name = alert['service_name']
-            if service_name not in service_issues:
-                service_issues[service_name] = []
-            service_issues[service_name].append(alert)
-        
         # Show most problematic services
-        problematic_services = sorted(service_issues.items(), 
-                                    key=lambda x: len(x[1]), reverse=True)[:3]
+        problematic_services = heapq.nlargest(3, self._alerts_by_service.items(), key=lambda x: len(x[1]))
         
         if problematic_services:
             service_summary = " | ".join([f"{svc}: {len(alerts)} issues" 
@@ -1006,14 +1540,8 @@ class NamespaceServiceMonitor:
             print(f"Most Affected Services: {service_summary}")
         
         # Common issue categories for services
-        all_issues = []
-        for alert in self.alerts:
-            issues = alert.get('log_analysis', {}).get('service_issues', [])
-            all_issues.extend([issue['category'] for issue in issues])
-        
-        if all_issues:
-            from collections import Counter
-            common_issues = Counter(all_issues).most_common(3)
+        common_issues = self._issue_counter.most_common(3)
+        if common_issues:
             issues_text = ", ".join([f"{issue} ({count})" for issue, count in common_issues])
             print(f"Common Issue Categories: {issues_text}")
         
@@ -1037,27 +1565,15 @@ class NamespaceServiceMonitor:
         if not self.alerts:
             logger.info("No service alerts to save")
             return
-        with open(filename, 'w', newline='') as csvfile:
-            fieldnames = ['timestamp', 'namespace', 'service_name', 'pod_name', 'restart_count',
-                         'previous_restart_count', 'is_new_issue', 'severity', 'service_health_score',
-                         'status', 'node', 'creation_time']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for alert in self.alerts:
-                writer.writerow({
-                    'timestamp': alert['timestamp'],
-                    'namespace': alert['namespace'],
-                    'service_name': alert['service_name'],
-                    'pod_name': alert['pod_name'],
-                    'restart_count': alert['restart_count'],
-                    'previous_restart_count': alert['previous_restart_count'],
-                    'is_new_issue': alert['is_new_issue'],
-                    'severity': alert['severity'],
-                    'service_health_score': alert.get('service_health_score', 100),
-                    'status': alert['status'],
-                    'node': alert['node'],
-                    'creation_time': alert['creation_time']
-                })
+        fieldnames = ['timestamp', 'namespace', 'service_name', 'pod_name', 'restart_count',
+                     'previous_restart_count', 'is_new_issue', 'severity', 'service_health_score',
+                     'status', 'node', 'creation_time']
+        # Alerts carry every column, so rows are plain tuples picked out in one C call
+        row_of = operator.itemgetter(*fieldnames)
+        with open(filename, 'w', newline='', buffering=1024 * 1024) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(map(row_of, self.alerts))
         logger.info(f"Service alerts saved to {filename}")
 
     def save_service_detailed_report(self, filename: str = None):
@@ -1084,16 +1600,15 @@ class NamespaceServiceMonitor:
                 {
                     "service": alert['service_name'],
                     "namespace": alert['namespace'],
-                    "priority": alert['recommendations'][0]['priority'] if alert['recommendations'] else 'N/A',
-                    "action": alert['recommendations'][0]['immediate_action'] if alert['recommendations'] else 'N/A'
+                    "priority": top_rec['priority'],
+                    "action": top_rec['immediate_action']
                 }
-                for alert in self.alerts if alert.get('recommendations')
+                for alert in self.alerts if (top_rec := top_recommendation(alert))
             ]
         }
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(service_report, f, indent=2)
+            write_json_file(filename, service_report)
             logger.info(f"Service detailed report saved to {filename}")
         except Exception as e:
             logger.error(f"Failed to save service report: {e}")
@@ -1103,30 +1618,32 @@ class NamespaceServiceMonitor:
         action_plan = []
         
         # Focus on critical and high severity service issues
-        critical_alerts = [a for a in self.alerts if a['severity'] == 'critical']
-        high_alerts = [a for a in self.alerts if a['severity'] == 'high']
+        # Only the top few of each are used, ranked as in the alerts table
+        alerts_by_severity = self._alerts_by_severity
+        critical_alerts = heapq.nsmallest(3, alerts_by_severity['critical'], key=alert_display_key)
+        high_alerts = heapq.nsmallest(2, alerts_by_severity['high'], key=alert_display_key)
         
         # Critical service issues first
-        for alert in critical_alerts[:3]:
-            recommendations = alert.get('recommendations', [])
-            if recommendations:
+        for alert in critical_alerts:
+            top_rec = top_recommendation(alert)
+            if top_rec:
                 action_plan.append({
                     'priority': 'CRITICAL SERVICE',
                     'service': alert['service_name'],
                     'namespace': alert['namespace'],
-                    'action': recommendations[0]['immediate_action'],
+                    'action': top_rec['immediate_action'],
                     'reason': f"Service health: {alert.get('service_health_score', 0)}/100"
                 })
         
         # High priority service issues
-        for alert in high_alerts[:2]:
-            recommendations = alert.get('recommendations', [])
-            if recommendations:
+        for alert in high_alerts:
+            top_rec = top_recommendation(alert)
+            if top_rec:
                 action_plan.append({
                     'priority': 'HIGH SERVICE',
                     'service': alert['service_name'],
                     'namespace': alert['namespace'],
-                    'action': recommendations[0]['immediate_action'],
+                    'action': top_rec['immediate_action'],
                     'reason': f"Restart count: {alert['restart_count']}"
                 })
         
@@ -1177,6 +1694,10 @@ def main():
                        help='Kubectl label selector for service pods')
     parser.add_argument('--generate-actions', action='store_true',
                        help='Generate actionable service recovery steps')
+    parser.add_argument('--force-tables', action='store_true',
+                       help='Print the alerts table even when stdout is not a terminal')
+    parser.add_argument('--webhook-batch-size', type=int,
+                       help='Alerts per webhook message; 0 packs as many as fit, 1 sends one per alert (default: 0)')
     args = parser.parse_args()
 
     config = {}
@@ -1194,30 +1715,37 @@ def main():
     if not namespaces:
         parser.error("No namespaces specified. Use --namespaces or provide config file with namespaces.")
     
+    if args.force_tables:
+        config['force_tables'] = True
+    if args.webhook_batch_size is not None:
+        config['webhook_batch_size'] = args.webhook_batch_size
+    
     threshold = args.threshold
     if config.get('monitoring', {}).get('restart_threshold'):
         threshold = config['monitoring']['restart_threshold']
     
-    def run_service_monitoring():
-        monitor = NamespaceServiceMonitor(namespaces, threshold, config, args.label_selector)
+    def write_service_outputs(monitor):
+        """Write the alerts CSV, the detailed report and (if requested) the statistics"""
+        monitor.save_service_alerts_to_csv(args.output_csv)
+        monitor.save_service_detailed_report(args.output_json)
+        if args.stats_json:
+            write_json_file(args.stats_json, monitor.statistics)
+    
+    def run_service_monitoring(monitor=None):
+        if monitor is None:
+            monitor = NamespaceServiceMonitor(namespaces, threshold, config, args.label_selector)
         logger.info("Starting professional service monitoring for your namespaces...")
         
         alerts = monitor.monitor_all_namespaces()
         
-        # Save service-focused outputs
-        monitor.save_service_alerts_to_csv(args.output_csv)
-        monitor.save_service_detailed_report(args.output_json)
-        
         # Calculate final statistics
         monitor.statistics["scan_end_time"] = datetime.datetime.now().isoformat()
         scan_start = datetime.datetime.fromisoformat(monitor.statistics["scan_start_time"])
         scan_end = datetime.datetime.fromisoformat(monitor.statistics["scan_end_time"])
         monitor.statistics["scan_duration_seconds"] = (scan_end - scan_start).total_seconds()
         
-        # Save statistics
-        if args.stats_json:
-            with open(args.stats_json, 'w') as f:
-                json.dump(monitor.statistics, f, indent=2)
+        # Save service-focused outputs and statistics
+        write_service_outputs(monitor)
         
         # Display service-focused results
         monitor.print_statistics()
@@ -1248,7 +1776,22 @@ def main():
         
         return critical_services, len(alerts)
     
-    if args.watch:
+    watch_monitor = None
+    if args.watch and k8s_client is not None:
+        watch_monitor = NamespaceServiceMonitor(namespaces, threshold, config, args.label_selector)
+    
+    if watch_monitor is not None and watch_monitor.core_v1 is not None:
+        # Push-based watch: one full scan for the reports, then react to pod restarts as they
+        # happen on the same monitor, rewriting the reports every --watch-interval seconds
+        logger.info("Starting continuous service monitoring - watching pods for restarts")
+        try:
+            run_service_monitoring(watch_monitor)
+            watch_monitor.watch_pod_restarts(functools.partial(write_service_outputs, watch_monitor),
+                                             args.watch_interval)
+        except KeyboardInterrupt:
+            logger.info("Service monitoring stopped by user")
+            sys.exit(0)
+    elif args.watch:
         logger.info(f"Starting continuous service monitoring - checking every {args.watch_interval} seconds")
         try:
             while True:
@@ -1,19 +1,51 @@
 #!/usr/bin/env python3
 
+import atexit
+import http.client
 import json
 import subprocess
+import concurrent.futures
+import threading
 import datetime
+import itertools
 import csv
 import logging
+import operator
 import sys
 import os
 import time
 import yaml
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import argparse
 from pathlib import Path
 import re
 import tempfile
+import urllib.parse
+from collections import Counter, defaultdict
+
+try:
+    import orjson  # faster JSON for the state and alert files
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # incremental JSON parsing of large list responses
+except ImportError:
+    ijson = None
+
+try:
+    from kubernetes import client as k8s_client, config as k8s_config, watch as k8s_watch
+except ImportError:
+    k8s_client = None  # fall back to the kubectl CLI
+
+# Pods requested per LIST page, so large namespaces are fetched in bounded chunks
+POD_LIST_PAGE_SIZE = 500
+
+# Most log bytes fetched per alerting pod
+LOG_TAIL_LIMIT_BYTES = 4096
+
+# Ask the apiserver for metadata only when a list is just being counted
+METADATA_ONLY_ACCEPT = "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,application/json"
 
 # For CI environments, prefer current directory over temp directory
 def get_output_directory():
@@ -47,17 +79,240 @@ logger.info(f"Output directory: {OUTPUT_DIR}")
 if os.environ.get('CI'):
     logger.info("Running in CI environment - artifacts will be saved to monitoring-output/")
 
+def write_compact_json(path: str, data: Any):
+    """Write machine-read JSON on a single line, using orjson when it is installed"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = (json.dumps(data, separators=(",", ":")) + "\n").encode()
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+def write_lines(lines: List[str]):
+    """Write lines to stdout with a single write and flush"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def summarize_container_status(container: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a pod containerStatuses entry to the fields reported in alerts.
+    
+    Images and termination reasons repeat across every replica of a workload,
+    so they are interned to keep one copy of each in memory.
+    """
+    get = container.get
+    state = get("state")
+    container_info = {
+        "name": container["name"],
+        "restart_count": get("restartCount", 0),
+        "ready": get("ready", False),
+        "state": next(iter(state)) if state else "Unknown",
+        "image": sys.intern(get("image", "Unknown"))
+    }
+    
+    # Get last termination reason if available
+    terminated = get("lastState", {}).get("terminated")
+    if terminated is not None:
+        container_info["last_termination_reason"] = sys.intern(terminated.get("reason", "Unknown"))
+        container_info["last_termination_time"] = terminated.get("finishedAt", "Unknown")
+        container_info["exit_code"] = terminated.get("exitCode", "Unknown")
+    return container_info
+
+def create_kubernetes_clients():
+    """Create in-process API clients, or (None, None) to fall back to kubectl"""
+    if k8s_client is None:
+        return None, None
+    try:
+        try:
+            k8s_config.load_incluster_config()
+        except k8s_config.ConfigException:
+            k8s_config.load_kube_config()
+        return k8s_client.CoreV1Api(), k8s_client.AppsV1Api()
+    except Exception as e:
+        logger.warning(f"Kubernetes client unavailable, falling back to kubectl: {e}")
+        return None, None
+
+class PodWatchCache:
+    """Pods of the monitored namespaces, kept current by API watches.
+    
+    Used in watch mode so repeated scans read pods from memory instead of
+    re-listing them. Each namespace is listed once, then followed with a watch
+    from that list's resourceVersion; the watch is closed every resync_seconds
+    and the namespace re-listed, which reconciles any missed events.
+    """
+    def __init__(self, core_v1, namespaces: List[str], resync_seconds: int = 60):
+        self.core_v1 = core_v1
+        self.namespaces = namespaces
+        self.resync_seconds = resync_seconds
+        self._pods: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def start_for(cls, namespaces: List[str]) -> Optional["PodWatchCache"]:
+        """Start watching the namespaces, or return None when the API client is unavailable"""
+        core_v1, _ = create_kubernetes_clients()
+        if core_v1 is None:
+            return None
+        cache = cls(core_v1, namespaces)
+        for namespace in namespaces:
+            threading.Thread(target=cache._watch_namespace, args=(namespace,),
+                             name=f"pod-watch-{namespace}", daemon=True).start()
+        return cache
+    
+    def pods_in_namespace(self, namespace: str) -> Optional[List[Dict[str, Any]]]:
+        """Cached pods of the namespace, or None until its first list has completed"""
+        with self._lock:
+            pods = self._pods.get(namespace)
+            return list(pods.values()) if pods is not None else None
+    
+    def _watch_namespace(self, namespace: str):
+        """List then watch one namespace forever, re-listing after every watch window"""
+        while True:
+            try:
+                response = self.core_v1.list_namespaced_pod(namespace, _preload_content=False, _request_timeout=30)
+                data = json.loads(response.data)
+                pods = {}
+                for pod in data.get("items", []):
+                    # Never read, and often the bulk of a pod object
+                    pod["metadata"].pop("managedFields", None)
+                    pods[pod["metadata"]["name"]] = pod
+                with self._lock:
+                    self._pods[namespace] = pods
+                
+                stream = k8s_watch.Watch().stream(
+                    self.core_v1.list_namespaced_pod, namespace,
+                    resource_version=data["metadata"]["resourceVersion"],
+                    timeout_seconds=self.resync_seconds
+                )
+                for event in stream:
+                    pod = event["raw_object"]
+                    pod["metadata"].pop("managedFields", None)
+                    with self._lock:
+                        pods = self._pods[namespace]
+                        if event["type"] == "DELETED":
+                            pods.pop(pod["metadata"]["name"], None)
+                        elif event["type"] in ("ADDED", "MODIFIED"):
+                            pods[pod["metadata"]["name"]] = pod
+            except Exception as e:
+                logger.warning(f"Pod watch for {namespace} interrupted, re-listing: {e}")
+                time.sleep(5)
+
+class KubectlProxy:
+    """A `kubectl proxy` child process serving the API on a local port.
+    
+    Used when the kubernetes client is not installed: each call is then a
+    keep-alive HTTP GET to localhost instead of forking kubectl, which also
+    does its own TLS handshake every time. Connections are per thread, since
+    namespaces are scanned in parallel.
+    """
+    def __init__(self, process: subprocess.Popen, host: str, port: int):
+        self.process = process
+        self.host = host
+        self.port = port
+        self._local = threading.local()
+    
+    @classmethod
+    def start(cls) -> Optional["KubectlProxy"]:
+        """Start a proxy on a free port, or return None if it does not come up"""
+        try:
+            process = subprocess.Popen(["kubectl", "proxy", "--port=0"], stdout=subprocess.PIPE,
+                                       stderr=subprocess.DEVNULL, text=True)
+        except OSError as e:
+            logger.warning(f"Could not start kubectl proxy: {e}")
+            return None
+        timer = threading.Timer(10, process.kill)
+        timer.start()
+        try:
+            # e.g. "Starting to serve on 127.0.0.1:38123"
+            match = re.search(r"serve on ([\d.]+):(\d+)", process.stdout.readline())
+        finally:
+            timer.cancel()
+        if not match:
+            logger.warning("kubectl proxy did not start, falling back to kubectl commands")
+            process.kill()
+            return None
+        atexit.register(process.terminate)
+        logger.info(f"Using kubectl proxy on {match.group(1)}:{match.group(2)}")
+        return cls(process, match.group(1), int(match.group(2)))
+    
+    def get(self, path: str, params: Dict[str, Any] = None,
+            headers: Dict[str, str] = None) -> Tuple[int, bytes]:
+        """GET an API path and return the status code and body"""
+        if params:
+            path = f"{path}?{urllib.parse.urlencode(params)}"
+        for attempt in range(2):
+            connection = getattr(self._local, "connection", None)
+            if connection is None:
+                connection = self._local.connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+            try:
+                connection.request("GET", path, headers=headers or {})
+                response = connection.getresponse()
+                return response.status, response.read()
+            except (http.client.HTTPException, OSError):
+                # The kept-alive connection was dropped; reconnect once
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+    
+    def list_items(self, path: str, params: Dict[str, Any] = None,
+                   headers: Dict[str, str] = None) -> List[Dict[str, Any]]:
+        """GET a list endpoint and return its items, or [] on failure"""
+        try:
+            status, body = self.get(path, params, headers)
+        except (http.client.HTTPException, OSError) as e:
+            logger.error(f"kubectl proxy request {path} failed: {e}")
+            return []
+        if status != 200:
+            logger.error(f"kubectl proxy request {path} returned {status}")
+            return []
+        return json.loads(body).get("items", [])
+
 class KubernetesPodMonitor:
-    def __init__(self, namespaces: List[str], restart_threshold: int = 1, config: Dict[str, Any] = None):
+    def __init__(self, namespaces: List[str], restart_threshold: int = 1, config: Dict[str, Any] = None,
+                 pod_cache: Optional[PodWatchCache] = None, proxy: Optional[KubectlProxy] = None):
         self.namespaces = namespaces
         self.restart_threshold = restart_threshold
         self.config = config or {}
         self.alerts = []
+        
+        # Pod filters, resolved once instead of on every pod
+        filters = self.config.get('filters') or {}
+        self._exclude_res = [re.compile(pattern) for pattern in filters.get('exclude_pods_pattern', [])]
+        try:
+            # One alternation lets the engine test every pattern in a single pass
+            self._exclude_re = re.compile(
+                "|".join(f"(?:{p.pattern})" for p in self._exclude_res)
+            ) if self._exclude_res else None
+        except re.error:
+            # e.g. inline global flags, which are only allowed at the start of a pattern
+            self._exclude_re = None
+        max_age_hours = filters.get('max_pod_age_hours')
+        self._min_age_seconds = max_age_hours * 3600 if max_age_hours else None
+        # Set per scan by start_scan_clock
+        self._scan_now = None
+        self._min_creation_dt = None
+        self._min_creation_iso = None
+        self._include_only_running = bool(filters.get('include_only_running'))
+        
+        # Log tails are opt-in; while a scan runs they are fetched on a shared pool
+        self.fetch_logs = bool(self.config.get('monitoring', {}).get('fetch_logs'))
+        self._log_executor = None
         self.previous_state = {}
         
         # Use the global output directory
         self.output_dir = OUTPUT_DIR
         
+        # In-process API clients sharing one pooled connection; None means use kubectl
+        self.core_v1, self.apps_v1 = create_kubernetes_clients()
+        # Without the API client, talk to a shared kubectl proxy if one is running
+        self.proxy = proxy if self.core_v1 is None else None
+        # Watch-mode pod cache shared across scans; None means pods are listed every scan
+        self.pod_cache = pod_cache
+        
+        # Namespace scans merge into these under the lock
+        self._stats_lock = threading.Lock()
+        # Restart counts seen this scan, per namespace, saved as the next run's baseline
+        self._current_restart_counts: Dict[str, Dict[str, int]] = {}
         self.statistics = {
             "scan_start_time": datetime.datetime.now().isoformat(),
             "total_namespaces_checked": 0,
@@ -102,12 +357,15 @@ class KubernetesPodMonitor:
         state_file = self.config.get('state_file', os.path.join(self.output_dir, 'k8s_monitor_state.json'))
         try:
             if os.path.exists(state_file):
-                with open(state_file, 'r') as f:
-                    self.previous_state = json.load(f)
+                with open(state_file, 'rb') as f:
+                    data = f.read()
+                self.previous_state = orjson.loads(data) if orjson is not None else json.loads(data)
                 logger.info(f"Loaded previous state from {state_file}")
         except Exception as e:
             logger.warning(f"Could not load previous state: {e}")
             self.previous_state = {}
+        # Looked up once per pod, so keep a direct reference
+        self._previous_restart_counts = self.previous_state.get("pod_restart_counts", {})
     
     def save_current_state(self):
         """Save current monitoring state for next run"""
@@ -119,23 +377,35 @@ class KubernetesPodMonitor:
             "environment": self.statistics["environment"]
         }
         
-        # Save current restart counts for each pod
+        # Save the restart counts recorded while scanning each namespace
         for namespace in self.namespaces:
-            pods = self.get_pods_in_namespace(namespace)
-            for pod in pods:
-                pod_key = f"{namespace}/{pod['metadata']['name']}"
-                restart_info = self.extract_restart_info(pod)
-                current_state["pod_restart_counts"][pod_key] = restart_info["max_restarts"]
+            current_state["pod_restart_counts"].update(self._current_restart_counts.get(namespace, {}))
         
         try:
-            with open(state_file, 'w') as f:
-                json.dump(current_state, f, indent=2)
+            write_compact_json(state_file, current_state)
             logger.info(f"Saved current state to {state_file}")
         except Exception as e:
             logger.error(f"Could not save state: {e}")
     
     def get_cluster_info(self):
         """Get cluster information for context"""
+        if self.core_v1 is not None:
+            try:
+                version = k8s_client.VersionApi().get_code(_request_timeout=10)
+                try:
+                    current_context = k8s_config.list_kube_config_contexts()[1]["name"]
+                except Exception:
+                    current_context = "in-cluster"
+                self.statistics["cluster_info"] = {
+                    "current_context": current_context,
+                    "version_info": f"Server Version: {version.git_version}",
+                    "cluster_accessible": True
+                }
+            except Exception as e:
+                logger.warning(f"Could not get cluster info: {e}")
+                self.statistics["cluster_info"] = {"cluster_accessible": False, "error": str(e)}
+            return
+        
         try:
             # Get cluster info
             result = subprocess.run(
@@ -170,6 +440,33 @@ class KubernetesPodMonitor:
             logger.warning(f"Could not get cluster info: {e}")
             self.statistics["cluster_info"] = {"cluster_accessible": False, "error": str(e)}
         
+    def stream_kubectl_items(self, command: List[str]) -> Iterator[Dict[str, Any]]:
+        """Run a kubectl list command and yield its items as they are parsed.
+        
+        With ijson each item is decoded straight off the pipe, so the raw
+        response is never held in memory; without it the output is parsed
+        in one go, as in run_kubectl_command.
+        """
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        timer = threading.Timer(30, process.kill)
+        timer.start()
+        try:
+            if ijson is not None:
+                yield from ijson.items(process.stdout, "items.item", use_float=True)
+            else:
+                output = process.stdout.read()
+                yield from (json.loads(output).get("items", []) if output else [])
+        except Exception as e:
+            logger.error(f"Failed to parse JSON output: {e}")
+        finally:
+            timer.cancel()
+            process.stdout.close()
+            stderr = process.stderr.read()
+            process.stderr.close()
+            if process.wait() != 0:
+                logger.error(f"kubectl command failed: {' '.join(command)}")
+                logger.error(f"Error: {stderr.decode(errors='replace')}")
+    
     def run_kubectl_command(self, command: List[str]) -> Dict[str, Any]:
         """Execute kubectl command and return JSON output"""
         try:
@@ -192,8 +489,53 @@ class KubernetesPodMonitor:
             logger.error(f"Failed to parse JSON output: {e}")
             return {}
     
+    def run_api_list(self, list_call, namespace: str, **kwargs) -> List[Dict[str, Any]]:
+        """Execute a namespaced Kubernetes API LIST call and return its items"""
+        try:
+            # Skip model deserialization; the raw JSON has the same shape as kubectl -o json
+            response = list_call(namespace, _preload_content=False, _request_timeout=30, **kwargs)
+            return json.loads(response.data).get("items", [])
+        except Exception as e:
+            logger.error(f"Kubernetes API call {list_call.__name__} failed for {namespace}: {e}")
+            return []
+    
+    def run_api_metadata_list(self, api, resource_path: str, namespace: str) -> List[Dict[str, Any]]:
+        """List the metadata of a namespaced resource through the client's raw call_api.
+        
+        The generated list_namespaced_* methods reject custom headers, so the
+        metadata-only Accept header is sent with call_api instead.
+        """
+        try:
+            response = api.api_client.call_api(
+                resource_path, "GET",
+                path_params={"namespace": namespace},
+                header_params={"Accept": METADATA_ONLY_ACCEPT},
+                auth_settings=["BearerToken"],
+                _return_http_data_only=True,
+                _preload_content=False,
+                _request_timeout=30
+            )
+            return json.loads(response.data).get("items", [])
+        except Exception as e:
+            logger.error(f"Kubernetes API call GET {resource_path} failed for {namespace}: {e}")
+            return []
+    
     def check_cluster_connectivity(self) -> bool:
         """Check if we can connect to the Kubernetes cluster"""
+        if self.core_v1 is not None:
+            try:
+                k8s_client.VersionApi().get_code(_request_timeout=10)
+                return True
+            except Exception as e:
+                logger.error(f"Cannot connect to Kubernetes cluster: {e}")
+                return False
+        if self.proxy is not None:
+            try:
+                if self.proxy.get("/version")[0] == 200:
+                    return True
+            except (http.client.HTTPException, OSError) as e:
+                logger.error(f"Cannot reach the cluster through kubectl proxy: {e}")
+            return False
         try:
             subprocess.run(
                 ["kubectl", "cluster-info"], 
@@ -206,118 +548,213 @@ class KubernetesPodMonitor:
             logger.error("Cannot connect to Kubernetes cluster. Check your kubeconfig.")
             return False
     
-    def get_pods_in_namespace(self, namespace: str) -> List[Dict[str, Any]]:
-        """Get all pods in a specific namespace"""
-        command = ["kubectl", "get", "pods", "-n", namespace, "-o", "json"]
-        result = self.run_kubectl_command(command)
-        return result.get("items", [])
+    def namespace_exists(self, namespace: str) -> bool:
+        """Check that the namespace exists and is accessible"""
+        if self.core_v1 is not None:
+            try:
+                self.core_v1.read_namespace(namespace, _preload_content=False, _request_timeout=10)
+                return True
+            except Exception:
+                return False
+        if self.proxy is not None:
+            try:
+                return self.proxy.get(f"/api/v1/namespaces/{namespace}")[0] == 200
+            except (http.client.HTTPException, OSError):
+                return False
+        try:
+            subprocess.run(
+                ["kubectl", "get", "namespace", namespace], 
+                capture_output=True, 
+                check=True,
+                timeout=10
+            )
+            return True
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            return False
+    
+    def iter_pods_in_namespace(self, namespace: str) -> Iterator[Dict[str, Any]]:
+        """Yield the pods in a namespace, streaming them off the response where possible"""
+        if self.pod_cache is not None:
+            pods = self.pod_cache.pods_in_namespace(namespace)
+            if pods is not None:
+                yield from pods
+                return
+        if self.core_v1 is not None:
+            # Page through the list so each pod is processed while the next page is pending
+            continue_token = None
+            while True:
+                try:
+                    response = self.core_v1.list_namespaced_pod(
+                        namespace, limit=POD_LIST_PAGE_SIZE, _continue=continue_token,
+                        _preload_content=False, _request_timeout=30
+                    )
+                    page = json.loads(response.data)
+                except Exception as e:
+                    logger.error(f"Kubernetes API call list_namespaced_pod failed for {namespace}: {e}")
+                    return
+                yield from page.get("items", [])
+                continue_token = page.get("metadata", {}).get("continue")
+                if not continue_token:
+                    return
+        if self.proxy is not None:
+            params = {"limit": POD_LIST_PAGE_SIZE}
+            while True:
+                try:
+                    status, body = self.proxy.get(f"/api/v1/namespaces/{namespace}/pods", params)
+                except (http.client.HTTPException, OSError) as e:
+                    logger.error(f"Listing pods in {namespace} through kubectl proxy failed: {e}")
+                    return
+                if status != 200:
+                    logger.error(f"Listing pods in {namespace} through kubectl proxy returned {status}")
+                    return
+                page = json.loads(body)
+                yield from page.get("items", [])
+                params["continue"] = page.get("metadata", {}).get("continue")
+                if not params["continue"]:
+                    return
+        yield from self.stream_kubectl_items(["kubectl", "get", "pods", "-n", namespace,
+                                              f"--chunk-size={POD_LIST_PAGE_SIZE}", "-o", "json"])
+    
+    def get_object_names(self, kind: str, namespace: str) -> List[str]:
+        """Get the names of all objects of a kind in a namespace without fetching their bodies"""
+        try:
+            result = subprocess.run(
+                ["kubectl", "get", kind, "-n", namespace, "-o", "name"],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=30
+            )
+        except subprocess.TimeoutExpired:
+            logger.error(f"kubectl get {kind} timed out for {namespace}")
+            return []
+        except subprocess.CalledProcessError as e:
+            logger.error(f"kubectl get {kind} failed for {namespace}: {e.stderr}")
+            return []
+        return [line.split("/", 1)[-1] for line in result.stdout.splitlines() if line]
     
     def get_services_in_namespace(self, namespace: str) -> List[Dict[str, Any]]:
-        """Get all services in a specific namespace"""
-        command = ["kubectl", "get", "services", "-n", namespace, "-o", "json"]
-        result = self.run_kubectl_command(command)
-        return result.get("items", [])
+        """Get metadata of all services in a specific namespace"""
+        if self.core_v1 is not None:
+            return self.run_api_metadata_list(self.core_v1, "/api/v1/namespaces/{namespace}/services", namespace)
+        if self.proxy is not None:
+            return self.proxy.list_items(f"/api/v1/namespaces/{namespace}/services",
+                                         headers={"Accept": METADATA_ONLY_ACCEPT})
+        return [{"metadata": {"name": name}} for name in self.get_object_names("services", namespace)]
     
     def get_deployments_in_namespace(self, namespace: str) -> List[Dict[str, Any]]:
-        """Get all deployments in a specific namespace"""
-        command = ["kubectl", "get", "deployments", "-n", namespace, "-o", "json"]
-        result = self.run_kubectl_command(command)
-        return result.get("items", [])
-    
-    def get_events_for_pod(self, namespace: str, pod_name: str) -> List[Dict[str, Any]]:
-        """Get recent events for a specific pod"""
-        command = ["kubectl", "get", "events", "-n", namespace, 
-                  "--field-selector", f"involvedObject.name={pod_name}",
-                  "-o", "json"]
-        result = self.run_kubectl_command(command)
-        return result.get("items", [])
+        """Get metadata of all deployments in a specific namespace"""
+        if self.apps_v1 is not None:
+            return self.run_api_metadata_list(self.apps_v1, "/apis/apps/v1/namespaces/{namespace}/deployments",
+                                              namespace)
+        if self.proxy is not None:
+            return self.proxy.list_items(f"/apis/apps/v1/namespaces/{namespace}/deployments",
+                                         headers={"Accept": METADATA_ONLY_ACCEPT})
+        return [{"metadata": {"name": name}} for name in self.get_object_names("deployments", namespace)]
+    
+    def get_events_by_pod(self, namespace: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Get all events in a namespace in one call, grouped by involved object name"""
+        if self.core_v1 is not None:
+            events = self.run_api_list(self.core_v1.list_namespaced_event, namespace)
+        elif self.proxy is not None:
+            events = self.proxy.list_items(f"/api/v1/namespaces/{namespace}/events")
+        else:
+            events = self.run_kubectl_command(["kubectl", "get", "events", "-n", namespace, "-o", "json"]).get("items", [])
+        events_by_pod = defaultdict(list)
+        for event in events:
+            events_by_pod[event.get("involvedObject", {}).get("name")].append(event)
+        return events_by_pod
     
     def is_pod_filtered(self, pod: Dict[str, Any]) -> bool:
         """Check if pod should be filtered out based on configuration"""
-        if not self.config.get('filters'):
-            return False
-            
-        filters = self.config['filters']
         pod_name = pod["metadata"]["name"]
         
         # Check exclude patterns
-        exclude_patterns = filters.get('exclude_pods_pattern', [])
-        for pattern in exclude_patterns:
-            if re.match(pattern, pod_name):
-                logger.debug(f"Pod {pod_name} excluded by pattern {pattern}")
+        if self._exclude_res:
+            if self._exclude_re is not None:
+                excluded = self._exclude_re.match(pod_name) is not None
+            else:
+                excluded = any(pattern.match(pod_name) for pattern in self._exclude_res)
+            if excluded:
+                if logger.isEnabledFor(logging.DEBUG):
+                    pattern = next(p.pattern for p in self._exclude_res if p.match(pod_name))
+                    logger.debug(f"Pod {pod_name} excluded by pattern {pattern}")
                 return True
         
         # Check pod age filter
-        max_age_hours = filters.get('max_pod_age_hours')
-        if max_age_hours:
-            creation_time = datetime.datetime.fromisoformat(
-                pod["metadata"]["creationTimestamp"].replace('Z', '+00:00')
-            )
-            age = datetime.datetime.now(datetime.timezone.utc) - creation_time
-            if age.total_seconds() < max_age_hours * 3600:
+        if self._min_age_seconds:
+            if self._scan_now is None:
+                self.start_scan_clock()
+            creation_timestamp = pod["metadata"]["creationTimestamp"]
+            if len(creation_timestamp) == 20 and creation_timestamp.endswith("Z"):
+                # RFC 3339 in UTC with second precision sorts lexicographically
+                too_young = creation_timestamp > self._min_creation_iso
+            else:
+                creation_time = datetime.datetime.fromisoformat(creation_timestamp.replace('Z', '+00:00'))
+                too_young = creation_time > self._min_creation_dt
+            if too_young:
                 logger.debug(f"Pod {pod_name} too young, skipping")
                 return True
         
         # Check if only running pods should be included
-        if filters.get('include_only_running'):
+        if self._include_only_running:
             if pod["status"].get("phase") != "Running":
                 return True
                 
         return False
     
+    def start_scan_clock(self):
+        """Fix the current time for a scan, so pod ages are judged against one instant"""
+        self._scan_now = datetime.datetime.now(datetime.timezone.utc)
+        if self._min_age_seconds:
+            self._min_creation_dt = self._scan_now - datetime.timedelta(seconds=self._min_age_seconds)
+            self._min_creation_iso = self._min_creation_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    
     def extract_restart_info(self, pod: Dict[str, Any]) -> Dict[str, Any]:
         """Extract restart information from pod data"""
-        pod_name = pod["metadata"]["name"]
-        namespace = pod["metadata"]["namespace"]
+        metadata = pod["metadata"]
+        status = pod["status"]
+        pod_name = metadata["name"]
+        namespace = metadata["namespace"]
+        containers = [summarize_container_status(container) for container in status.get("containerStatuses", [])]
         
         restart_info = {
             "pod_name": pod_name,
             "namespace": namespace,
             "node": pod["spec"].get("nodeName", "Unknown"),
-            "phase": pod["status"].get("phase", "Unknown"),
-            "creation_time": pod["metadata"].get("creationTimestamp", "Unknown"),
-            "containers": []
+            "phase": status.get("phase", "Unknown"),
+            "creation_time": metadata.get("creationTimestamp", "Unknown"),
+            "containers": containers,
+            "max_restarts": max((container["restart_count"] for container in containers), default=0)
         }
         
-        # Check container statuses
-        container_statuses = pod["status"].get("containerStatuses", [])
-        max_restarts = 0
-        
-        for container in container_statuses:
-            restart_count = container.get("restartCount", 0)
-            max_restarts = max(max_restarts, restart_count)
-            
-            container_info = {
-                "name": container["name"],
-                "restart_count": restart_count,
-                "ready": container.get("ready", False),
-                "state": list(container.get("state", {}).keys())[0] if container.get("state") else "Unknown",
-                "image": container.get("image", "Unknown")
-            }
-            
-            # Get last termination reason if available
-            last_state = container.get("lastState", {})
-            if "terminated" in last_state:
-                container_info["last_termination_reason"] = last_state["terminated"].get("reason", "Unknown")
-                container_info["last_termination_time"] = last_state["terminated"].get("finishedAt", "Unknown")
-                container_info["exit_code"] = last_state["terminated"].get("exitCode", "Unknown")
-            
-            restart_info["containers"].append(container_info)
-        
-        restart_info["max_restarts"] = max_restarts
-        
         # Check if this is a new alert or repeated
         pod_key = f"{namespace}/{pod_name}"
-        previous_restarts = self.previous_state.get("pod_restart_counts", {}).get(pod_key, 0)
+        previous_restarts = self._previous_restart_counts.get(pod_key, 0)
         restart_info["is_new_issue"] = restart_info["max_restarts"] > previous_restarts
         restart_info["previous_restart_count"] = previous_restarts
         
         return restart_info
     
     def get_pod_logs_tail(self, namespace: str, pod_name: str, lines: int = 10) -> str:
-        """Get last few lines of pod logs"""
+        """Get last few lines of pod logs, capped at LOG_TAIL_LIMIT_BYTES"""
+        if self.core_v1 is not None:
+            try:
+                return self.core_v1.read_namespaced_pod_log(pod_name, namespace, tail_lines=lines,
+                                                            limit_bytes=LOG_TAIL_LIMIT_BYTES,
+                                                            _request_timeout=5)
+            except Exception:
+                return "Could not retrieve logs"
+        if self.proxy is not None:
+            try:
+                status, body = self.proxy.get(f"/api/v1/namespaces/{namespace}/pods/{pod_name}/log",
+                                              {"tailLines": lines, "limitBytes": LOG_TAIL_LIMIT_BYTES})
+            except (http.client.HTTPException, OSError):
+                return "Could not retrieve logs"
+            return body.decode(errors="replace") if status == 200 else "Could not retrieve logs"
         try:
-            command = ["kubectl", "logs", pod_name, "-n", namespace, "--tail", str(lines)]
+            command = ["kubectl", "logs", pod_name, "-n", namespace, "--tail", str(lines),
+                       f"--limit-bytes={LOG_TAIL_LIMIT_BYTES}"]
             result = subprocess.run(command, capture_output=True, text=True, timeout=10)
             return result.stdout if result.returncode == 0 else "Could not retrieve logs"
         except Exception as e:
@@ -340,64 +777,80 @@ class KubernetesPodMonitor:
             "filtered_pods": 0
         }
         
-        self.statistics["total_namespaces_checked"] += 1
+        # Namespaces are scanned in parallel, so cluster-wide counters are tallied
+        # locally and merged into the shared statistics once at the end
+        totals = Counter(total_namespaces_checked=1)
         
-        # Check if namespace exists
-        try:
-            subprocess.run(
-                ["kubectl", "get", "namespace", namespace], 
-                capture_output=True, 
-                check=True,
-                timeout=10
-            )
+        # Start listing pods straight away: any pod proves the namespace exists, so
+        # the existence probe is only needed when the list comes back empty. (Listing
+        # a missing namespace is not an error; it just returns no items.)
+        pods = self.iter_pods_in_namespace(namespace)
+        first_pod = next(pods, None)
+        if first_pod is not None or self.namespace_exists(namespace):
             namespace_stats["accessible"] = True
-            self.statistics["accessible_namespaces"] += 1
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            totals["accessible_namespaces"] += 1
+        else:
             logger.warning(f"Namespace {namespace} not found or not accessible")
-            self.statistics["inaccessible_namespaces"] += 1
-            self.statistics["namespace_details"][namespace] = namespace_stats
+            totals["inaccessible_namespaces"] += 1
+            self._merge_namespace_statistics(namespace, namespace_stats, totals)
             return alerts
         
-        # Get resources in namespace
-        pods = self.get_pods_in_namespace(namespace)
+        # Get the other resources in namespace; pods are processed as they stream in
         services = self.get_services_in_namespace(namespace)
         deployments = self.get_deployments_in_namespace(namespace)
         
         # Update statistics
-        namespace_stats["pods_count"] = len(pods)
         namespace_stats["services_count"] = len(services)
         namespace_stats["deployments_count"] = len(deployments)
         
-        self.statistics["total_pods_evaluated"] += len(pods)
-        self.statistics["total_services_found"] += len(services)
-        self.statistics["total_deployments_found"] += len(deployments)
+        totals["total_services_found"] += len(services)
+        totals["total_deployments_found"] += len(deployments)
+        
+        # Events for the whole namespace, fetched once on the first alert
+        events_by_pod = None
+        restart_counts = {}
+        # Log tails still being fetched, resolved into their alerts after the loop
+        pending_logs = []
+        # Per-pod tallies stay in locals and are written to the stats once, after the loop
+        pods_count = containers_count = pods_with_restarts = pods_above_threshold = filtered_pods = 0
+        new_alerts = repeated_alerts = 0
         
         # Process each pod
-        for pod in pods:
+        for pod in (itertools.chain((first_pod,), pods) if first_pod is not None else ()):
+            pods_count += 1
+            
             # Check if pod should be filtered
             if self.is_pod_filtered(pod):
-                namespace_stats["filtered_pods"] += 1
+                filtered_pods += 1
+                # Filtered pods are still part of the saved state
+                restart_counts[f"{namespace}/{pod['metadata']['name']}"] = max(
+                    (c.get("restartCount", 0) for c in pod["status"].get("containerStatuses", [])), default=0
+                )
                 continue
                 
             restart_info = self.extract_restart_info(pod)
+            restart_counts[f"{namespace}/{restart_info['pod_name']}"] = restart_info["max_restarts"]
             
             # Count containers
-            container_count = len(restart_info["containers"])
-            namespace_stats["containers_count"] += container_count
-            self.statistics["total_containers_evaluated"] += container_count
+            containers_count += len(restart_info["containers"])
             
             # Check for restarts
             if restart_info["max_restarts"] > 0:
-                namespace_stats["pods_with_restarts"] += 1
-                self.statistics["pods_with_restarts"] += 1
+                pods_with_restarts += 1
             
             if restart_info["max_restarts"] > self.restart_threshold:
-                namespace_stats["pods_above_threshold"] += 1
-                self.statistics["pods_above_threshold"] += 1
+                pods_above_threshold += 1
                 
                 # Get additional information for alerts
-                events = self.get_events_for_pod(namespace, restart_info["pod_name"])
-                recent_logs = self.get_pod_logs_tail(namespace, restart_info["pod_name"])
+                if events_by_pod is None:
+                    events_by_pod = self.get_events_by_pod(namespace)
+                events = events_by_pod.get(restart_info["pod_name"], [])
+                recent_logs = ""
+                log_future = None
+                if self._log_executor is not None:
+                    log_future = self._log_executor.submit(self.get_pod_logs_tail, namespace, restart_info["pod_name"])
+                elif self.fetch_logs:
+                    recent_logs = self.get_pod_logs_tail(namespace, restart_info["pod_name"])
                 
                 alert = {
                     "timestamp": datetime.datetime.now().isoformat(),
@@ -415,12 +868,14 @@ class KubernetesPodMonitor:
                     "severity": self.calculate_alert_severity(restart_info)
                 }
                 alerts.append(alert)
+                if log_future is not None:
+                    pending_logs.append((alert, log_future))
                 
                 # Track new vs repeated alerts
                 if restart_info["is_new_issue"]:
-                    self.statistics["new_alerts"] += 1
+                    new_alerts += 1
                 else:
-                    self.statistics["repeated_alerts"] += 1
+                    repeated_alerts += 1
                 
                 severity_emoji = {"high": "🔥", "medium": "⚠️", "low": "ℹ️"}
                 logger.warning(
@@ -428,7 +883,25 @@ class KubernetesPodMonitor:
                     f"has {restart_info['max_restarts']} restarts (was {restart_info['previous_restart_count']})"
                 )
         
-        self.statistics["namespace_details"][namespace] = namespace_stats
+        for alert, log_future in pending_logs:
+            alert["recent_logs"] = log_future.result()
+        
+        namespace_stats.update(
+            pods_count=pods_count,
+            containers_count=containers_count,
+            pods_with_restarts=pods_with_restarts,
+            pods_above_threshold=pods_above_threshold,
+            filtered_pods=filtered_pods
+        )
+        totals.update(
+            total_pods_evaluated=pods_count,
+            total_containers_evaluated=containers_count,
+            pods_with_restarts=pods_with_restarts,
+            pods_above_threshold=pods_above_threshold,
+            new_alerts=new_alerts,
+            repeated_alerts=repeated_alerts
+        )
+        self._merge_namespace_statistics(namespace, namespace_stats, totals, restart_counts)
         logger.info(f"Namespace {namespace}: {namespace_stats['pods_count']} pods, "
                    f"{namespace_stats['services_count']} services, "
                    f"{namespace_stats['deployments_count']} deployments evaluated "
@@ -436,6 +909,16 @@ class KubernetesPodMonitor:
         
         return alerts
     
+    def _merge_namespace_statistics(self, namespace: str, namespace_stats: Dict[str, Any], totals: Counter,
+                                    restart_counts: Optional[Dict[str, int]] = None):
+        """Fold one namespace's results into the shared statistics"""
+        with self._stats_lock:
+            for key, value in totals.items():
+                self.statistics[key] += value
+            self.statistics["namespace_details"][namespace] = namespace_stats
+            if restart_counts is not None:
+                self._current_restart_counts[namespace] = restart_counts
+    
     def calculate_alert_severity(self, restart_info: Dict[str, Any]) -> str:
         """Calculate severity based on restart count and frequency"""
         restart_count = restart_info["max_restarts"]
@@ -452,11 +935,23 @@ class KubernetesPodMonitor:
         if not self.check_cluster_connectivity():
             return []
         
-        all_alerts = []
+        self.start_scan_clock()
         
-        for namespace in self.namespaces:
-            namespace_alerts = self.check_namespace_for_restarts(namespace)
-            all_alerts.extend(namespace_alerts)
+        # Namespace scans are network bound, so run them side by side
+        if self.fetch_logs:
+            self._log_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(self.namespaces) or 1)) as executor:
+                results = list(executor.map(self.check_namespace_for_restarts, self.namespaces))
+        finally:
+            if self._log_executor is not None:
+                self._log_executor.shutdown()
+                self._log_executor = None
+        all_alerts = [alert for namespace_alerts in results for alert in namespace_alerts]
+        
+        # Keep the namespace breakdown in requested order rather than completion order
+        details = self.statistics["namespace_details"]
+        self.statistics["namespace_details"] = {ns: details[ns] for ns in self.namespaces if ns in details}
         
         self.alerts = all_alerts
         
@@ -474,26 +969,15 @@ class KubernetesPodMonitor:
             logger.info("No alerts to save")
             return
         
+        fieldnames = ['timestamp', 'namespace', 'pod_name', 'restart_count', 
+                     'previous_restart_count', 'is_new_issue', 'severity', 
+                     'status', 'node', 'creation_time']
+        # Alerts carry every column, so rows are plain tuples picked out in one C call
+        row_of = operator.itemgetter(*fieldnames)
         with open(filename, 'w', newline='') as csvfile:
-            fieldnames = ['timestamp', 'namespace', 'pod_name', 'restart_count', 
-                         'previous_restart_count', 'is_new_issue', 'severity', 
-                         'status', 'node', 'creation_time']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for alert in self.alerts:
-                writer.writerow({
-                    'timestamp': alert['timestamp'],
-                    'namespace': alert['namespace'],
-                    'pod_name': alert['pod_name'],
-                    'restart_count': alert['restart_count'],
-                    'previous_restart_count': alert['previous_restart_count'],
-                    'is_new_issue': alert['is_new_issue'],
-                    'severity': alert['severity'],
-                    'status': alert['status'],
-                    'node': alert['node'],
-                    'creation_time': alert['creation_time']
-                })
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(map(row_of, self.alerts))
         
         logger.info(f"Alerts saved to {filename}")
     
@@ -506,8 +990,7 @@ class KubernetesPodMonitor:
             logger.info("No detailed alerts to save")
             return
         
-        with open(filename, 'w') as jsonfile:
-            json.dump(self.alerts, jsonfile, indent=2)
+        write_compact_json(filename, self.alerts)
         
         logger.info(f"Detailed alerts saved to {filename}")
     
@@ -528,74 +1011,80 @@ class KubernetesPodMonitor:
     
     def print_statistics(self):
         """Print detailed monitoring statistics"""
-        print("\n" + "="*70)
-        print("🔍 KUBERNETES MONITORING STATISTICS")
-        print("="*70)
+        # Rendered into a buffer and written in one go rather than line by line
+        lines = []
+        out = lines.append
+        out("\n" + "="*70)
+        out("🔍 KUBERNETES MONITORING STATISTICS")
+        out("="*70)
         
         # Environment info
         env = self.statistics.get("environment", {})
         if env.get("ci"):
-            print(f"🤖 CI ENVIRONMENT:")
-            print(f"   • Job: {env.get('job_name', 'Unknown')}")
-            print(f"   • Pipeline: {env.get('pipeline_id', 'Unknown')}")
-            print(f"   • Output directory: {env.get('output_directory', 'Unknown')}")
+            out(f"🤖 CI ENVIRONMENT:")
+            out(f"   • Job: {env.get('job_name', 'Unknown')}")
+            out(f"   • Pipeline: {env.get('pipeline_id', 'Unknown')}")
+            out(f"   • Output directory: {env.get('output_directory', 'Unknown')}")
         
         # Cluster info
         cluster_info = self.statistics.get("cluster_info", {})
         if cluster_info.get("cluster_accessible"):
-            print(f"🌐 CLUSTER INFO:")
-            print(f"   • Context: {cluster_info.get('current_context', 'Unknown')}")
-            print(f"   • Version: {cluster_info.get('version_info', 'Unknown')}")
+            out(f"🌐 CLUSTER INFO:")
+            out(f"   • Context: {cluster_info.get('current_context', 'Unknown')}")
+            out(f"   • Version: {cluster_info.get('version_info', 'Unknown')}")
         
-        print(f"\n📊 SCAN SUMMARY:")
-        print(f"   • Scan started: {self.statistics['scan_start_time']}")
+        out(f"\n📊 SCAN SUMMARY:")
+        out(f"   • Scan started: {self.statistics['scan_start_time']}")
         if 'scan_duration_seconds' in self.statistics:
-            print(f"   • Duration: {self.statistics['scan_duration_seconds']:.2f} seconds")
-        print(f"   • Total namespaces requested: {len(self.namespaces)}")
-        print(f"   • Namespaces checked: {self.statistics['total_namespaces_checked']}")
-        print(f"   • Accessible namespaces: {self.statistics['accessible_namespaces']}")
-        print(f"   • Inaccessible namespaces: {self.statistics['inaccessible_namespaces']}")
-        
-        print(f"\n🔍 RESOURCES EVALUATED:")
-        print(f"   • Total pods evaluated: {self.statistics['total_pods_evaluated']}")
-        print(f"   • Total containers evaluated: {self.statistics['total_containers_evaluated']}")
-        print(f"   • Total services found: {self.statistics['total_services_found']}")
-        print(f"   • Total deployments found: {self.statistics['total_deployments_found']}")
-        
-        print(f"\n🚨 RESTART ANALYSIS:")
-        print(f"   • Pods with any restarts: {self.statistics['pods_with_restarts']}")
-        print(f"   • Pods above threshold ({self.restart_threshold}): {self.statistics['pods_above_threshold']}")
-        print(f"   • New alerts: {self.statistics['new_alerts']}")
-        print(f"   • Repeated alerts: {self.statistics['repeated_alerts']}")
-        print(f"   • Alert threshold: > {self.restart_threshold} restarts")
+            out(f"   • Duration: {self.statistics['scan_duration_seconds']:.2f} seconds")
+        out(f"   • Total namespaces requested: {len(self.namespaces)}")
+        out(f"   • Namespaces checked: {self.statistics['total_namespaces_checked']}")
+        out(f"   • Accessible namespaces: {self.statistics['accessible_namespaces']}")
+        out(f"   • Inaccessible namespaces: {self.statistics['inaccessible_namespaces']}")
+        
+        out(f"\n🔍 RESOURCES EVALUATED:")
+        out(f"   • Total pods evaluated: {self.statistics['total_pods_evaluated']}")
+        out(f"   • Total containers evaluated: {self.statistics['total_containers_evaluated']}")
+        out(f"   • Total services found: {self.statistics['total_services_found']}")
+        out(f"   • Total deployments found: {self.statistics['total_deployments_found']}")
+        
+        out(f"\n🚨 RESTART ANALYSIS:")
+        out(f"   • Pods with any restarts: {self.statistics['pods_with_restarts']}")
+        out(f"   • Pods above threshold ({self.restart_threshold}): {self.statistics['pods_above_threshold']}")
+        out(f"   • New alerts: {self.statistics['new_alerts']}")
+        out(f"   • Repeated alerts: {self.statistics['repeated_alerts']}")
+        out(f"   • Alert threshold: > {self.restart_threshold} restarts")
         
         if self.statistics['total_pods_evaluated'] > 0:
             restart_percentage = (self.statistics['pods_with_restarts'] / self.statistics['total_pods_evaluated']) * 100
             alert_percentage = (self.statistics['pods_above_threshold'] / self.statistics['total_pods_evaluated']) * 100
-            print(f"   • Pods with restarts: {restart_percentage:.1f}%")
-            print(f"   • Pods triggering alerts: {alert_percentage:.1f}%")
+            out(f"   • Pods with restarts: {restart_percentage:.1f}%")
+            out(f"   • Pods triggering alerts: {alert_percentage:.1f}%")
         
-        print(f"\n📋 NAMESPACE BREAKDOWN:")
+        out(f"\n📋 NAMESPACE BREAKDOWN:")
         for namespace, stats in self.statistics['namespace_details'].items():
             status = "✅ Accessible" if stats['accessible'] else "❌ Inaccessible"
             if stats['accessible']:
-                print(f"   {namespace}: {status}")
-                print(f"      ├─ Pods: {stats['pods_count']} ({stats['containers_count']} containers)")
-                print(f"      ├─ Services: {stats['services_count']}")
-                print(f"      ├─ Deployments: {stats['deployments_count']}")
-                print(f"      ├─ Filtered pods: {stats['filtered_pods']}")
-                print(f"      ├─ Pods with restarts: {stats['pods_with_restarts']}")
-                print(f"      └─ Pods above threshold: {stats['pods_above_threshold']}")
+                out(f"   {namespace}: {status}")
+                out(f"      ├─ Pods: {stats['pods_count']} ({stats['containers_count']} containers)")
+                out(f"      ├─ Services: {stats['services_count']}")
+                out(f"      ├─ Deployments: {stats['deployments_count']}")
+                out(f"      ├─ Filtered pods: {stats['filtered_pods']}")
+                out(f"      ├─ Pods with restarts: {stats['pods_with_restarts']}")
+                out(f"      └─ Pods above threshold: {stats['pods_above_threshold']}")
             else:
-                print(f"   {namespace}: {status}")
+                out(f"   {namespace}: {status}")
         
-        print("="*70)
+        out("="*70)
+        write_lines(lines)
 
     def print_alerts_summary(self):
         """Print a summary of the alerts found"""
+        lines = []
+        out = lines.append
         if self.alerts:
-            print(f"\n🚨 RESTART ALERTS DETAILS ({len(self.alerts)} alerts)")
-            print("="*70)
+            out(f"\n🚨 RESTART ALERTS DETAILS ({len(self.alerts)} alerts)")
+            out("="*70)
             
             # Group alerts by severity
             severity_groups = {"high": [], "medium": [], "low": []}
@@ -605,37 +1094,38 @@ class KubernetesPodMonitor:
             for severity in ["high", "medium", "low"]:
                 if severity_groups[severity]:
                     severity_emoji = {"high": "🔥", "medium": "⚠️", "low": "ℹ️"}
-                    print(f"\n{severity_emoji[severity]} {severity.upper()} SEVERITY ALERTS ({len(severity_groups[severity])})")
-                    print("-" * 50)
+                    out(f"\n{severity_emoji[severity]} {severity.upper()} SEVERITY ALERTS ({len(severity_groups[severity])})")
+                    out("-" * 50)
                     
                     for alert in severity_groups[severity]:
                         new_badge = "🆕 NEW" if alert['is_new_issue'] else "🔄 REPEAT"
-                        print(f"{new_badge} - {alert['namespace']}/{alert['pod_name']}")
-                        print(f"   Restarts: {alert['restart_count']} (was {alert['previous_restart_count']})")
-                        print(f"   Status: {alert['status']} | Node: {alert['node']}")
-                        print(f"   Created: {alert['creation_time']}")
+                        out(f"{new_badge} - {alert['namespace']}/{alert['pod_name']}")
+                        out(f"   Restarts: {alert['restart_count']} (was {alert['previous_restart_count']})")
+                        out(f"   Status: {alert['status']} | Node: {alert['node']}")
+                        out(f"   Created: {alert['creation_time']}")
                         
                         # Container details
-                        print("   Containers:")
+                        out("   Containers:")
                         for container in alert['containers']:
                             state_emoji = "✅" if container['ready'] else "❌"
-                            print(f"      {state_emoji} {container['name']}: {container['restart_count']} restarts ({container['state']})")
+                            out(f"      {state_emoji} {container['name']}: {container['restart_count']} restarts ({container['state']})")
                             if 'last_termination_reason' in container:
-                                print(f"         Last exit: {container['last_termination_reason']} (code: {container.get('exit_code', 'N/A')})")
+                                out(f"         Last exit: {container['last_termination_reason']} (code: {container.get('exit_code', 'N/A')})")
                         
                         # Show recent logs if available
                         if alert.get('recent_logs') and alert['recent_logs'] != "Could not retrieve logs":
-                            print(f"   Recent logs preview:")
+                            out(f"   Recent logs preview:")
                             log_lines = alert['recent_logs'].split('\n')[:3]  # First 3 lines
                             for line in log_lines:
                                 if line.strip():
-                                    print(f"      {line[:80]}...")
+                                    out(f"      {line[:80]}...")
                         
-                        print()
+                        out("")
             
         else:
-            print(f"\n✅ No pods found with restart count > {self.restart_threshold}")
-            print("="*70)
+            out(f"\n✅ No pods found with restart count > {self.restart_threshold}")
+            out("="*70)
+        write_lines(lines)
 
 def main():
     parser = argparse.ArgumentParser(description='Enhanced Kubernetes pod restart monitor')
@@ -657,6 +1147,11 @@ def main():
                        help='Run continuously, monitoring every few minutes')
     parser.add_argument('--watch-interval', type=int, default=300,
                        help='Watch mode interval in seconds (default: 300)')
+    parser.add_argument('--kubectl-proxy', action='store_true',
+                       help='Without the kubernetes Python client, query the API through one kubectl proxy '
+                            'instead of running kubectl for every call')
+    parser.add_argument('--fetch-logs', action='store_true',
+                       help='Attach the last log lines of each alerting pod (slower)')
     
     args = parser.parse_args()
     
@@ -672,15 +1167,21 @@ def main():
     if not namespaces:
         parser.error("No namespaces specified. Use --namespaces or provide config file with namespaces.")
     
+    if args.fetch_logs:
+        config.setdefault('monitoring', {})['fetch_logs'] = True
+    
     # Get threshold from config if not specified
     threshold = args.threshold
     if config.get('monitoring', {}).get('restart_threshold'):
         threshold = config['monitoring']['restart_threshold']
     
-    def run_monitoring():
+    # One proxy serves every scan; it is only needed when the API client is missing
+    proxy = KubectlProxy.start() if args.kubectl_proxy and k8s_client is None else None
+    
+    def run_monitoring(pod_cache: Optional[PodWatchCache] = None):
         """Run a single monitoring cycle"""
         # Create monitor instance
-        monitor = KubernetesPodMonitor(namespaces, threshold, config)
+        monitor = KubernetesPodMonitor(namespaces, threshold, config, pod_cache, proxy)
         
         # Run monitoring
         logger.info("Starting Kubernetes pod restart monitoring...")
@@ -706,9 +1207,11 @@ def main():
     
     if args.watch:
         logger.info(f"Starting watch mode - monitoring every {args.watch_interval} seconds")
+        # Pods are followed through API watches between scans instead of re-listed each time
+        pod_cache = PodWatchCache.start_for(namespaces)
         try:
             while True:
-                alert_count = run_monitoring()
+                alert_count = run_monitoring(pod_cache)
                 print(f"\n💤 Sleeping for {args.watch_interval} seconds... (Ctrl+C to stop)")
                 time.sleep(args.watch_interval)
         except KeyboardInterrupt:
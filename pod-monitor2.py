@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 import os
 import sys
+import json
 import time
+import errno
+import socket
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3.util.connection
 import argparse
 import concurrent.futures
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 
 try:
@@ -16,7 +22,120 @@ except ImportError:
     print("❌ Error: kubernetes library not found. Install with: pip install kubernetes")
     sys.exit(1)
 
-@dataclass
+try:
+    import aiohttp  # probe all endpoints from one event loop
+except ImportError:
+    aiohttp = None  # fall back to requests on the worker threads
+
+try:
+    import httpx  # preferred over aiohttp: HTTP/2 multiplexes probes to a host on one connection
+    import h2  # noqa: F401  needed by httpx for HTTP/2
+except ImportError:
+    httpx = None
+
+# Pod labels that tie a pod to its app, in the order they are tried
+APP_LABELS = ["app", "app.kubernetes.io/name", "k8s-app"]
+
+# Objects per LIST page, bounding the size of each response
+POD_LIST_PAGE_SIZE = 500
+
+# Ask the apiserver for object metadata only, when names are all that is needed
+METADATA_ONLY_ACCEPT = "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,application/json"
+
+# Above this many namespaces, one cluster-wide LIST per resource replaces the
+# per-namespace LISTs
+PER_NAMESPACE_LIST_MAX = 3
+
+# Namespaces created by Kubernetes itself, excluded server-side when listing
+# "all". Namespace field selectors only support exact names, so other kube-*
+# namespaces are still dropped client-side.
+SYSTEM_NAMESPACES_SELECTOR = ",".join(
+    f"metadata.name!={name}" for name in ("kube-system", "kube-public", "kube-node-lease"))
+
+# Seconds allowed to establish a probe connection; a live host connects in
+# milliseconds, so a dead one should not hold a probe for the full --timeout
+PROBE_CONNECT_TIMEOUT = 2
+
+# How long a resolved ingress host is reused before it is looked up again
+DNS_CACHE_TTL = 300
+
+_dns_cache: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+_urllib3_create_connection = urllib3.util.connection.create_connection
+
+def resolve_host(host: str, port: int) -> List[str]:
+    """Addresses for host, cached for DNS_CACHE_TTL seconds.
+    
+    Python has no resolver cache of its own, so without this every probe of
+    every health path repeats the getaddrinfo lookup. Failures are not
+    cached and raise socket.gaierror as an uncached lookup would.
+    """
+    now = time.monotonic()
+    cached = _dns_cache.get((host, port))
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    addresses = list(dict.fromkeys(
+        info[4][0] for info in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    ))
+    _dns_cache[(host, port)] = (now + DNS_CACHE_TTL, addresses)
+    return addresses
+
+def create_connection_with_dns_cache(address, *args, **kwargs):
+    """urllib3's create_connection, resolving the host through resolve_host"""
+    host, port = address
+    host = host.strip("[]")  # IPv6 literal
+    last_error = None
+    for ip in resolve_host(host, port):
+        try:
+            return _urllib3_create_connection((ip, port), *args, **kwargs)
+        except OSError as e:
+            last_error = e
+    raise last_error or OSError(f"No addresses found for {host}")
+
+# Progress lines are buffered and written in batches of this many
+PROGRESS_FLUSH_EVERY = 32
+
+# Result table rows, formatted with % so the column specs are not re-parsed per row
+INGRESS_ROW_FORMAT = "%s %-18s %-12s %-8s %-15s %-10s %-40s %s"
+INTERNAL_ROW_FORMAT = "%s %-23s %-15s %-12s %-8s %s"
+
+def connection_error_cause(error: BaseException) -> Optional[OSError]:
+    """The socket error behind a requests ConnectionError, if any.
+    
+    requests wraps urllib3's MaxRetryError, whose reason is a NewConnectionError
+    raised from the socket error; the chain is followed by type so the (often
+    long) exception text never has to be rendered and searched.
+    """
+    pending = [error]
+    seen = set()
+    while pending:
+        error = pending.pop()
+        if error is None or id(error) in seen:
+            continue
+        seen.add(id(error))
+        if isinstance(error, socket.gaierror) or (isinstance(error, OSError) and error.errno == errno.ECONNREFUSED):
+            return error
+        pending.extend((getattr(error, "reason", None), error.__cause__, error.__context__))
+        pending.extend(arg for arg in error.args if isinstance(arg, BaseException))
+    return None
+
+def write_lines(lines: List[str]):
+    """Write lines to stdout with a single write and flush"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def pod_phase_and_readiness(pod: Dict[str, Any]) -> Tuple[str, bool]:
+    """Reduce a raw pod object to its phase and whether its Ready condition is True"""
+    status = pod.get("status") or {}
+    ready = any(condition.get("type") == "Ready" and condition.get("status") == "True"
+                for condition in status.get("conditions") or [])
+    return status.get("phase"), ready
+
+# Result objects are created per app, so drop their per-instance __dict__
+# where dataclasses support it (Python 3.10+). They stay mutable: the HTTP
+# fields are filled in after discovery.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_SLOTS)
 class AppHealth:
     """Complete health status for an application"""
     name: str
@@ -31,15 +150,91 @@ class AppHealth:
     ingress_class: Optional[str] = None
     error_details: Optional[str] = None
 
+@dataclass(**DATACLASS_SLOTS)
+class IngressEntry:
+    """The parts of an ingress used to match it to apps, worked out once per ingress"""
+    name_lower: str
+    service_names_lower: List[str]
+    app_label_lower: str
+    url: Optional[str]
+    ingress_class: str
+
+    @classmethod
+    def from_ingress(cls, ingress) -> "IngressEntry":
+        # Get ingress class
+        ingress_class = "unknown"
+        if ingress.spec.ingress_class_name:
+            ingress_class = ingress.spec.ingress_class_name
+        elif ingress.metadata.annotations:
+            ingress_class = ingress.metadata.annotations.get(
+                'kubernetes.io/ingress.class', 
+                ingress.metadata.annotations.get('nginx.ingress.kubernetes.io/ingress.class', 'unknown')
+            )
+        
+        # Backend services, and the URL of the first rule with a host
+        service_names = []
+        url = None
+        for rule in ingress.spec.rules or []:
+            if rule.http and rule.http.paths:
+                for path in rule.http.paths:
+                    if path.backend and path.backend.service:
+                        service_names.append(path.backend.service.name.lower())
+            if rule.host and url is None:
+                # Check for TLS
+                tls_enabled = any(rule.host in (tls.hosts or []) for tls in ingress.spec.tls or [])
+                scheme = "https" if tls_enabled else "http"
+                
+                # Build URL
+                if rule.http and rule.http.paths:
+                    path = rule.http.paths[0].path or "/"
+                    url = f"{scheme}://{rule.host}{path}".rstrip('/')
+                else:
+                    url = f"{scheme}://{rule.host}"
+        
+        labels = ingress.metadata.labels or {}
+        return cls(
+            name_lower=ingress.metadata.name.lower(),
+            service_names_lower=service_names,
+            app_label_lower=labels.get('app', '').lower(),
+            url=url,
+            ingress_class=ingress_class
+        )
+
+    def matches_app(self, app_name_lower: str) -> bool:
+        """Check if the ingress is related to the app, by name, backend service or app label"""
+        if app_name_lower in self.name_lower or self.name_lower in app_name_lower:
+            return True
+        for service_name in self.service_names_lower:
+            if app_name_lower in service_name or service_name in app_name_lower:
+                return True
+        return self.app_label_lower == app_name_lower
+
 class CompleteHealthChecker:
     def __init__(self, 
                  namespaces: List[str] = None,
                  timeout: int = 10,
-                 max_workers: int = 20):
+                 max_workers: int = 20,
+                 probe_dead: bool = False):
         self.namespaces = namespaces or ["default"]
-        self.health_paths = ["/health", "/healthz", "/health.html", "/ping", "/api/health", "/status"]
+        # Each path starts with "/" and is appended to the ingress URL minus its trailing "/"
+        self.health_paths = ("/health", "/healthz", "/health.html", "/ping", "/api/health", "/status")
         self.timeout = timeout
+        self.connect_timeout = min(PROBE_CONNECT_TIMEOUT, timeout)
         self.max_workers = max_workers
+        # Probe ingresses of apps without any pods too (they can only fail)
+        self.probe_dead = probe_dead
+        
+        # requests connects through urllib3; route its lookups through the DNS cache
+        urllib3.util.connection.create_connection = create_connection_with_dns_cache
+        
+        # One pooled session, so the health paths of an app (and apps behind the
+        # same host) reuse a kept-alive connection instead of reconnecting each time
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers * 2, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Probes skip certificate verification on purpose, so do not warn on every request
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         
         # Initialize Kubernetes client
         try:
@@ -50,29 +245,66 @@ class CompleteHealthChecker:
                 config.load_kube_config()
                 print("🔧 Using local Kubernetes configuration")
                 
-            self.v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
-            self.networking_v1 = client.NetworkingV1Api()
+            # One ApiClient (and connection pool) for all three APIs. The Python
+            # client can only decode JSON, so rather than protobuf ask for gzip:
+            # the apiserver compresses large responses and urllib3 inflates them
+            api_client = client.ApiClient()
+            api_client.set_default_header("Accept-Encoding", "gzip")
+            self.v1 = client.CoreV1Api(api_client)
+            self.apps_v1 = client.AppsV1Api(api_client)
+            self.networking_v1 = client.NetworkingV1Api(api_client)
         except Exception as e:
             print(f"❌ Failed to initialize Kubernetes client: {e}")
             sys.exit(1)
+        
+        # Pods and ingresses listed once per check, indexed by namespace. A namespace
+        # missing from an index (not listed, or its list failed) is queried directly.
+        self.pod_index: Dict[str, Dict[Tuple[str, str], list]] = {}
+        self.ingress_index: Dict[str, list] = {}
+        # Runs the per-label pod LISTs of unindexed namespaces side by side
+        self.label_list_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    def lists_cluster_wide(self) -> bool:
+        """Whether resources are listed once for the cluster rather than per namespace"""
+        return "all" in self.namespaces or len(self.namespaces) > PER_NAMESPACE_LIST_MAX
 
     def get_all_deployments(self) -> Dict[str, List[str]]:
-        """Get ALL deployments across namespaces"""
+        """Get ALL deployments across namespaces
+        
+        Every LIST here and below passes resourceVersion "0", so the apiserver
+        answers from its watch cache instead of a quorum read from etcd. The
+        data may be a moment stale, which is fine for a health report.
+        """
         all_deployments = {}
         
+        # One cluster-wide LIST, grouped here and filtered to the checked namespaces
+        names_by_namespace = None
+        if self.lists_cluster_wide():
+            try:
+                names_by_namespace = {}
+                for item in self.list_deployment_metadata():
+                    metadata = item["metadata"]
+                    names_by_namespace.setdefault(metadata["namespace"], []).append(metadata["name"])
+            except ApiException as e:
+                # e.g. forbidden under namespace-scoped RBAC; each namespace is listed on its own
+                names_by_namespace = None
+                print(f"⚠️  Could not list deployments cluster-wide, querying per namespace: {e}")
+        
         for namespace in self.namespaces:
             try:
                 if namespace == "all":
-                    ns_list = self.v1.list_namespace()
+                    ns_list = self.v1.list_namespace(resource_version="0",
+                                                     field_selector=SYSTEM_NAMESPACES_SELECTOR)
                     target_namespaces = [ns.metadata.name for ns in ns_list.items 
                                        if not ns.metadata.name.startswith('kube-')]
                 else:
                     target_namespaces = [namespace]
                 
                 for ns in target_namespaces:
-                    deployments = self.apps_v1.list_namespaced_deployment(namespace=ns)
-                    deployment_names = [dep.metadata.name for dep in deployments.items]
+                    if names_by_namespace is not None:
+                        deployment_names = names_by_namespace.get(ns, [])
+                    else:
+                        deployment_names = [item["metadata"]["name"] for item in self.list_deployment_metadata(ns)]
                     if deployment_names:
                         all_deployments[ns] = deployment_names
                         
@@ -81,39 +313,145 @@ class CompleteHealthChecker:
         
         return all_deployments
 
+    def list_deployment_metadata(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Metadata of the deployments in a namespace, or in all namespaces when none is given"""
+        if namespace is None:
+            resource_path, path_params = "/apis/apps/v1/deployments", {}
+        else:
+            resource_path, path_params = "/apis/apps/v1/namespaces/{namespace}/deployments", {"namespace": namespace}
+        response = self.apps_v1.api_client.call_api(
+            resource_path, "GET",
+            path_params=path_params,
+            query_params=[("resourceVersion", "0")],
+            header_params={"Accept": METADATA_ONLY_ACCEPT},
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+            _preload_content=False
+        )
+        return json.loads(response.data).get("items", [])
+
+    def list_raw_items(self, list_call, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Yield the raw JSON items of a LIST call, fetched in pages.
+        
+        The response is parsed with json instead of the client's model
+        deserializer, which costs far more than the transfer for large lists.
+        """
+        page_kwargs = kwargs
+        while True:
+            response = list_call(limit=POD_LIST_PAGE_SIZE, _preload_content=False, **page_kwargs)
+            page = json.loads(response.data)
+            yield from page.get("items", [])
+            continue_token = (page.get("metadata") or {}).get("continue")
+            if not continue_token:
+                return
+            # A resourceVersion may not be combined with a continue token
+            page_kwargs = {key: value for key, value in kwargs.items() if key != "resource_version"}
+            page_kwargs["_continue"] = continue_token
+
+    def build_resource_index(self, namespaces: List[str]):
+        """List pods and ingresses once and index them for the per-app lookups.
+        
+        One LIST per namespace (or one for the whole cluster when checking
+        "all" or more than PER_NAMESPACE_LIST_MAX namespaces) replaces a pod
+        LIST per app and label selector and an ingress LIST per app.
+        """
+        pod_index = {}
+        ingress_index = {}
+        
+        if self.lists_cluster_wide():
+            try:
+                pod_index = {namespace: {} for namespace in namespaces}
+                for pod in self.list_raw_items(self.v1.list_pod_for_all_namespaces, resource_version="0"):
+                    namespace_index = pod_index.get(pod["metadata"].get("namespace"))
+                    if namespace_index is not None:
+                        self._index_pod(namespace_index, pod)
+            except ApiException as e:
+                pod_index = {}
+                print(f"⚠️  Could not list pods cluster-wide, querying per app: {e}")
+            try:
+                ingresses = self.networking_v1.list_ingress_for_all_namespaces(resource_version="0").items
+                ingress_index = {namespace: [] for namespace in namespaces}
+                for ingress in ingresses:
+                    if ingress.metadata.namespace in ingress_index:
+                        ingress_index[ingress.metadata.namespace].append(IngressEntry.from_ingress(ingress))
+            except ApiException as e:
+                print(f"⚠️  Could not list ingresses cluster-wide, querying per app: {e}")
+        else:
+            for namespace in namespaces:
+                try:
+                    namespace_index = {}
+                    for pod in self.list_raw_items(self.v1.list_namespaced_pod, namespace=namespace,
+                                                   resource_version="0"):
+                        self._index_pod(namespace_index, pod)
+                    pod_index[namespace] = namespace_index
+                except ApiException:
+                    pass  # reported per app by get_pod_status
+                try:
+                    ingress_index[namespace] = [IngressEntry.from_ingress(ingress) for ingress in
+                                                self.networking_v1.list_namespaced_ingress(
+                                                    namespace=namespace, resource_version="0").items]
+                except ApiException:
+                    pass  # reported per app by find_ingress_for_app
+        
+        self.pod_index = pod_index
+        self.ingress_index = ingress_index
+
+    def list_pod_states(self, namespace: str, label_selector: str) -> List[Tuple[str, bool]]:
+        """Phase and readiness of the pods matching a label selector"""
+        return [pod_phase_and_readiness(pod) for pod in self.list_raw_items(
+            self.v1.list_namespaced_pod, namespace=namespace, label_selector=label_selector,
+            resource_version="0")]
+
+    @staticmethod
+    def _index_pod(namespace_index: Dict[Tuple[str, str], list], pod: Dict[str, Any]):
+        """Add a pod's phase and readiness under each of its app labels"""
+        labels = pod["metadata"].get("labels") or {}
+        state = None
+        for label in APP_LABELS:
+            if label in labels:
+                # Only the state is kept, not the whole pod object
+                state = state or pod_phase_and_readiness(pod)
+                namespace_index.setdefault((label, labels[label]), []).append(state)
+
     def get_pod_status(self, namespace: str, app_name: str) -> Tuple[str, int, int]:
         """Get detailed pod status for an app"""
         try:
-            label_selectors = [
-                f"app={app_name}",
-                f"app.kubernetes.io/name={app_name}",
-                f"k8s-app={app_name}"
-            ]
-            
-            pods = None
-            for selector in label_selectors:
-                pods = self.v1.list_namespaced_pod(namespace=namespace, label_selector=selector)
-                if pods.items:
-                    break
+            pods = []
+            namespace_index = self.pod_index.get(namespace)
+            if namespace_index is not None:
+                for label in APP_LABELS:
+                    pods = namespace_index.get((label, app_name), [])
+                    if pods:
+                        break
+            else:
+                # Not indexed: issue one LIST per label at once, then take the
+                # first non-empty result in label order
+                futures = [
+                    self.label_list_executor.submit(self.list_pod_states, namespace, f"{label}={app_name}")
+                    for label in APP_LABELS
+                ]
+                for future in futures:
+                    pods = future.result()
+                    if pods:
+                        break
+                for future in futures:
+                    future.cancel()
             
-            if not pods or not pods.items:
+            if not pods:
                 return "No Pods", 0, 0
             
-            total_pods = len(pods.items)
+            total_pods = len(pods)
             ready_pods = 0
             running_pods = 0
             
-            for pod in pods.items:
+            for phase, ready in pods:
                 # Check if pod is running
-                if pod.status.phase == "Running":
+                if phase == "Running":
                     running_pods += 1
                 
                 # Check if pod is ready
-                if pod.status.conditions:
-                    for condition in pod.status.conditions:
-                        if condition.type == "Ready" and condition.status == "True":
-                            ready_pods += 1
-                            break
+                if ready:
+                    ready_pods += 1
             
             # Determine overall status
             if ready_pods == total_pods and total_pods > 0:
@@ -131,144 +469,209 @@ class CompleteHealthChecker:
     def find_ingress_for_app(self, namespace: str, app_name: str) -> Optional[Tuple[str, str]]:
         """Find ingress URL for an app. Returns (url, ingress_class) or None"""
         try:
-            ingresses = self.networking_v1.list_namespaced_ingress(namespace=namespace)
+            entries = self.ingress_index.get(namespace)
+            if entries is None:
+                entries = [IngressEntry.from_ingress(ingress) for ingress in
+                           self.networking_v1.list_namespaced_ingress(
+                               namespace=namespace, resource_version="0").items]
             
-            for ingress in ingresses.items:
-                # Check if this ingress relates to our app
-                if self.ingress_matches_app(ingress, app_name):
-                    # Get ingress class
-                    ingress_class = "unknown"
-                    if ingress.spec.ingress_class_name:
-                        ingress_class = ingress.spec.ingress_class_name
-                    elif ingress.metadata.annotations:
-                        ingress_class = ingress.metadata.annotations.get(
-                            'kubernetes.io/ingress.class', 
-                            ingress.metadata.annotations.get('nginx.ingress.kubernetes.io/ingress.class', 'unknown')
-                        )
-                    
-                    # Extract URL
-                    if ingress.spec.rules:
-                        for rule in ingress.spec.rules:
-                            if rule.host:
-                                # Check for TLS
-                                tls_enabled = False
-                                if ingress.spec.tls:
-                                    for tls in ingress.spec.tls:
-                                        if rule.host in (tls.hosts or []):
-                                            tls_enabled = True
-                                            break
-                                
-                                scheme = "https" if tls_enabled else "http"
-                                
-                                # Build URL
-                                if rule.http and rule.http.paths:
-                                    path = rule.http.paths[0].path or "/"
-                                    url = f"{scheme}://{rule.host}{path}".rstrip('/')
-                                else:
-                                    url = f"{scheme}://{rule.host}"
-                                
-                                return url, ingress_class
+            app_name_lower = app_name.lower()
+            for entry in entries:
+                # First related ingress that exposes a host
+                if entry.url is not None and entry.matches_app(app_name_lower):
+                    return entry.url, entry.ingress_class
                                 
         except ApiException as e:
             print(f"   ⚠️  Could not check ingress for {app_name}: {e}")
         
         return None
 
-    def ingress_matches_app(self, ingress, app_name: str) -> bool:
-        """Check if an ingress is related to the app"""
-        ingress_name = ingress.metadata.name.lower()
-        app_name_lower = app_name.lower()
-        
-        # Direct name match
-        if app_name_lower in ingress_name or ingress_name in app_name_lower:
-            return True
-        
-        # Check backend services
-        if ingress.spec.rules:
-            for rule in ingress.spec.rules:
-                if rule.http and rule.http.paths:
-                    for path in rule.http.paths:
-                        if path.backend and path.backend.service:
-                            service_name = path.backend.service.name.lower()
-                            if app_name_lower in service_name or service_name in app_name_lower:
-                                return True
-        
-        # Check labels
-        if ingress.metadata.labels:
-            app_label = ingress.metadata.labels.get('app', '').lower()
-            if app_label == app_name_lower:
-                return True
-        
-        return False
+    @staticmethod
+    def health_path_result(path: str, status_code: int,
+                           response_time: float) -> Optional[Tuple[str, Optional[float], Optional[str]]]:
+        """Result for the response of a health path, or None on 404 to try the next path"""
+        if status_code == 200:
+            return "UP", response_time, f"Health endpoint: {path}"
+        elif status_code == 404:
+            return None
+        else:
+            return f"HTTP {status_code}", response_time, f"Health endpoint {path} returned {status_code}"
+
+    @staticmethod
+    def base_url_result(status_code: int, response_time: float) -> Tuple[str, Optional[float], Optional[str]]:
+        """Result for the response of the base URL, once no health path answered"""
+        if status_code == 200:
+            return "UP (Base)", response_time, "No health endpoint, but base URL works"
+        elif status_code == 404:
+            return "HTTP 404", response_time, "Base URL returns 404 Not Found"
+        elif status_code == 503:
+            return "HTTP 503", response_time, "Service Unavailable - app may be down"
+        elif status_code == 502:
+            return "HTTP 502", response_time, "Bad Gateway - upstream service issue"
+        elif status_code == 500:
+            return "HTTP 500", response_time, "Internal Server Error"
+        else:
+            return f"HTTP {status_code}", response_time, f"Base URL returned {status_code}"
 
     def check_health_endpoint(self, url: str) -> Tuple[str, Optional[float], Optional[str]]:
         """Check health endpoint and return (status, response_time, error_details)"""
         start_time = time.time()
         
         # Try health-specific paths first
+        base_url = url.rstrip("/")
         for path in self.health_paths:
             try:
-                test_url = f"{url}{path}".replace("//", "/").replace(":/", "://")
-                response = requests.get(test_url, timeout=self.timeout, verify=False)
+                test_url = base_url + path
+                response = self.session.get(test_url, timeout=(self.connect_timeout, self.timeout), verify=False)
                 response_time = round((time.time() - start_time) * 1000, 2)
                 
-                if response.status_code == 200:
-                    return "UP", response_time, f"Health endpoint: {path}"
-                elif response.status_code == 404:
+                result = self.health_path_result(path, response.status_code, response_time)
+                if result is None:
                     continue  # Try next path
-                else:
-                    return f"HTTP {response.status_code}", response_time, f"Health endpoint {path} returned {response.status_code}"
+                return result
                     
+            # A host that cannot be reached fails every path alike, so give up on
+            # it at once; only a 404 moves on to the next path.
+            # SSLError is a ConnectionError, so it has to be caught first.
+            except requests.exceptions.SSLError as e:
+                return "SSL Error", None, f"SSL certificate error: {str(e)}"
             except requests.exceptions.ConnectionError as e:
-                error_detail = f"Connection failed to {test_url}: {str(e)}"
-                if "Name or service not known" in str(e) or "nodename nor servname provided" in str(e):
+                cause = connection_error_cause(e)
+                if isinstance(cause, socket.gaierror):
                     return "DNS Failed", None, f"DNS resolution failed for {test_url}"
-                elif "Connection refused" in str(e):
+                elif cause is not None:
                     return "Connection Refused", None, f"Connection refused to {test_url}"
                 else:
-                    continue  # Try next path
+                    return "Connection Failed", None, f"Cannot connect to {test_url}: {str(e)}"
                     
             except requests.exceptions.Timeout:
                 return "Timeout", self.timeout * 1000, f"Timeout after {self.timeout}s trying {test_url}"
-            except requests.exceptions.SSLError as e:
-                return "SSL Error", None, f"SSL certificate error: {str(e)}"
             except Exception as e:
                 continue  # Try next path
         
         # If no health endpoints work, try base URL
         try:
-            response = requests.get(url, timeout=self.timeout, verify=False)
+            response = self.session.get(url, timeout=(self.connect_timeout, self.timeout), verify=False)
             response_time = round((time.time() - start_time) * 1000, 2)
-            
-            if response.status_code == 200:
-                return "UP (Base)", response_time, "No health endpoint, but base URL works"
-            elif response.status_code == 404:
-                return "HTTP 404", response_time, "Base URL returns 404 Not Found"
-            elif response.status_code == 503:
-                return "HTTP 503", response_time, "Service Unavailable - app may be down"
-            elif response.status_code == 502:
-                return "HTTP 502", response_time, "Bad Gateway - upstream service issue"
-            elif response.status_code == 500:
-                return "HTTP 500", response_time, "Internal Server Error"
-            else:
-                return f"HTTP {response.status_code}", response_time, f"Base URL returned {response.status_code}"
+            return self.base_url_result(response.status_code, response_time)
                 
+        except requests.exceptions.SSLError as e:
+            return "SSL Error", None, f"SSL certificate error: {str(e)}"
         except requests.exceptions.ConnectionError as e:
-            if "Name or service not known" in str(e):
+            cause = connection_error_cause(e)
+            if isinstance(cause, socket.gaierror):
                 return "DNS Failed", None, f"DNS resolution failed for {url}"
-            elif "Connection refused" in str(e):
+            elif cause is not None:
                 return "Connection Refused", None, f"Connection refused to {url}"
             else:
                 return "Connection Failed", None, f"Cannot connect to {url}: {str(e)}"
         except requests.exceptions.Timeout:
             return "Timeout", self.timeout * 1000, f"Request timeout after {self.timeout}s"
-        except requests.exceptions.SSLError as e:
-            return "SSL Error", None, f"SSL certificate error: {str(e)}"
         except Exception as e:
             return "Request Failed", None, f"HTTP request failed: {str(e)}"
 
-    def check_app_health(self, namespace: str, app_name: str) -> AppHealth:
-        """Check complete health for a single app"""
+    async def check_health_endpoint_async(self, session, url: str) -> Tuple[str, Optional[float], Optional[str]]:
+        """check_health_endpoint on an aiohttp session, with the same results"""
+        start_time = time.time()
+        
+        # Try health-specific paths first
+        base_url = url.rstrip("/")
+        for path in self.health_paths:
+            test_url = base_url + path
+            try:
+                async with session.get(test_url) as response:
+                    status_code = response.status
+                response_time = round((time.time() - start_time) * 1000, 2)
+                
+                result = self.health_path_result(path, status_code, response_time)
+                if result is None:
+                    continue  # Try next path
+                return result
+                    
+            except asyncio.TimeoutError:
+                return "Timeout", self.timeout * 1000, f"Timeout after {self.timeout}s trying {test_url}"
+            except aiohttp.ClientConnectorError as e:
+                # Unreachable host: the remaining paths would fail the same way
+                if isinstance(e.os_error, socket.gaierror):
+                    return "DNS Failed", None, f"DNS resolution failed for {test_url}"
+                elif isinstance(e.os_error, ConnectionRefusedError):
+                    return "Connection Refused", None, f"Connection refused to {test_url}"
+                else:
+                    return "Connection Failed", None, f"Cannot connect to {test_url}: {str(e)}"
+            except Exception:
+                continue  # Try next path
+        
+        # If no health endpoints work, try base URL
+        try:
+            async with session.get(url) as response:
+                status_code = response.status
+            response_time = round((time.time() - start_time) * 1000, 2)
+            return self.base_url_result(status_code, response_time)
+                
+        except asyncio.TimeoutError:
+            return "Timeout", self.timeout * 1000, f"Request timeout after {self.timeout}s"
+        except aiohttp.ClientConnectorError as e:
+            if isinstance(e.os_error, socket.gaierror):
+                return "DNS Failed", None, f"DNS resolution failed for {url}"
+            elif isinstance(e.os_error, ConnectionRefusedError):
+                return "Connection Refused", None, f"Connection refused to {url}"
+            else:
+                return "Connection Failed", None, f"Cannot connect to {url}: {str(e)}"
+        except Exception as e:
+            return "Request Failed", None, f"HTTP request failed: {str(e)}"
+
+    async def check_health_endpoint_http2(self, client, url: str) -> Tuple[str, Optional[float], Optional[str]]:
+        """check_health_endpoint on an httpx HTTP/2 client, with the same results"""
+        start_time = time.time()
+        
+        # Try health-specific paths first
+        base_url = url.rstrip("/")
+        for path in self.health_paths:
+            test_url = base_url + path
+            try:
+                response = await client.get(test_url)
+                response_time = round((time.time() - start_time) * 1000, 2)
+                
+                result = self.health_path_result(path, response.status_code, response_time)
+                if result is None:
+                    continue  # Try next path
+                return result
+                    
+            except httpx.TimeoutException:
+                return "Timeout", self.timeout * 1000, f"Timeout after {self.timeout}s trying {test_url}"
+            except httpx.ConnectError as e:
+                # Unreachable host: the remaining paths would fail the same way
+                cause = connection_error_cause(e)
+                if isinstance(cause, socket.gaierror):
+                    return "DNS Failed", None, f"DNS resolution failed for {test_url}"
+                elif cause is not None:
+                    return "Connection Refused", None, f"Connection refused to {test_url}"
+                else:
+                    return "Connection Failed", None, f"Cannot connect to {test_url}: {str(e)}"
+            except Exception:
+                continue  # Try next path
+        
+        # If no health endpoints work, try base URL
+        try:
+            response = await client.get(url)
+            response_time = round((time.time() - start_time) * 1000, 2)
+            return self.base_url_result(response.status_code, response_time)
+                
+        except httpx.TimeoutException:
+            return "Timeout", self.timeout * 1000, f"Request timeout after {self.timeout}s"
+        except httpx.ConnectError as e:
+            cause = connection_error_cause(e)
+            if isinstance(cause, socket.gaierror):
+                return "DNS Failed", None, f"DNS resolution failed for {url}"
+            elif cause is not None:
+                return "Connection Refused", None, f"Connection refused to {url}"
+            else:
+                return "Connection Failed", None, f"Cannot connect to {url}: {str(e)}"
+        except Exception as e:
+            return "Request Failed", None, f"HTTP request failed: {str(e)}"
+
+    def discover_app(self, namespace: str, app_name: str) -> AppHealth:
+        """Pod status and ingress for an app, without probing its URL"""
         # Always check pod status
         pod_status, ready_pods, total_pods = self.get_pod_status(namespace, app_name)
         
@@ -277,8 +680,20 @@ class CompleteHealthChecker:
         
         if ingress_info:
             url, ingress_class = ingress_info
-            http_status, response_time, error_details = self.check_health_endpoint(url)
-            
+            if total_pods == 0 and not self.probe_dead:
+                # Nothing can answer, so skip probing it (up to 7 timeouts)
+                return AppHealth(
+                    name=app_name,
+                    namespace=namespace,
+                    pod_status=pod_status,
+                    ready_pods=ready_pods,
+                    total_pods=total_pods,
+                    has_ingress=True,
+                    url=url,
+                    http_status="Skipped (no pods)",
+                    ingress_class=ingress_class,
+                    error_details="No pods behind the ingress, not probed"
+                )
             return AppHealth(
                 name=app_name,
                 namespace=namespace,
@@ -287,10 +702,7 @@ class CompleteHealthChecker:
                 total_pods=total_pods,
                 has_ingress=True,
                 url=url,
-                http_status=http_status,
-                response_time=response_time,
-                ingress_class=ingress_class,
-                error_details=error_details
+                ingress_class=ingress_class
             )
         else:
             # No ingress found, but still report pod status
@@ -305,23 +717,97 @@ class CompleteHealthChecker:
                 error_details="No ingress resource found for this app"
             )
 
-    def check_all_apps(self) -> List[AppHealth]:
-        """Check health of ALL apps (with and without ingress)"""
+    def check_app_health(self, namespace: str, app_name: str) -> AppHealth:
+        """Check complete health for a single app"""
+        result = self.discover_app(namespace, app_name)
+        if result.has_ingress and result.http_status is None:
+            result.http_status, result.response_time, result.error_details = self.check_health_endpoint(result.url)
+        return result
+
+    async def probe_apps(self, apps: List[AppHealth]) -> AsyncIterator[AppHealth]:
+        """Probe the URLs of all apps concurrently, yielding each app as it finishes"""
+        max_connections = self.max_workers * 10
+        if httpx is not None:
+            # Probes to the same ingress host share one HTTP/2 connection; redirects are
+            # followed, as requests and aiohttp do by default
+            session = httpx.AsyncClient(http2=True, verify=False, follow_redirects=True,
+                                        timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+                                        limits=httpx.Limits(max_connections=max_connections))
+            check_endpoint = self.check_health_endpoint_http2
+        else:
+            # One pooled connector: keep-alive connections and cached DNS lookups are
+            # shared by every probe, and limit caps the sockets open at once
+            connector = aiohttp.TCPConnector(limit=max_connections, ttl_dns_cache=DNS_CACHE_TTL, ssl=False)
+            timeout = aiohttp.ClientTimeout(total=self.timeout, sock_connect=self.connect_timeout)
+            session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            check_endpoint = self.check_health_endpoint_async
+        
+        # An app probes its paths one at a time, so holding one of max_connections
+        # slots keeps every request off the pool queue. Otherwise the wait for a
+        # connection would count towards the timeout and the response time.
+        probe_slots = asyncio.Semaphore(max_connections)
+        
+        async with session:
+            async def probe(app: AppHealth) -> AppHealth:
+                async with probe_slots:
+                    app.http_status, app.response_time, app.error_details = \
+                        await check_endpoint(session, app.url)
+                return app
+            
+            for finished in asyncio.as_completed([probe(app) for app in apps]):
+                yield await finished
+
+    def iter_probed_apps(self, apps: List[AppHealth]) -> Iterator[AppHealth]:
+        """Run probe_apps on an event loop of its own, handing results out synchronously"""
+        loop = asyncio.new_event_loop()
+        probed = self.probe_apps(apps)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(probed.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(probed.aclose())
+            loop.close()
+
+    def iter_app_health(self) -> Iterator[AppHealth]:
+        """Check health of ALL apps (with and without ingress), yielding each result
+        as it completes so that no list of every app is held at once"""
         print(f"🔍 Discovering ALL applications in namespaces: {self.namespaces}")
         
         all_deployments = self.get_all_deployments()
         if not all_deployments:
             print("❌ No deployments found")
-            return []
+            return
         
         total_apps = sum(len(apps) for apps in all_deployments.values())
         apps_with_ingress = 0
         
+        self.build_resource_index(list(all_deployments))
+        
         print(f"📊 Found {total_apps} total applications across {len(all_deployments)} namespaces")
         print("🚀 Checking pod health and ingress discovery...")
         print("=" * 120)
         
-        results = []
+        progress = []
+        
+        def write_progress(line: str):
+            progress.append(line)
+            if len(progress) >= PROGRESS_FLUSH_EVERY:
+                write_lines(progress)
+                progress.clear()
+        
+        def report(result: AppHealth) -> AppHealth:
+            nonlocal apps_with_ingress
+            namespace, app = result.namespace, result.name
+            if result.has_ingress:
+                apps_with_ingress += 1
+                status_icon = "🌐" if result.http_status and result.http_status.startswith("UP") else "⚠️"
+                write_progress(f"{status_icon} {namespace}/{app} - Pods: {result.pod_status}, HTTP: {result.http_status}")
+            else:
+                write_progress(f"📦 {namespace}/{app} - Pods: {result.pod_status}, No ingress")
+            return result
         
         # Prepare tasks for parallel execution
         tasks = []
@@ -329,118 +815,134 @@ class CompleteHealthChecker:
             for app in apps:
                 tasks.append((namespace, app))
         
+        # With httpx or aiohttp the threads only do the Kubernetes lookups; the HTTP
+        # probes all run on one event loop instead of holding a thread each
+        probe_async = httpx is not None or aiohttp is not None
+        check = self.discover_app if probe_async else self.check_app_health
+        to_probe = []
+        
         # Execute health checks in parallel
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             future_to_app = {
-                executor.submit(self.check_app_health, namespace, app): (namespace, app) 
+                executor.submit(check, namespace, app): (namespace, app) 
                 for namespace, app in tasks
             }
             
             for future in concurrent.futures.as_completed(future_to_app):
-                namespace, app = future_to_app[future]
+                # Popped so the finished future (and its result) is not kept alive
+                namespace, app = future_to_app.pop(future)
                 try:
                     result = future.result()
-                    results.append(result)
-                    
-                    if result.has_ingress:
-                        apps_with_ingress += 1
-                        status_icon = "🌐" if result.http_status and result.http_status.startswith("UP") else "⚠️"
-                        print(f"{status_icon} {namespace}/{app} - Pods: {result.pod_status}, HTTP: {result.http_status}")
-                    else:
-                        print(f"📦 {namespace}/{app} - Pods: {result.pod_status}, No ingress")
-                        
                 except Exception as e:
-                    print(f"✗ Error checking {namespace}/{app}: {e}")
+                    write_progress(f"✗ Error checking {namespace}/{app}: {e}")
+                    continue
+                if probe_async and result.has_ingress and result.http_status is None:
+                    to_probe.append(result)
+                else:
+                    yield report(result)
+        
+        if to_probe:
+            for result in self.iter_probed_apps(to_probe):
+                yield report(result)
+        if progress:
+            write_lines(progress)
         
         print(f"\n📈 Discovery complete: {apps_with_ingress}/{total_apps} apps have ingress")
-        return results
 
-    def print_results(self, results: List[AppHealth]):
-        """Print comprehensive results"""
-        print("\n" + "=" * 130)
-        print(f"📊 COMPLETE HEALTH CHECK SUMMARY - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 130)
-        
-        if not results:
-            print("❌ No applications found")
-            return
+    def print_results(self, results: Iterable[AppHealth]):
+        """Print comprehensive results, consuming the results in a single pass"""
+        # Rendered into a buffer and written in one go rather than line by line
+        lines = []
+        out = lines.append
+        out("\n" + "=" * 130)
+        out(f"📊 COMPLETE HEALTH CHECK SUMMARY - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        out("=" * 130)
         
-        # Separate apps with and without ingress
-        with_ingress = [r for r in results if r.has_ingress]
-        without_ingress = [r for r in results if not r.has_ingress]
+        # Rows of both tables and the summary counters, built as results arrive
+        ingress_rows = []
+        internal_rows = []
+        healthy_with_ingress = 0
+        healthy_without_ingress = 0
+        ingress_classes = {}
         
-        # Print apps with ingress
-        if with_ingress:
-            print(f"\n🌐 APPS WITH INGRESS ({len(with_ingress)} apps)")
-            print("-" * 130)
-            print(f"{'App':<20} {'Namespace':<12} {'Pods':<8} {'HTTP Status':<15} {'Time(ms)':<10} {'URL':<40} {'Details':<25}")
-            print("-" * 130)
-            
-            for result in with_ingress:
+        for result in results:
+            pods = f"{result.ready_pods}/{result.total_pods}"
+            if result.has_ingress:
+                http_up = bool(result.http_status and result.http_status.startswith("UP"))
                 # Choose emoji
-                if result.pod_status == "Healthy" and result.http_status and result.http_status.startswith("UP"):
+                if result.pod_status == "Healthy" and http_up:
                     emoji = "✅"
-                elif result.pod_status in ["Healthy", "Partial"] or (result.http_status and result.http_status.startswith("UP")):
+                    healthy_with_ingress += 1
+                elif result.pod_status in ["Healthy", "Partial"] or http_up:
                     emoji = "⚠️"
                 else:
                     emoji = "❌"
                 
-                pods = f"{result.ready_pods}/{result.total_pods}"
                 http_status = result.http_status or "N/A"
                 response_time = f"{result.response_time}" if result.response_time else "N/A"
                 url_short = result.url[:37] + "..." if len(result.url) > 40 else result.url
                 details = result.error_details[:22] + "..." if result.error_details and len(result.error_details) > 25 else result.error_details or ""
                 
-                print(f"{emoji} {result.name:<18} {result.namespace:<12} {pods:<8} {http_status:<15} {response_time:<10} {url_short:<40} {details}")
-        
-        # Print apps without ingress
-        if without_ingress:
-            print(f"\n📦 APPS WITHOUT INGRESS ({len(without_ingress)} apps)")
-            print("-" * 80)
-            print(f"{'App':<25} {'Namespace':<15} {'Pod Status':<12} {'Pods':<8} {'Notes':<20}")
-            print("-" * 80)
-            
-            for result in without_ingress:
+                ingress_rows.append(INGRESS_ROW_FORMAT % (emoji, result.name, result.namespace, pods, http_status,
+                                                          response_time, url_short, details))
+                if result.ingress_class and result.ingress_class != "unknown":
+                    ingress_classes[result.ingress_class] = ingress_classes.get(result.ingress_class, 0) + 1
+            else:
                 if result.pod_status == "Healthy":
                     emoji = "✅"
+                    healthy_without_ingress += 1
                 elif result.pod_status in ["Partial", "Starting"]:
                     emoji = "⚠️"
                 else:
                     emoji = "❌"
                 
-                pods = f"{result.ready_pods}/{result.total_pods}"
                 notes = "Internal service only" if result.pod_status == "Healthy" else "Check pod logs"
-                
-                print(f"{emoji} {result.name:<23} {result.namespace:<15} {result.pod_status:<12} {pods:<8} {notes}")
+                internal_rows.append(INTERNAL_ROW_FORMAT % (emoji, result.name, result.namespace,
+                                                            result.pod_status, pods, notes))
+        
+        total_apps = len(ingress_rows) + len(internal_rows)
+        if not total_apps:
+            out("❌ No applications found")
+            write_lines(lines)
+            return
+        
+        # Print apps with ingress
+        if ingress_rows:
+            out(f"\n🌐 APPS WITH INGRESS ({len(ingress_rows)} apps)")
+            out("-" * 130)
+            out(f"{'App':<20} {'Namespace':<12} {'Pods':<8} {'HTTP Status':<15} {'Time(ms)':<10} {'URL':<40} {'Details':<25}")
+            out("-" * 130)
+            lines.extend(ingress_rows)
+        
+        # Print apps without ingress
+        if internal_rows:
+            out(f"\n📦 APPS WITHOUT INGRESS ({len(internal_rows)} apps)")
+            out("-" * 80)
+            out(f"{'App':<25} {'Namespace':<15} {'Pod Status':<12} {'Pods':<8} {'Notes':<20}")
+            out("-" * 80)
+            lines.extend(internal_rows)
         
         # Summary statistics
-        total_apps = len(results)
-        healthy_with_ingress = sum(1 for r in with_ingress if r.pod_status == "Healthy" and r.http_status and r.http_status.startswith("UP"))
-        healthy_without_ingress = sum(1 for r in without_ingress if r.pod_status == "Healthy")
         total_healthy = healthy_with_ingress + healthy_without_ingress
         
-        print("\n" + "=" * 130)
-        print(f"📈 SUMMARY:")
-        print(f"   Total apps: {total_apps}")
-        print(f"   Apps with ingress: {len(with_ingress)} ({healthy_with_ingress} healthy)")
-        print(f"   Apps without ingress: {len(without_ingress)} ({healthy_without_ingress} healthy)")
-        print(f"   Overall health: {total_healthy}/{total_apps} apps healthy")
+        out("\n" + "=" * 130)
+        out(f"📈 SUMMARY:")
+        out(f"   Total apps: {total_apps}")
+        out(f"   Apps with ingress: {len(ingress_rows)} ({healthy_with_ingress} healthy)")
+        out(f"   Apps without ingress: {len(internal_rows)} ({healthy_without_ingress} healthy)")
+        out(f"   Overall health: {total_healthy}/{total_apps} apps healthy")
         
         # Ingress class summary
-        if with_ingress:
-            ingress_classes = {}
-            for r in with_ingress:
-                if r.ingress_class and r.ingress_class != "unknown":
-                    ingress_classes[r.ingress_class] = ingress_classes.get(r.ingress_class, 0) + 1
-            if ingress_classes:
-                print(f"   Ingress classes: {dict(ingress_classes)}")
+        if ingress_classes:
+            out(f"   Ingress classes: {dict(ingress_classes)}")
         
         if total_healthy == total_apps:
-            print("🎉 All applications are healthy!")
+            out("🎉 All applications are healthy!")
         elif total_healthy > 0:
-            print("⚠️  Some applications need attention")
+            out("⚠️  Some applications need attention")
         else:
-            print("🚨 Critical: No applications are fully healthy")
+            out("🚨 Critical: No applications are fully healthy")
+        write_lines(lines)
 
 def main():
     parser = argparse.ArgumentParser(description="Complete Kubernetes Health Checker")
@@ -450,13 +952,16 @@ def main():
     parser.add_argument("-i", "--interval", type=int, default=60, help="Watch interval in seconds")
     parser.add_argument("--timeout", type=int, default=10, help="HTTP request timeout in seconds")
     parser.add_argument("--max-workers", type=int, default=20, help="Max concurrent health checks")
+    parser.add_argument("--probe-dead", action="store_true",
+                       help="Also probe ingress URLs of apps that have no pods")
     
     args = parser.parse_args()
     
     checker = CompleteHealthChecker(
         namespaces=args.namespaces,
         timeout=args.timeout,
-        max_workers=args.max_workers
+        max_workers=args.max_workers,
+        probe_dead=args.probe_dead
     )
     
     if args.watch:
@@ -465,16 +970,14 @@ def main():
         
         try:
             while True:
-                results = checker.check_all_apps()
-                checker.print_results(results)
+                checker.print_results(checker.iter_app_health())
                 print(f"\n⏰ Next check in {args.interval} seconds...")
                 time.sleep(args.interval)
                 os.system('clear' if os.name == 'posix' else 'cls')
         except KeyboardInterrupt:
             print("\n👋 Health monitoring stopped")
     else:
-        results = checker.check_all_apps()
-        checker.print_results(results)
+        checker.print_results(checker.iter_app_health())
 
 if __name__ == "__main__":
     main()
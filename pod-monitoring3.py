@@ -4,29 +4,163 @@ Complete Kubernetes Health Checker
 - Always checks pod health for all deployments
 - Auto-discovers ingress URLs when available
 - Provides detailed connection and HTTP error information
-- Uses urllib3 with brotli encoding for faster requests
+- Probes all endpoints from one asyncio event loop with aiohttp when installed,
+  otherwise uses urllib3 with brotli encoding on worker threads
 """
 
 import os
 import sys
 import time
+import errno
+import socket
+import asyncio
 import urllib3
+import threading
 import argparse
 import concurrent.futures
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
 try:
-    from kubernetes import client, config
+    from kubernetes import client, config, watch
     from kubernetes.client.rest import ApiException
 except ImportError:
     print("❌ Error: kubernetes library not found. Install with: pip install kubernetes")
     sys.exit(1)
 
+try:
+    import aiohttp  # probe all endpoints from one event loop
+except ImportError:
+    aiohttp = None  # fall back to urllib3 on the worker threads
+
+# Pod labels that tie a pod to its app, in the order they are tried
+APP_LABELS = ["app", "app.kubernetes.io/name", "k8s-app"]
+
+# Seconds a watch runs before its resource is listed again to reconcile
+WATCH_RESYNC_SECONDS = 300
+
+# Seconds past --timeout after which an aiohttp request still running is abandoned,
+# so a peer that never finishes its response cannot hold a probe slot forever
+PROBE_DEADLINE_SLACK = 2
+
 # Disable urllib3 warnings for unverified HTTPS requests
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+def join_url(base_url: str, path: str) -> str:
+    """Join a base URL and a path with exactly one slash between them"""
+    if base_url.endswith('/') and path.startswith('/'):
+        return base_url + path[1:]  # Remove leading slash from path
+    elif not base_url.endswith('/') and not path.startswith('/'):
+        return base_url + '/' + path  # Add slash between
+    else:
+        return base_url + path  # One already has proper slash
+
+def connection_error_cause(error: BaseException) -> Optional[OSError]:
+    """The socket error behind a urllib3 connection error, if any.
+    
+    MaxRetryError carries the NewConnectionError as its reason, which is
+    raised from the socket error; the chain is followed by type so the
+    exception text never has to be rendered and searched.
+    """
+    pending = [error]
+    seen = set()
+    while pending:
+        error = pending.pop()
+        if error is None or id(error) in seen:
+            continue
+        seen.add(id(error))
+        if isinstance(error, socket.gaierror) or (isinstance(error, OSError) and error.errno == errno.ECONNREFUSED):
+            return error
+        pending.extend((getattr(error, "reason", None), error.__cause__, error.__context__))
+        pending.extend(arg for arg in error.args if isinstance(arg, BaseException))
+    return None
+
+def is_connect_timeout(error: BaseException) -> bool:
+    """Whether an aiohttp timeout hit while connecting (aiohttp 3.10+ tells them apart)"""
+    connection_timeout_error = getattr(aiohttp, "ConnectionTimeoutError", None)
+    return connection_timeout_error is not None and isinstance(error, connection_timeout_error)
+
+def pod_phase_and_readiness(pod) -> Tuple[str, bool]:
+    """Reduce a pod to its phase and whether its Ready condition is True"""
+    ready = any(condition.type == "Ready" and condition.status == "True"
+                for condition in pod.status.conditions or [])
+    return pod.status.phase, ready
+
+def index_pods_by_app(pods) -> Dict[Tuple[str, str], List[Tuple[str, bool]]]:
+    """Pod phase and readiness under each of the pod's app label values"""
+    pods_by_app = {}
+    for pod in pods:
+        labels = pod.metadata.labels or {}
+        state = None
+        for label in APP_LABELS:
+            if label in labels:
+                state = state or pod_phase_and_readiness(pod)
+                pods_by_app.setdefault((label, labels[label]), []).append(state)
+    return pods_by_app
+
+class WatchCache:
+    """Objects of one resource, kept current by an API watch.
+    
+    Used in watch mode so repeated checks read from memory instead of
+    re-listing. The resource is listed once, then followed with a watch from
+    that list's resourceVersion. Whenever the watch ends or fails (410 Gone
+    once that version has been compacted away, say) the resource is listed
+    again, which also reconciles any missed events.
+    """
+    def __init__(self, list_call, **list_kwargs):
+        self.list_call = list_call
+        self.list_kwargs = list_kwargs
+        self._objects: Optional[Dict[Tuple[str, str], Any]] = None
+        self._lock = threading.Lock()
+    
+    def start(self) -> "WatchCache":
+        threading.Thread(target=self._run, daemon=True).start()
+        return self
+    
+    def objects_by_namespace(self) -> Optional[Dict[str, list]]:
+        """Cached objects grouped by namespace, or None until the first list has completed"""
+        with self._lock:
+            if self._objects is None:
+                return None
+            grouped = {}
+            for (namespace, _), obj in self._objects.items():
+                grouped.setdefault(namespace, []).append(obj)
+            return grouped
+    
+    def _run(self):
+        """List then watch forever, re-listing after every watch window"""
+        while True:
+            try:
+                listing = self.list_call(**self.list_kwargs)
+                objects = {(obj.metadata.namespace, obj.metadata.name): obj for obj in listing.items}
+                with self._lock:
+                    self._objects = objects
+                
+                stream = watch.Watch().stream(
+                    self.list_call,
+                    resource_version=listing.metadata.resource_version,
+                    timeout_seconds=WATCH_RESYNC_SECONDS,
+                    **self.list_kwargs
+                )
+                for event in stream:
+                    if event["type"] not in ("ADDED", "MODIFIED", "DELETED"):
+                        continue
+                    obj = event["object"]
+                    key = (obj.metadata.namespace, obj.metadata.name)
+                    with self._lock:
+                        if event["type"] == "DELETED":
+                            self._objects.pop(key, None)
+                        else:
+                            self._objects[key] = obj
+            except ApiException as e:
+                if e.status != 410:
+                    print(f"⚠️  Watch interrupted, re-listing: {e}")
+                    time.sleep(5)
+            except Exception as e:
+                print(f"⚠️  Watch interrupted, re-listing: {e}")
+                time.sleep(5)
+
 @dataclass
 class AppHealth:
     """Complete health status for an application"""
@@ -50,6 +184,8 @@ class CompleteHealthChecker:
                  debug: bool = False):
         self.namespaces = namespaces or ["default"]
         self.health_paths = ["/health", "/healthz", "/health.html", "/ping", "/api/health", "/status"]
+        # Health path that last answered 200 for each base URL, tried first next time
+        self.path_cache: Dict[str, str] = {}
         self.timeout = timeout
         self.max_workers = max_workers
         self.debug = debug
@@ -63,6 +199,10 @@ class CompleteHealthChecker:
             ssl_show_warn=False
         )
         
+        # One retry policy for every request; Retry is immutable (increment()
+        # returns a new object), so sharing it across threads is safe
+        self.retries = urllib3.Retry(total=1, connect=1, read=1, status=1)
+        
         # Headers with brotli encoding support
         self.headers = {
             'Accept-Encoding': 'br, gzip, deflate',  # Brotli first, then gzip, then deflate
@@ -86,9 +226,63 @@ class CompleteHealthChecker:
         except Exception as e:
             print(f"❌ Failed to initialize Kubernetes client: {e}")
             sys.exit(1)
+        
+        # The Kubernetes client is blocking, so its calls run on these threads
+        # while the event loop waits on them (and, without aiohttp, the probes too)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        
+        # Ingresses and pods listed once per namespace at the start of each check.
+        # A namespace missing here (its list failed) is listed per app instead.
+        self.ingress_index: Dict[str, list] = {}
+        self.pod_index: Dict[str, Dict[Tuple[str, str], List[Tuple[str, bool]]]] = {}
+        
+        # Watch-driven caches of deployments, ingresses and pods, started for
+        # watch mode by start_watch_caches
+        self.watch_caches: Dict[str, List[WatchCache]] = {}
+
+    def start_watch_caches(self):
+        """Follow deployments, ingresses and pods with watches, so that repeated
+        checks read them from memory instead of re-listing them every interval"""
+        if "all" in self.namespaces:
+            self.watch_caches = {
+                "deployments": [WatchCache(self.apps_v1.list_deployment_for_all_namespaces).start()],
+                "ingresses": [WatchCache(self.networking_v1.list_ingress_for_all_namespaces).start()],
+                "pods": [WatchCache(self.v1.list_pod_for_all_namespaces).start()],
+            }
+        else:
+            self.watch_caches = {
+                "deployments": [WatchCache(self.apps_v1.list_namespaced_deployment, namespace=namespace).start()
+                                for namespace in self.namespaces],
+                "ingresses": [WatchCache(self.networking_v1.list_namespaced_ingress, namespace=namespace).start()
+                              for namespace in self.namespaces],
+                "pods": [WatchCache(self.v1.list_namespaced_pod, namespace=namespace).start()
+                         for namespace in self.namespaces],
+            }
+
+    def cached_objects(self, kind: str) -> Optional[Dict[str, list]]:
+        """Watched objects of a kind by namespace, or None when not watched or not yet listed"""
+        caches = self.watch_caches.get(kind)
+        if not caches:
+            return None
+        merged = {}
+        for cache in caches:
+            objects = cache.objects_by_namespace()
+            if objects is None:
+                return None
+            merged.update(objects)
+        return merged
 
     def get_all_deployments(self) -> Dict[str, List[str]]:
         """Get ALL deployments across namespaces"""
+        cached = self.cached_objects("deployments")
+        if cached is not None:
+            if "all" in self.namespaces:
+                target_namespaces = sorted(ns for ns in cached if not ns.startswith('kube-'))
+            else:
+                target_namespaces = self.namespaces
+            # Sorted by name, as a LIST returns them
+            return {ns: sorted(dep.metadata.name for dep in cached[ns]) for ns in target_namespaces if cached.get(ns)}
+        
         all_deployments = {}
         
         for namespace in self.namespaces:
@@ -114,36 +308,32 @@ class CompleteHealthChecker:
     def get_pod_status(self, namespace: str, app_name: str) -> Tuple[str, int, int]:
         """Get detailed pod status for an app"""
         try:
-            label_selectors = [
-                f"app={app_name}",
-                f"app.kubernetes.io/name={app_name}",
-                f"k8s-app={app_name}"
-            ]
-            
-            pods = None
-            for selector in label_selectors:
-                pods = self.v1.list_namespaced_pod(namespace=namespace, label_selector=selector)
-                if pods.items:
+            pods = []
+            namespace_pods = self.pod_index.get(namespace)
+            for label in APP_LABELS:
+                if namespace_pods is not None:
+                    pods = namespace_pods.get((label, app_name), [])
+                else:
+                    pods = [pod_phase_and_readiness(pod) for pod in self.v1.list_namespaced_pod(
+                        namespace=namespace, label_selector=f"{label}={app_name}").items]
+                if pods:
                     break
             
-            if not pods or not pods.items:
+            if not pods:
                 return "No Pods", 0, 0
             
-            total_pods = len(pods.items)
+            total_pods = len(pods)
             ready_pods = 0
             running_pods = 0
             
-            for pod in pods.items:
+            for phase, ready in pods:
                 # Check if pod is running
-                if pod.status.phase == "Running":
+                if phase == "Running":
                     running_pods += 1
                 
                 # Check if pod is ready
-                if pod.status.conditions:
-                    for condition in pod.status.conditions:
-                        if condition.type == "Ready" and condition.status == "True":
-                            ready_pods += 1
-                            break
+                if ready:
+                    ready_pods += 1
             
             # Determine overall status
             if ready_pods == total_pods and total_pods > 0:
@@ -161,9 +351,11 @@ class CompleteHealthChecker:
     def find_ingress_for_app(self, namespace: str, app_name: str) -> Optional[Tuple[str, str]]:
         """Find ingress URL for an app. Returns (url, ingress_class) or None"""
         try:
-            ingresses = self.networking_v1.list_namespaced_ingress(namespace=namespace)
+            ingresses = self.ingress_index.get(namespace)
+            if ingresses is None:
+                ingresses = self.networking_v1.list_namespaced_ingress(namespace=namespace).items
             
-            for ingress in ingresses.items:
+            for ingress in ingresses:
                 # Check if this ingress relates to our app
                 if self.ingress_matches_app(ingress, app_name):
                     # Get ingress class
@@ -221,6 +413,49 @@ class CompleteHealthChecker:
         
         return None
 
+    def prefetch_namespace(self, namespace: str) -> Tuple[Optional[list], Optional[dict]]:
+        """List a namespace's ingresses and pods once, for every app in it to be
+        looked up in. Either part is None if its LIST failed."""
+        try:
+            ingresses = self.networking_v1.list_namespaced_ingress(namespace=namespace).items
+        except ApiException:
+            ingresses = None  # reported per app by find_ingress_for_app
+        
+        try:
+            pods_by_app = index_pods_by_app(
+                self.v1.list_namespaced_pod(namespace=namespace).items)
+        except ApiException:
+            pods_by_app = None  # reported per app by get_pod_status
+        
+        return ingresses, pods_by_app
+
+    async def build_namespace_index(self, namespaces: List[str]):
+        """Prefetch every namespace side by side, replacing a LIST per app with one per namespace"""
+        cached_ingresses = self.cached_objects("ingresses")
+        cached_pods = self.cached_objects("pods")
+        if cached_ingresses is not None and cached_pods is not None:
+            # Watch mode: the caches are current, nothing needs listing
+            self.ingress_index = {namespace: cached_ingresses.get(namespace, []) for namespace in namespaces}
+            self.pod_index = {namespace: index_pods_by_app(cached_pods.get(namespace, [])) for namespace in namespaces}
+            return
+        
+        loop = asyncio.get_running_loop()
+        listings = await asyncio.gather(
+            *(loop.run_in_executor(self.executor, self.prefetch_namespace, namespace) for namespace in namespaces),
+            return_exceptions=True
+        )
+        # Failed lists are left out and retried per app
+        self.ingress_index = {}
+        self.pod_index = {}
+        for namespace, listing in zip(namespaces, listings):
+            if isinstance(listing, Exception):
+                continue
+            ingresses, pods_by_app = listing
+            if ingresses is not None:
+                self.ingress_index[namespace] = ingresses
+            if pods_by_app is not None:
+                self.pod_index[namespace] = pods_by_app
+
     def ingress_matches_app(self, ingress, app_name: str) -> bool:
         """Check if an ingress is related to the app"""
         ingress_name = ingress.metadata.name.lower()
@@ -255,16 +490,15 @@ class CompleteHealthChecker:
         if self.debug:
             print(f"   🔍 Testing health endpoints for: {base_url}")
         
-        # Try health-specific paths first
-        for path in self.health_paths:
+        # Try health-specific paths first, starting with the one that answered last time
+        cached_path = self.path_cache.get(base_url)
+        health_paths = self.health_paths
+        if cached_path is not None:
+            health_paths = [cached_path] + [path for path in self.health_paths if path != cached_path]
+        for path in health_paths:
             try:
                 # Properly construct URL
-                if base_url.endswith('/') and path.startswith('/'):
-                    test_url = base_url + path[1:]  # Remove leading slash from path
-                elif not base_url.endswith('/') and not path.startswith('/'):
-                    test_url = base_url + '/' + path  # Add slash between
-                else:
-                    test_url = base_url + path  # One already has proper slash
+                test_url = join_url(base_url, path)
                 
                 if self.debug:
                     print(f"   🧪 Trying: {test_url}")
@@ -275,7 +509,7 @@ class CompleteHealthChecker:
                     test_url, 
                     headers=self.headers,
                     timeout=self.timeout,
-                    retries=urllib3.Retry(total=1, connect=1, read=1, status=1)
+                    retries=self.retries
                 )
                 
                 response_time = round((time.time() - start_time) * 1000, 2)
@@ -287,6 +521,7 @@ class CompleteHealthChecker:
                 if response.status == 200:
                     if self.debug:
                         print(f"   ✅ SUCCESS: {test_url} returned 200")
+                    self.path_cache[base_url] = path
                     return "UP", response_time, f"Health endpoint: {path}"
                 elif response.status == 404:
                     if self.debug:
@@ -310,9 +545,10 @@ class CompleteHealthChecker:
             except urllib3.exceptions.NewConnectionError as e:
                 if self.debug:
                     print(f"   ❌ Connection failed: {test_url} - {str(e)[:100]}")
-                if "Name or service not known" in str(e) or "nodename nor servname provided" in str(e):
+                cause = connection_error_cause(e)
+                if isinstance(cause, socket.gaierror):
                     return "DNS Failed", None, f"DNS resolution failed for {test_url}"
-                elif "Connection refused" in str(e):
+                elif cause is not None:
                     return "Connection Refused", None, f"Connection refused to {test_url}"
                 else:
                     continue  # Try next path
@@ -325,9 +561,10 @@ class CompleteHealthChecker:
             except urllib3.exceptions.MaxRetryError as e:
                 if self.debug:
                     print(f"   🔄 Max retry error: {test_url} - {str(e)[:100]}")
-                if "Name or service not known" in str(e):
+                cause = connection_error_cause(e)
+                if isinstance(cause, socket.gaierror):
                     return "DNS Failed", None, f"DNS resolution failed for {test_url}"
-                elif "Connection refused" in str(e):
+                elif cause is not None:
                     return "Connection Refused", None, f"Connection refused to {test_url}"
                 else:
                     continue  # Try next path
@@ -346,7 +583,7 @@ class CompleteHealthChecker:
                 base_url, 
                 headers=self.headers,
                 timeout=self.timeout,
-                retries=urllib3.Retry(total=1, connect=1, read=1, status=1)
+                retries=self.retries
             )
             
             response_time = round((time.time() - start_time) * 1000, 2)
@@ -393,9 +630,10 @@ class CompleteHealthChecker:
         except urllib3.exceptions.NewConnectionError as e:
             if self.debug:
                 print(f"   ❌ Base URL connection failed: {base_url}")
-            if "Name or service not known" in str(e):
+            cause = connection_error_cause(e)
+            if isinstance(cause, socket.gaierror):
                 return "DNS Failed", None, f"DNS resolution failed for {base_url}"
-            elif "Connection refused" in str(e):
+            elif cause is not None:
                 return "Connection Refused", None, f"Connection refused to {base_url}"
             else:
                 return "Connection Failed", None, f"Cannot connect to {base_url}: {str(e)}"
@@ -408,9 +646,10 @@ class CompleteHealthChecker:
         except urllib3.exceptions.MaxRetryError as e:
             if self.debug:
                 print(f"   🔄 Base URL max retry error: {base_url}")
-            if "Name or service not known" in str(e):
+            cause = connection_error_cause(e)
+            if isinstance(cause, socket.gaierror):
                 return "DNS Failed", None, f"DNS resolution failed for {base_url}"
-            elif "Connection refused" in str(e):
+            elif cause is not None:
                 return "Connection Refused", None, f"Connection refused to {base_url}"
             else:
                 return "Connection Failed", None, f"Cannot connect to {base_url}: {str(e)}"
@@ -420,17 +659,192 @@ class CompleteHealthChecker:
                 print(f"   ❓ Base URL other error: {base_url}")
             return "Request Failed", None, f"HTTP request failed: {str(e)}"
 
-    def check_app_health(self, namespace: str, app_name: str) -> AppHealth:
+    async def probe_path_async(self, session, base_url: str, path: str,
+                               start_time: float) -> Optional[Tuple[str, Optional[float], Optional[str]]]:
+        """Probe one health path; None means it gave no verdict and the next path should be tried"""
+        test_url = join_url(base_url, path)
+        try:
+            if self.debug:
+                print(f"   🧪 Trying: {test_url}")
+            
+            async with session.get(test_url) as response:
+                status = response.status
+                # Read the body so the connection goes back to the pool
+                body = await response.read()
+            
+            response_time = round((time.time() - start_time) * 1000, 2)
+            
+            if self.debug:
+                encoding = response.headers.get('Content-Encoding', 'none')
+                print(f"   📊 Response: {status}, Encoding: {encoding}, Size: {len(body)} bytes")
+            
+            if status == 200:
+                if self.debug:
+                    print(f"   ✅ SUCCESS: {test_url} returned 200")
+                return "UP", response_time, f"Health endpoint: {path}"
+            elif status == 404:
+                if self.debug:
+                    print(f"   ❌ 404: {test_url}")
+                return None  # Try next path
+            else:
+                if self.debug:
+                    print(f"   ⚠️  {status}: {test_url}")
+                return f"HTTP {status}", response_time, f"Health endpoint {path} returned {status}"
+                
+        except asyncio.TimeoutError as e:
+            if is_connect_timeout(e):
+                if self.debug:
+                    print(f"   ⏰ Connect timeout: {test_url}")
+                return "Connect Timeout", self.timeout * 1000, f"Connection timeout after {self.timeout}s"
+            if self.debug:
+                print(f"   ⏰ Read timeout: {test_url}")
+            return "Read Timeout", self.timeout * 1000, f"Read timeout after {self.timeout}s"
+            
+        except aiohttp.ClientSSLError as e:
+            if self.debug:
+                print(f"   🔒 SSL Error: {test_url} - {str(e)[:100]}")
+            return "SSL Error", None, f"SSL certificate error: {str(e)}"
+            
+        except aiohttp.ClientConnectorError as e:
+            if self.debug:
+                print(f"   ❌ Connection failed: {test_url} - {str(e)[:100]}")
+            if isinstance(e.os_error, socket.gaierror):
+                return "DNS Failed", None, f"DNS resolution failed for {test_url}"
+            elif isinstance(e.os_error, ConnectionRefusedError):
+                return "Connection Refused", None, f"Connection refused to {test_url}"
+            else:
+                return None  # Try next path
+                
+        except Exception as e:
+            if self.debug:
+                print(f"   ❓ Other error: {test_url} - {str(e)[:100]}")
+            return None  # Try next path
+
+    async def check_health_endpoint_async(self, session, base_url: str) -> Tuple[str, Optional[float], Optional[str]]:
+        """check_health_endpoint on an aiohttp session, with the same results"""
+        start_time = time.time()
+        
+        if self.debug:
+            print(f"   🔍 Testing health endpoints for: {base_url}")
+        
+        # Try health-specific paths first: the one that answered last time on its
+        # own, then the rest all at once. The verdict still goes to the first path
+        # in order that gives one, as when trying them one after another.
+        cached_path = self.path_cache.get(base_url)
+        health_paths = self.health_paths
+        if cached_path is not None:
+            result = await self.probe_path_async(session, base_url, cached_path, start_time)
+            if result is not None:
+                return result
+            health_paths = [path for path in self.health_paths if path != cached_path]
+        
+        probes = [asyncio.ensure_future(self.probe_path_async(session, base_url, path, start_time))
+                  for path in health_paths]
+        try:
+            for path, probe in zip(health_paths, probes):
+                result = await probe
+                if result is not None:
+                    if result[0] == "UP":
+                        self.path_cache[base_url] = path
+                    return result
+        finally:
+            for probe in probes:
+                probe.cancel()
+        
+        # If no health endpoints work, try base URL
+        if self.debug:
+            print(f"   🧪 Trying base URL: {base_url}")
+        try:
+            async with session.get(base_url) as response:
+                status = response.status
+                body = await response.read()
+            
+            response_time = round((time.time() - start_time) * 1000, 2)
+            
+            if self.debug:
+                encoding = response.headers.get('Content-Encoding', 'none')
+                print(f"   📊 Base URL response: {status}, Encoding: {encoding}, Size: {len(body)} bytes")
+            
+            if status == 200:
+                if self.debug:
+                    print(f"   ✅ Base URL works: {base_url}")
+                return "UP (Base)", response_time, "No health endpoint, but base URL works"
+            elif status == 404:
+                if self.debug:
+                    print(f"   ❌ Base URL 404: {base_url}")
+                return "HTTP 404", response_time, "Base URL returns 404 Not Found"
+            elif status == 503:
+                if self.debug:
+                    print(f"   ⚠️  Base URL 503: {base_url}")
+                return "HTTP 503", response_time, "Service Unavailable - app may be down"
+            elif status == 502:
+                if self.debug:
+                    print(f"   ⚠️  Base URL 502: {base_url}")
+                return "HTTP 502", response_time, "Bad Gateway - upstream service issue"
+            elif status == 500:
+                if self.debug:
+                    print(f"   ⚠️  Base URL 500: {base_url}")
+                return "HTTP 500", response_time, "Internal Server Error"
+            else:
+                if self.debug:
+                    print(f"   ⚠️  Base URL {status}: {base_url}")
+                return f"HTTP {status}", response_time, f"Base URL returned {status}"
+                
+        except asyncio.TimeoutError as e:
+            if is_connect_timeout(e):
+                if self.debug:
+                    print(f"   ⏰ Base URL connect timeout: {base_url}")
+                return "Connect Timeout", self.timeout * 1000, f"Connection timeout after {self.timeout}s"
+            if self.debug:
+                print(f"   ⏰ Base URL read timeout: {base_url}")
+            return "Read Timeout", self.timeout * 1000, f"Read timeout after {self.timeout}s"
+            
+        except aiohttp.ClientSSLError as e:
+            if self.debug:
+                print(f"   🔒 Base URL SSL error: {base_url}")
+            return "SSL Error", None, f"SSL certificate error: {str(e)}"
+            
+        except aiohttp.ClientConnectorError as e:
+            if self.debug:
+                print(f"   ❌ Base URL connection failed: {base_url}")
+            if isinstance(e.os_error, socket.gaierror):
+                return "DNS Failed", None, f"DNS resolution failed for {base_url}"
+            elif isinstance(e.os_error, ConnectionRefusedError):
+                return "Connection Refused", None, f"Connection refused to {base_url}"
+            else:
+                return "Connection Failed", None, f"Cannot connect to {base_url}: {str(e)}"
+                
+        except Exception as e:
+            if self.debug:
+                print(f"   ❓ Base URL other error: {base_url}")
+            return "Request Failed", None, f"HTTP request failed: {str(e)}"
+
+    async def probe_url(self, session, url: str) -> Tuple[str, Optional[float], Optional[str]]:
+        """Probe url holding one of the max_workers probe slots, so the ingress
+        controllers and DNS see a steady stream of requests rather than a burst.
+        
+        Each aiohttp request has its own deadline (see check_all_apps). The
+        urllib3 fallback keeps the slot until its thread returns, since a
+        thread cannot be cancelled and the slot would otherwise be reused early.
+        """
+        async with self.probe_slots:
+            if session is not None:
+                return await self.check_health_endpoint_async(session, url)
+            return await asyncio.get_running_loop().run_in_executor(self.executor, self.check_health_endpoint, url)
+
+    async def check_app_health(self, session, namespace: str, app_name: str) -> AppHealth:
         """Check complete health for a single app"""
-        # Always check pod status
-        pod_status, ready_pods, total_pods = self.get_pod_status(namespace, app_name)
+        loop = asyncio.get_running_loop()
         
-        # Try to find ingress
-        ingress_info = self.find_ingress_for_app(namespace, app_name)
+        # Always check pod status; the ingress lookup runs alongside it
+        (pod_status, ready_pods, total_pods), ingress_info = await asyncio.gather(
+            loop.run_in_executor(self.executor, self.get_pod_status, namespace, app_name),
+            loop.run_in_executor(self.executor, self.find_ingress_for_app, namespace, app_name)
+        )
         
         if ingress_info:
             url, ingress_class = ingress_info
-            http_status, response_time, error_details = self.check_health_endpoint(url)
+            http_status, response_time, error_details = await self.probe_url(session, url)
             
             return AppHealth(
                 name=app_name,
@@ -458,11 +872,12 @@ class CompleteHealthChecker:
                 error_details="No ingress resource found for this app"
             )
 
-    def check_all_apps(self) -> List[AppHealth]:
+    async def check_all_apps(self) -> List[AppHealth]:
         """Check health of ALL apps (with and without ingress)"""
         print(f"🔍 Discovering ALL applications in namespaces: {self.namespaces}")
         
-        all_deployments = self.get_all_deployments()
+        loop = asyncio.get_running_loop()
+        all_deployments = await loop.run_in_executor(self.executor, self.get_all_deployments)
         if not all_deployments:
             print("❌ No deployments found")
             return []
@@ -470,43 +885,54 @@ class CompleteHealthChecker:
         total_apps = sum(len(apps) for apps in all_deployments.values())
         apps_with_ingress = 0
         
+        await self.build_namespace_index(list(all_deployments))
+        
         print(f"📊 Found {total_apps} total applications across {len(all_deployments)} namespaces")
         print("🚀 Checking pod health and ingress discovery...")
         print("=" * 120)
         
-        results = []
-        
         # Prepare tasks for parallel execution
         tasks = []
         for namespace, apps in all_deployments.items():
             for app in apps:
                 tasks.append((namespace, app))
         
-        # Execute health checks in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_app = {
-                executor.submit(self.check_app_health, namespace, app): (namespace, app) 
-                for namespace, app in tasks
-            }
+        async def check(session, namespace: str, app: str) -> Optional[AppHealth]:
+            nonlocal apps_with_ingress
+            try:
+                result = await self.check_app_health(session, namespace, app)
+            except Exception as e:
+                print(f"✗ Error checking {namespace}/{app}: {e}")
+                return None
             
-            for future in concurrent.futures.as_completed(future_to_app):
-                namespace, app = future_to_app[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    if result.has_ingress:
-                        apps_with_ingress += 1
-                        status_icon = "🌐" if result.http_status and result.http_status.startswith("UP") else "⚠️"
-                        print(f"{status_icon} {namespace}/{app} - Pods: {result.pod_status}, HTTP: {result.http_status}")
-                    else:
-                        print(f"📦 {namespace}/{app} - Pods: {result.pod_status}, No ingress")
-                        
-                except Exception as e:
-                    print(f"✗ Error checking {namespace}/{app}: {e}")
+            if result.has_ingress:
+                apps_with_ingress += 1
+                status_icon = "🌐" if result.http_status and result.http_status.startswith("UP") else "⚠️"
+                print(f"{status_icon} {namespace}/{app} - Pods: {result.pod_status}, HTTP: {result.http_status}")
+            else:
+                print(f"📦 {namespace}/{app} - Pods: {result.pod_status}, No ingress")
+            return result
+        
+        # All apps are checked at once: the Kubernetes calls queue for the
+        # executor threads and the HTTP probes share one event loop, at most
+        # max_workers of them in flight. Created here, inside the running loop.
+        self.probe_slots = asyncio.Semaphore(self.max_workers)
+        if aiohttp is not None:
+            # One pooled connector; timeouts apply per connect and per read, as with urllib3,
+            # and each request is abandoned PROBE_DEADLINE_SLACK seconds after that
+            connector = aiohttp.TCPConnector(limit=self.max_workers * 10, ssl=False)
+            timeout = aiohttp.ClientTimeout(total=self.timeout + PROBE_DEADLINE_SLACK,
+                                            sock_connect=self.timeout, sock_read=self.timeout)
+            # Bodies are only read to free the connection, so they are left compressed: a
+            # br body would otherwise fail to decode without the optional Brotli package
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.headers,
+                                             auto_decompress=False) as session:
+                results = await asyncio.gather(*(check(session, namespace, app) for namespace, app in tasks))
+        else:
+            results = await asyncio.gather(*(check(None, namespace, app) for namespace, app in tasks))
         
         print(f"\n📈 Discovery complete: {apps_with_ingress}/{total_apps} apps have ingress")
-        return results
+        return [result for result in results if result is not None]
 
     def print_results(self, results: List[AppHealth]):
         """Print comprehensive results"""
@@ -596,9 +1022,11 @@ class CompleteHealthChecker:
             print("🚨 Critical: No applications are fully healthy")
 
     def cleanup(self):
-        """Clean up urllib3 connection pools"""
+        """Clean up urllib3 connection pools and the worker threads"""
         if hasattr(self, 'http'):
             self.http.clear()
+        if hasattr(self, 'executor'):
+            self.executor.shutdown(wait=False)
 
 def main():
     parser = argparse.ArgumentParser(description="Complete Kubernetes Health Checker with urllib3 + Brotli")
@@ -622,10 +1050,11 @@ def main():
     if args.watch:
         print(f"👀 Starting continuous health monitoring (interval: {args.interval}s)")
         print("Press Ctrl+C to stop")
+        checker.start_watch_caches()
         
         try:
             while True:
-                results = checker.check_all_apps()
+                results = asyncio.run(checker.check_all_apps())
                 checker.print_results(results)
                 print(f"\n⏰ Next check in {args.interval} seconds...")
                 time.sleep(args.interval)
@@ -636,7 +1065,7 @@ def main():
             checker.cleanup()
     else:
         try:
-            results = checker.check_all_apps()
+            results = asyncio.run(checker.check_all_apps())
             checker.print_results(results)
         finally:
             checker.cleanup()
@@ -0,0 +1,125 @@
+import importlib.util
+import os
+import shutil
+import ssl
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "monitor-aug-14.py")
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("monitor_aug_14", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class RedirectingHandler(BaseHTTPRequestHandler):
+    """/health redirects to /health/, which answers healthy"""
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.send_response(301)
+            self.send_header("Location", "/health/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b'{"status": "UP"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def redirecting_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RedirectingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    module = load_module()
+    return module, module.HealthCheckMonitor({'log_file': str(tmp_path / 'health_monitor.log'), 'timeout': 5})
+
+
+def test_requests_path_follows_redirects(redirecting_server, monitor):
+    _, health_monitor = monitor
+    endpoint = f"{redirecting_server}/health"
+
+    assert health_monitor.check_endpoints_concurrent([endpoint])[0][1] == "UP"
+
+
+def test_http2_path_follows_redirects(redirecting_server, monitor):
+    module, health_monitor = monitor
+    if not module.HTTP2_AVAILABLE:
+        pytest.skip("httpx with h2 is not installed")
+    endpoint = f"{redirecting_server}/health"
+
+    assert health_monitor.check_endpoints_http2([endpoint])[0][1] == "UP"
+
+
+class CountingSSLContext(ssl.SSLContext):
+    """SSLContext that counts how often a CA bundle is loaded into it"""
+
+    loads = 0
+
+    def load_verify_locations(self, *args, **kwargs):
+        type(self).loads += 1
+        return super().load_verify_locations(*args, **kwargs)
+
+
+class HealthyHandler(RedirectingHandler):
+    def do_GET(self):
+        self.path = "/health/"
+        super().do_GET()
+
+
+@pytest.fixture
+def tls_server(tmp_path):
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is not installed")
+    cert, key = tmp_path / "cert.pem", tmp_path / "key.pem"
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                    "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+                    "-keyout", str(key), "-out", str(cert)], check=True, capture_output=True)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), HealthyHandler)
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(str(cert), str(key))
+    server.socket = server_context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"https://localhost:{server.server_address[1]}", str(cert)
+    server.shutdown()
+    server.server_close()
+
+
+def test_pinned_context_does_not_reload_ca_bundle_per_connection(tls_server, monitor):
+    _, health_monitor = monitor
+    url, cert = tls_server
+    context = CountingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.load_verify_locations(cert)
+    health_monitor.ssl_context = context
+    health_monitor.session = health_monitor.create_session()
+    CountingSSLContext.loads = 0
+
+    # Connection: close makes every request open a new TLS connection
+    for _ in range(3):
+        response = health_monitor.session.get(url, headers={"Connection": "close"}, timeout=5)
+        assert response.status_code == 200
+
+    assert CountingSSLContext.loads == 0
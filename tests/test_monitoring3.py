@@ -0,0 +1,40 @@
+import os
+import sys
+
+import pytest
+
+for module in ("yaml", "requests", "tabulate"):
+    pytest.importorskip(module)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import monitoring3  # noqa: E402
+
+
+def categories(analysis):
+    return {issue['category']: issue['matches'] for issue in analysis['service_issues']}
+
+
+@pytest.mark.parametrize("line, expected, severity", [
+    ("network error: container OOMKilled, request timeout",
+     {'MEMORY': 1, 'SERVICE_CONNECTIVITY': 1}, 'high'),
+    ("error: redis connection refused",
+     {'SERVICE_CONNECTIVITY': 1, 'DATABASE_CONNECTION': 1}, 'high'),
+    ("error: database connection lost; Out of memory; retrying connection",
+     {'MEMORY': 1, 'DATABASE_CONNECTION': 1}, 'high'),
+])
+def test_overlapping_keywords_count_towards_every_category(line, expected, severity):
+    engine = monitoring3.ServiceDiagnosticEngine()
+    analysis = engine._analyze_service_log_content([line], "default", "api-5d8f7c9b6-x2k4q")
+
+    assert categories(analysis) == expected
+    assert analysis['severity'] == severity
+
+
+def test_matches_are_counted_per_category_across_chunks():
+    engine = monitoring3.ServiceDiagnosticEngine()
+    chunks = ["ERROR connection refused\nINFO started\n", "WARN dial tcp 10.0.0.1:5432: connect: refused\n"]
+    analysis = engine._analyze_service_log_content(chunks, "default", "api-5d8f7c9b6-x2k4q")
+
+    assert categories(analysis) == {'SERVICE_CONNECTIVITY': 2}
+    assert analysis['service_health_score'] == 80